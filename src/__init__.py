@@ -3,19 +3,35 @@ Generalized Stirling Numbers package.
 
 This package provides implementations of generalized Stirling numbers and related
 combinatorial sequences across different programming languages.
+
+Submodules and the names below are loaded on first access (PEP 562), so
+``from src import GeneralizedStirling`` only imports NumPy; scipy, matplotlib
+and scikit-learn are imported by the submodules that need them when those
+are first used.
 """
 
-from src.generalized_stirling import (
-    GeneralizedStirling,
-    stirling_first_kind,
-    stirling_second_kind,
-    lah_number
-)
-from .stirling_core import StirlingComputation, BellPolynomials, ParameterEstimation, StirlingTransform
-from .stirling_applications import StirlingPartitioning, InverseFunctionEstimation, ClusteringReport
+import importlib
+from typing import Any, List
 
 __version__ = "0.1.0"
 
+# Public name -> submodule defining it
+_LAZY_ATTRIBUTES = {
+    'GeneralizedStirling': 'generalized_stirling',
+    'stirling_first_kind': 'generalized_stirling',
+    'stirling_second_kind': 'generalized_stirling',
+    'lah_number': 'generalized_stirling',
+    'StirlingComputation': 'stirling_core',
+    'BellPolynomials': 'stirling_core',
+    'ParameterEstimation': 'stirling_core',
+    'StirlingTransform': 'stirling_core',
+    'StirlingPartitioning': 'stirling_applications',
+    'InverseFunctionEstimation': 'stirling_applications',
+    'ClusteringReport': 'stirling_applications',
+}
+
+_SUBMODULES = {'generalized_stirling', 'hsu_shiue_stirling', 'stirling_core', 'stirling_applications'}
+
 __all__ = [
     'StirlingComputation',
     'BellPolynomials',
@@ -25,3 +41,20 @@ __all__ = [
     'InverseFunctionEstimation',
     'ClusteringReport'
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a submodule or public name on first access and cache it in the package."""
+    if name in _SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | _SUBMODULES)
@@ -48,38 +48,211 @@ Examples:
         60.0
 """
 
+import importlib.util
+import inspect
+import itertools
 import math
-from functools import lru_cache, wraps
+import operator
+from functools import wraps
 import numpy as np
 import warnings
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import time
 import os
-import pickle
+import sys
+import tempfile
+from fractions import Fraction
 from typing import Dict, List, Tuple, Union, Optional, Callable, Iterator, Any, Set, DefaultDict, TypeVar
 
-# Try to import scipy for enhanced numerical stability
-try:
-    import scipy.special
-    HAS_SCIPY = True
-except ImportError:
-    HAS_SCIPY = False
+# scipy is used for enhanced numerical stability when available. It is only
+# looked up here and imported on first use, since importing it takes longer
+# than most computations (see _scipy_special)
+HAS_SCIPY = importlib.util.find_spec('scipy') is not None
+
+# mpmath provides the arbitrary-precision fallback of compute(rtol=...) and
+# is likewise imported on first use
+HAS_MPMATH = importlib.util.find_spec('mpmath') is not None
 
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Logging is configured by the application; the module only emits records
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # Type variable for generic function decorator
 T = TypeVar('T')
 
+
+#---------------------------------------------------------------------------
+# Instance-scoped memory cache
+#---------------------------------------------------------------------------
+
+def _approximate_size(key: Any, value: Any) -> int:
+    """Approximate the memory held by a cache entry in bytes."""
+    size = sys.getsizeof(key)
+    if isinstance(value, np.ndarray):
+        return size + value.nbytes
+    if isinstance(value, tuple):
+        return size + sys.getsizeof(value) + sum(sys.getsizeof(v) for v in value)
+    return size + sys.getsizeof(value)
+
+
+class BoundedCache:
+    """
+    Memory cache with entry and byte limits and a selectable eviction policy.
+    
+    Each GeneralizedStirling instance owns one, so cached values die with the
+    instance and clearing one instance never affects another. Reads count as
+    uses: 'lru' evicts the least recently used entry and 'lfu' the least
+    frequently used one (oldest first among ties), both in O(1).
+    
+    Attributes:
+        max_entries (Optional[int]): Maximum number of entries (None = unbounded)
+        max_bytes (Optional[int]): Approximate memory budget in bytes (None = unbounded)
+        policy (str): Eviction policy, 'lru' or 'lfu'
+        nbytes (int): Approximate bytes currently held
+        evictions (int): Number of entries evicted so far
+    
+    Examples:
+        >>> cache = BoundedCache(max_entries=2)
+        >>> cache['a'], cache['b'] = 1.0, 2.0
+        >>> cache['a']
+        1.0
+        >>> cache['c'] = 3.0  # Evicts 'b', the least recently used
+        >>> 'b' in cache, cache.evictions
+        (False, 1)
+    """
+    
+    POLICIES = ('lru', 'lfu')
+    
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None,
+                 policy: str = 'lru') -> None:
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_entries: Maximum number of entries (None = unbounded)
+            max_bytes: Approximate memory budget in bytes (None = unbounded)
+            policy: Eviction policy, 'lru' or 'lfu'
+            
+        Raises:
+            ValueError: If the policy is unknown or a limit is negative
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown cache policy: {policy}. Valid policies are: {self.POLICIES}")
+        if (max_entries is not None and max_entries < 0) or (max_bytes is not None and max_bytes < 0):
+            raise ValueError(f"Cache limits must be non-negative, got max_entries={max_entries}, max_bytes={max_bytes}")
+        
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.nbytes = 0
+        self.evictions = 0
+        
+        # key -> (value, size); ordered from least to most recently used
+        self._data: 'OrderedDict[Any, Tuple[Any, int]]' = OrderedDict()
+        # LFU bookkeeping: key -> use count, and count -> keys in insertion order
+        self._counts: Dict[Any, int] = {}
+        self._buckets: DefaultDict[int, 'OrderedDict[Any, None]'] = defaultdict(OrderedDict)
+        self._min_count = 0
+    
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __getitem__(self, key: Any) -> Any:
+        value, _ = self._data[key]
+        self._touch(key)
+        return value
+    
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if key in self._data:
+            self._remove(key)
+        size = _approximate_size(key, value)
+        if (self.max_entries == 0 or
+                (self.max_bytes is not None and size > self.max_bytes)):
+            return  # Never fits, do not flush the cache for it
+        
+        # Make room first so a new entry is never its own victim
+        while self._data and ((self.max_entries is not None and len(self._data) >= self.max_entries) or
+                              (self.max_bytes is not None and self.nbytes + size > self.max_bytes)):
+            self._remove(self._victim())
+            self.evictions += 1
+        
+        self._data[key] = (value, size)
+        self.nbytes += size
+        if self.policy == 'lfu':
+            self._counts[key] = 1
+            self._buckets[1][key] = None
+            self._min_count = 1
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for key, or default if it is absent."""
+        return self[key] if key in self._data else default
+    
+    def resize(self, max_bytes: Optional[int]) -> None:
+        """Change the byte budget, evicting entries until they fit."""
+        self.max_bytes = None if max_bytes is None else max(max_bytes, 0)
+        while self._data and self.max_bytes is not None and self.nbytes > self.max_bytes:
+            self._remove(self._victim())
+            self.evictions += 1
+    
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self._data.clear()
+        self._counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
+        self.nbytes = 0
+        self.evictions = 0
+    
+    def _touch(self, key: Any) -> None:
+        """Record a use of key."""
+        if self.policy == 'lru':
+            self._data.move_to_end(key)
+            return
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets[count + 1][key] = None
+    
+    def _victim(self) -> Any:
+        """Return the key to evict next."""
+        if self.policy == 'lru':
+            return next(iter(self._data))
+        return next(iter(self._buckets[self._min_count]))
+    
+    def _remove(self, key: Any) -> None:
+        """Drop key and its bookkeeping."""
+        _, size = self._data.pop(key)
+        self.nbytes -= size
+        if self.policy == 'lfu':
+            count = self._counts.pop(key)
+            bucket = self._buckets[count]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[count]
+                if self._min_count == count:
+                    self._min_count = min(self._buckets) if self._buckets else 0
+
+
 def disk_cache_decorator(method: Callable[..., T]) -> Callable[..., T]:
     """
     Decorator to handle disk caching for methods in GeneralizedStirling.
     
-    This decorator checks the disk cache before computation and saves results
-    to the disk cache after computation.
+    This decorator checks the instance memory cache before computation. For
+    triangular_recurrence it then checks the memory-mapped TriangleStore (if
+    disk caching is enabled), whose file holds that recurrence's values; on
+    a disk miss the stored triangle is extended to cover the requested row,
+    so a single file per (α, β) replaces one pickle file per value. Other
+    methods always compute what they name.
     
     Args:
         method: The method to wrap with disk caching
@@ -87,39 +260,48 @@ def disk_cache_decorator(method: Callable[..., T]) -> Callable[..., T]:
     Returns:
         Wrapped method with disk caching
     """
+    method_name = method.__name__
+    # single_list_case takes k=1 implicitly, so fill in the declared default
+    k_default = inspect.signature(method).parameters['k'].default
+    uses_store = method_name == 'triangular_recurrence'
+    
     @wraps(method)
     def wrapper(self, *args, **kwargs) -> T:
-        # Only use if disk cache is enabled
-        if not self.use_disk_cache:
-            return method(self, *args, **kwargs)
-            
         # Extract cache key components from the method name and arguments
-        method_name = method.__name__
-        n, k = args[0], args[1]
+        n = args[0] if args else kwargs['n']
+        k = args[1] if len(args) > 1 else kwargs.get('k', k_default)
         cache_key = (method_name, n, k)
         
-        # Check memory cache first (fastest)
+        # Check the instance memory cache first (fastest)
         if cache_key in self._memory_cache:
             self.cache_hits[method_name] += 1
             return self._memory_cache[cache_key]
             
-        # Check disk cache
-        disk_key = self._get_disk_cache_key(method_name, n, k)
-        cached_value = self._load_from_disk_cache(disk_key)
-        if cached_value is not None:
-            self.cache_hits[method_name] += 1
-            self._memory_cache[cache_key] = cached_value
-            return cached_value
+        # Check the memory-mapped triangle of recurrence values on disk
+        store = self._triangle_store if self.use_disk_cache and uses_store else None
+        if store is not None and store.covers(n):
+            result = store.value(n, k)
+            if math.isfinite(result):
+                self.cache_hits[method_name] += 1
+                self._memory_cache[cache_key] = result
+                return result
                 
         # Cache miss - compute the value
         self.cache_misses[method_name] += 1
         start_time = time.time()
         
-        result = method(self, *args, **kwargs)
+        # Extending the stored triangle makes later lookups of any cell O(1) reads
+        result = None
+        if store is not None and not store.covers(n):
+            try:
+                result = store.value(n, k)
+            except OSError as e:
+                logger.warning(f"Failed to extend disk triangle store: {e}")
+        if result is None or not math.isfinite(result):
+            result = method(self, *args, **kwargs)
         
         # Update caches and timing
         self._memory_cache[cache_key] = result
-        self._save_to_disk_cache(disk_key, result)
         self.compute_time[method_name] += time.time() - start_time
         
         return result
@@ -127,121 +309,1148 @@ def disk_cache_decorator(method: Callable[..., T]) -> Callable[..., T]:
     return wrapper
 
 
-class GeneralizedStirling:
+#---------------------------------------------------------------------------
+# Row-vector triangle engine
+#---------------------------------------------------------------------------
+
+def _advance_row(prev: np.ndarray, n: int, alpha: Union[float, np.ndarray], beta: Union[float, np.ndarray],
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
     """
-    Implementation of generalized Stirling numbers with parameters α and β.
-    
-    These numbers have a combinatorial interpretation as the total weight
-    of distributing n elements into k ordered non-empty lists, where:
-    1. The head of each list has weight β
-    2. Other elements in lists have weight α
-    3. The first element placed in each list has weight 1
+    Build row n of the triangle from row n-1 with the triangular recurrence.
     
-    The generalized Stirling numbers include several classical number sequences
-    as special cases:
-    - Stirling numbers of the first kind: L{n,k}^{1,0}
-    - Stirling numbers of the second kind: L{n,k}^{0,1}
-    - Lah numbers: L{n,k}^{1,1}
+    L{n,k} = L{n-1,k-1} + (α(n-1) + βk) * L{n-1,k}, applied to all k at once.
+    Rows are fixed-width arrays indexed by k along the last axis; entries with
+    k > n stay zero. Leading axes are batch axes: alpha and beta may be arrays
+    of shape (P, 1) to advance P parameter pairs together.
     
-    Attributes:
-        alpha (float): Weight parameter for non-head elements
-        beta (float): Weight parameter for head elements
-        cache_size (int): Maximum size for LRU cache
-        use_disk_cache (bool): Whether to use disk-based caching for large computations
-        cache_dir (str): Directory for disk cache
-        _memory_cache (Dict): In-memory cache for quick lookups
-        _precomputed (Dict): Cache for precomputed values
-        compute_time (DefaultDict): Time spent in each computation method
-        cache_hits (DefaultDict): Number of cache hits for each method
-        cache_misses (DefaultDict): Number of cache misses for each method
+    Args:
+        prev: Row n-1 as a float array of shape (..., width)
+        n: Index of the row to build (n >= 1)
+        alpha: Weight parameter for non-head elements
+        beta: Weight parameter for head elements
+        out: Optional array to write row n into (must not alias prev)
+        
+    Returns:
+        Row n as a float array of the same shape as prev
+    """
+    if out is None:
+        out = np.empty_like(prev)
+    top = min(n, prev.shape[-1] - 1)
+    weights = alpha * (n - 1) + beta * np.arange(top + 1, dtype=float)
+    out[..., :top + 1] = weights * prev[..., :top + 1]
+    out[..., 1:top + 1] += prev[..., :top]
+    out[..., top + 1:] = 0.0
+    return out
+
+
+def _triangle_array(alpha: float, beta: float, n_max: int, k_max: int) -> np.ndarray:
     """
+    Fill the dense triangle L{n,k} for 0 <= n <= n_max, 0 <= k <= k_max.
     
-    def __init__(self, alpha: float = 1.0, beta: float = 1.0, 
-                 cache_size: int = 10000, use_disk_cache: bool = False, 
-                 cache_dir: Optional[str] = None) -> None:
-        """
-        Initialize with parameters α and β.
+    Args:
+        alpha: Weight parameter for non-head elements
+        beta: Weight parameter for head elements
+        n_max: Maximum row number
+        k_max: Maximum column number
         
-        Args:
-            alpha: Weight parameter for non-head elements
-            beta: Weight parameter for head elements
-            cache_size: Maximum size for LRU cache
-            use_disk_cache: Whether to use disk-based caching for large computations
-            cache_dir: Directory for disk cache (if None, uses temporary directory)
-            
-        Raises:
-            ValueError: If alpha or beta are not valid floating point numbers
-        """
-        # Validate input parameters
-        if not isinstance(alpha, (int, float)) or math.isnan(alpha) or math.isinf(alpha):
-            raise ValueError(f"alpha must be a valid number, got {alpha}")
-        if not isinstance(beta, (int, float)) or math.isnan(beta) or math.isinf(beta):
-            raise ValueError(f"beta must be a valid number, got {beta}")
-            
-        self.alpha = float(alpha)
-        self.beta = float(beta)
-        self.cache_size = cache_size
-        self.use_disk_cache = use_disk_cache
+    Returns:
+        Array of shape (n_max+1, k_max+1) with table[n, k] = L{n,k}^{α,β}
+    """
+    table = np.zeros((n_max + 1, k_max + 1))
+    table[0, 0] = 1.0
+    for n in range(1, n_max + 1):
+        _advance_row(table[n - 1], n, alpha, beta, out=table[n])
+    return table
+
+
+def _iter_rows(alpha: float, beta: float, n_max: int, k_max: int) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Yield (n, row) for n = 0..n_max while holding only two rows in memory.
+    
+    The yielded array is reused for later rows, so callers that keep it must copy it.
+    """
+    current = np.zeros(k_max + 1)
+    current[0] = 1.0
+    spare = np.empty_like(current)
+    yield 0, current
+    for n in range(1, n_max + 1):
+        current, spare = _advance_row(current, n, alpha, beta, out=spare), current
+        yield n, current
+
+
+def _signed_logaddexp(log_a: np.ndarray, sign_a: np.ndarray,
+                      log_b: np.ndarray, sign_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Add two arrays of signed values stored as (log|x|, sign(x)) pairs.
+    
+    Zeros are represented as (-inf, 0). Exact cancellation yields a zero.
+    
+    Returns:
+        Tuple (log|a+b|, sign(a+b)) of arrays
+    """
+    a_larger = log_a >= log_b
+    hi = np.where(a_larger, log_a, log_b)
+    lo = np.where(a_larger, log_b, log_a)
+    sign_hi = np.where(a_larger, sign_a, sign_b)
+    sign_lo = np.where(a_larger, sign_b, sign_a)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ratio = np.exp(lo - hi)
+        log_sum = hi + np.where(sign_hi * sign_lo >= 0, np.log1p(ratio), np.log1p(-ratio))
+    
+    # Both operands zero (hi = -inf) leaves nan from -inf - -inf
+    log_sum = np.where(np.isneginf(hi), -np.inf, log_sum)
+    sign = np.where(np.isneginf(log_sum), 0.0, sign_hi)
+    return log_sum, sign
+
+
+def _advance_log_row(prev_log: np.ndarray, prev_sign: np.ndarray, n: int,
+                     alpha: float, beta: float,
+                     out_log: np.ndarray, out_sign: np.ndarray) -> None:
+    """
+    Log-domain counterpart of _advance_row working on (log|L|, sign) rows.
+    
+    Each row is a pair of fixed-width arrays indexed by k; the recurrence
+    L{n,k} = L{n-1,k-1} + (α(n-1) + βk) * L{n-1,k} is evaluated with a signed
+    log-sum-exp so the magnitudes never leave the float64 exponent range.
+    """
+    top = min(n, len(prev_log) - 1)
+    weights = alpha * (n - 1) + beta * np.arange(top + 1, dtype=float)
+    with np.errstate(divide='ignore'):
+        log_scaled = np.log(np.abs(weights)) + prev_log[:top + 1]
+    sign_scaled = np.sign(weights) * prev_sign[:top + 1]
+    
+    log_shift = np.full(top + 1, -np.inf)
+    sign_shift = np.zeros(top + 1)
+    log_shift[1:] = prev_log[:top]
+    sign_shift[1:] = prev_sign[:top]
+    
+    out_log[:top + 1], out_sign[:top + 1] = _signed_logaddexp(log_shift, sign_shift,
+                                                              log_scaled, sign_scaled)
+    out_log[top + 1:] = -np.inf
+    out_sign[top + 1:] = 0.0
+
+
+def _log_triangle_arrays(alpha: float, beta: float, n_max: int, k_max: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fill the triangle in the log domain for 0 <= n <= n_max, 0 <= k <= k_max.
+    
+    Returns:
+        Tuple (log_table, sign_table) of arrays with shape (n_max+1, k_max+1)
+        where L{n,k} = sign_table[n, k] * exp(log_table[n, k])
+    """
+    log_table = np.full((n_max + 1, k_max + 1), -np.inf)
+    sign_table = np.zeros((n_max + 1, k_max + 1))
+    log_table[0, 0] = 0.0
+    sign_table[0, 0] = 1.0
+    for n in range(1, n_max + 1):
+        _advance_log_row(log_table[n - 1], sign_table[n - 1], n, alpha, beta,
+                         log_table[n], sign_table[n])
+    return log_table, sign_table
+
+
+def _iter_log_rows(alpha: float, beta: float, n_max: int,
+                   k_max: int) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+    """
+    Yield (n, log_row, sign_row) for n = 0..n_max holding only two rows in memory.
+    
+    The yielded arrays are reused for later rows, so callers that keep them must copy them.
+    """
+    current_log = np.full(k_max + 1, -np.inf)
+    current_sign = np.zeros(k_max + 1)
+    current_log[0] = 0.0
+    current_sign[0] = 1.0
+    spare_log = np.empty_like(current_log)
+    spare_sign = np.empty_like(current_sign)
+    yield 0, current_log, current_sign
+    for n in range(1, n_max + 1):
+        _advance_log_row(current_log, current_sign, n, alpha, beta, spare_log, spare_sign)
+        current_log, spare_log = spare_log, current_log
+        current_sign, spare_sign = spare_sign, current_sign
+        yield n, current_log, current_sign
+
+
+def _as_fraction(x: Union[int, float, Fraction]) -> Fraction:
+    """
+    Convert a parameter to an exact rational.
+    
+    Floats are read through their shortest repr, so 0.1 becomes 1/10 rather
+    than the nearest binary fraction.
+    """
+    if isinstance(x, float):
+        return Fraction(repr(float(x)))  # float() strips NumPy scalar reprs
+    return Fraction(x)
+
+
+def _exact_parameters(alpha: Union[int, float, Fraction],
+                      beta: Union[int, float, Fraction]) -> Tuple[int, int, int]:
+    """
+    Write α = a/d and β = b/d over a shared denominator d.
+    
+    Since L^{cα,cβ}_{n,k} = c^{n-k} L^{α,β}_{n,k}, the integer triangle for (a, b)
+    gives L^{α,β}_{n,k} = L^{a,b}_{n,k} / d^{n-k}.
+    
+    Returns:
+        Tuple (a, b, d) of Python ints with d > 0
+    """
+    alpha_q, beta_q = _as_fraction(alpha), _as_fraction(beta)
+    d = alpha_q.denominator * beta_q.denominator // math.gcd(alpha_q.denominator, beta_q.denominator)
+    return int(alpha_q * d), int(beta_q * d), d
+
+
+def _iter_exact_rows(a: int, b: int, n_max: int, k_max: int) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Yield (n, row) of the integer triangle L^{a,b} for n = 0..n_max.
+    
+    Rows are object arrays of Python ints, so the recurrence is exact for any
+    magnitude. Each yielded row is a fresh array that callers may keep.
+    """
+    ks = np.arange(k_max + 1, dtype=object)
+    current = np.zeros(k_max + 1, dtype=object)
+    current[0] = 1
+    yield 0, current
+    for n in range(1, n_max + 1):
+        top = min(n, k_max)
+        row = np.zeros(k_max + 1, dtype=object)
+        row[:top + 1] = (a * (n - 1) + b * ks[:top + 1]) * current[:top + 1]
+        row[1:top + 1] += current[:top]
+        current = row
+        yield n, current
+
+
+def _exact_value(numerator: int, d: int, power: int) -> Union[int, Fraction]:
+    """Return numerator / d^power, as an int whenever the quotient is integral."""
+    if d == 1 or numerator == 0:
+        return numerator
+    value = Fraction(numerator, d ** power)
+    return value.numerator if value.denominator == 1 else value
+
+
+def _query_arrays(ns: Any, ks: Any) -> Tuple[np.ndarray, np.ndarray, Tuple[int, ...]]:
+    """
+    Broadcast (n, k) queries against each other and flatten them.
+    
+    Returns:
+        Tuple (ns, ks, shape) of flat int64 arrays and the broadcast shape
         
-        # Set up disk cache directory
-        if use_disk_cache:
-            if cache_dir is None:
-                import tempfile
-                self.cache_dir = os.path.join(tempfile.gettempdir(), f"gsn_cache_{hash((alpha, beta))}")
-            else:
-                self.cache_dir = cache_dir
-                
-            # Create cache directory if it doesn't exist
-            if not os.path.exists(self.cache_dir):
-                os.makedirs(self.cache_dir)
-                logger.info(f"Created disk cache directory: {self.cache_dir}")
+    Raises:
+        ValueError: If any n or k is negative
+    """
+    ns, ks = np.broadcast_arrays(np.asarray(ns, dtype=np.int64), np.asarray(ks, dtype=np.int64))
+    shape = ns.shape
+    ns, ks = ns.ravel(), ks.ravel()
+    if ns.size and (ns.min() < 0 or ks.min() < 0):
+        raise ValueError(f"n and k must be non-negative, got min(n)={ns.min()}, min(k)={ks.min()}")
+    return ns, ks, shape
+
+
+def _gather_queries(rows: Iterator[Tuple[Any, ...]], ns: np.ndarray) -> Iterator[Tuple[np.ndarray, int, Tuple[Any, ...]]]:
+    """
+    Walk a row stream once, stopping at each row that some query needs.
+    
+    The queries are grouped by n, so each row is built once however many
+    queries hit it and whatever order they were given in.
+    
+    Yields:
+        Tuples (positions, n, row arrays) where positions indexes the queries with this n
+    """
+    order = np.argsort(ns, kind='stable')
+    wanted, starts = np.unique(ns[order], return_index=True)
+    ends = np.append(starts[1:], len(order))
+    i = 0
+    for n, *row in rows:
+        if n == wanted[i]:
+            yield order[starts[i]:ends[i]], n, tuple(row)
+            i += 1
+            if i == len(wanted):
+                return
+
+
+# Moduli must stay below 2^31 so residue products fit in int64
+_MAX_MODULUS = 2 ** 31
+
+
+def _iter_mod_rows(a: int, b: int, n_max: int, k_max: int, p: int) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Yield (n, row) of the integer triangle L^{a,b} modulo p for n = 0..n_max.
+    
+    Rows are int64 vectors with residues in [0, p). The yielded array is
+    reused for later rows, so callers that keep it must copy it.
+    """
+    a_p, b_p = a % p, b % p
+    ks = np.arange(k_max + 1, dtype=np.int64)
+    current = np.zeros(k_max + 1, dtype=np.int64)
+    current[0] = 1 % p
+    spare = np.empty_like(current)
+    yield 0, current
+    for n in range(1, n_max + 1):
+        top = min(n, k_max)
+        weights = (a_p * (n - 1) + b_p * ks[:top + 1]) % p
+        spare[:top + 1] = weights * current[:top + 1] % p
+        spare[1:top + 1] = (spare[1:top + 1] + current[:top]) % p
+        spare[top + 1:] = 0
+        current, spare = spare, current
+        yield n, current
+
+
+def _triangle_mod(a: int, b: int, d: int, n_max: int, k_max: int, p: int) -> np.ndarray:
+    """
+    Fill the triangle L^{a/d,b/d}_{n,k} mod p with int64 row vectors.
+    
+    The integer triangle for (a, b) is built modulo p and each entry is then
+    multiplied by d^{-(n-k)} mod p, which requires gcd(d, p) = 1.
+    
+    Returns:
+        int64 array of shape (n_max+1, k_max+1) with residues in [0, p)
+    """
+    table = np.zeros((n_max + 1, k_max + 1), dtype=np.int64)
+    for n, row in _iter_mod_rows(a, b, n_max, k_max, p):
+        table[n] = row
+    
+    if d % p != 1:
+        # Scale entry (n, k) by d^{-(n-k)}; entries with k > n are zero already
+        inv_powers = np.ones(n_max + 1, dtype=np.int64)
+        inv_d = pow(d, -1, p)
+        for j in range(1, n_max + 1):
+            inv_powers[j] = inv_powers[j - 1] * inv_d % p
+        exponents = np.clip(np.arange(n_max + 1)[:, None] - np.arange(k_max + 1)[None, :], 0, None)
+        table = table * inv_powers[exponents] % p
+    return table
+
+
+def _rows_mod_worker(args: Tuple[int, int, int, int, List[int], Set[int]]) -> np.ndarray:
+    """
+    Process-pool entry point: residues of selected rows of L^{a,b} for a batch of primes.
+    
+    All primes of the batch are advanced together as a (primes, k) int64 array,
+    so each row step is a handful of NumPy calls regardless of the batch size.
+    
+    Returns:
+        int64 array of shape (len(primes), len(wanted), k_max+1), rows in sorted order
+    """
+    a, b, n_max, k_max, primes, wanted = args
+    p = np.array(primes, dtype=np.int64)[:, None]
+    a_p, b_p = a % p, b % p
+    ks = np.arange(k_max + 1, dtype=np.int64)
+    current = np.zeros((len(primes), k_max + 1), dtype=np.int64)
+    current[:, 0] = 1
+    selected = {0: current.copy()} if 0 in wanted else {}
+    for n in range(1, n_max + 1):
+        top = min(n, k_max)
+        row = np.zeros_like(current)
+        row[:, :top + 1] = (a_p * (n - 1) + b_p * ks[:top + 1]) % p * current[:, :top + 1] % p
+        row[:, 1:top + 1] = (row[:, 1:top + 1] + current[:, :top]) % p
+        current = row
+        if n in wanted:
+            selected[n] = current
+    return np.stack([selected[n] for n in sorted(wanted)], axis=1)
+
+
+def _is_word_prime(m: int) -> bool:
+    """Deterministic Miller-Rabin test, exact for m < 3,215,031,751."""
+    if m < 2:
+        return False
+    for q in (2, 3, 5, 7):
+        if m % q == 0:
+            return m == q
+    d, s = m - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for base in (2, 3, 5, 7):
+        x = pow(base, d, m)
+        if x in (1, m - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % m
+            if x == m - 1:
+                break
         else:
-            self.cache_dir = cache_dir
-        
-        # In-memory cache for quick lookups
-        self._memory_cache: Dict[Any, float] = {}
-        
-        # Special cache for precomputed values
-        self._precomputed: Dict[Tuple[int, int], float] = {}
-        
-        # Performance metrics
-        self.compute_time: DefaultDict[str, float] = defaultdict(float)
-        self.cache_hits: DefaultDict[str, int] = defaultdict(int)
-        self.cache_misses: DefaultDict[str, int] = defaultdict(int)
-        
-        # Initialize precomputed tables for common special cases
-        if (self.alpha, self.beta) in [(1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]:
-            self._precompute_common_values()
+            return False
+    return True
+
+
+def _word_primes(count: int) -> List[int]:
+    """Return the `count` largest primes below 2^31, in descending order."""
+    primes = []
+    candidate = _MAX_MODULUS - 1
+    while len(primes) < count:
+        if _is_word_prime(candidate):
+            primes.append(candidate)
+        candidate -= 2
+    return primes
+
+
+def _crt_combine(residues: List[np.ndarray], primes: List[int]) -> np.ndarray:
+    """
+    Reconstruct signed integers from residue arrays by the Chinese remainder theorem.
     
-    #---------------------------------------------------------------------------
-    # Core public API methods
-    #---------------------------------------------------------------------------
+    With M the product of the primes, x = Σ y_i (M/p_i) - qM where
+    y_i = r_i (M/p_i)^{-1} mod p_i is computed in int64 and q = round(Σ y_i/p_i)
+    in float64. This needs one big-integer multiply-add per prime and entry and
+    no final reduction mod M. Values must satisfy |x| < M/4 so the rounding of
+    q is never ambiguous.
     
-    def compute(self, n: int, k: int, method: str = 'auto') -> float:
-        """
-        Compute L{n,k}^{α,β} using the specified method.
+    Returns:
+        Object array of Python ints with the shape of the residue arrays
+    """
+    modulus = math.prod(primes)
+    quotient = np.zeros(residues[0].shape)
+    total = np.zeros(residues[0].shape, dtype=object)
+    for r, p in zip(residues, primes):
+        cofactor = modulus // p
+        y = r.astype(np.int64) * pow(cofactor % p, -1, p) % p
+        quotient += y / p
+        total += y.astype(object) * cofactor
+    return total - np.rint(quotient).astype(np.int64).astype(object) * modulus
+
+
+def _band_boundaries(n_max: int, k_max: int, bands: int) -> List[int]:
+    """
+    Split columns 0..k_max into contiguous bands holding about the same number of cells.
+    
+    Column k holds the n_max - k + 1 cells with k <= n <= n_max, so left bands
+    are narrower than right ones.
+    
+    Returns:
+        Increasing column boundaries [0, c_1, ..., k_max+1]; band j is [c_j, c_{j+1})
+    """
+    cells = np.cumsum(n_max + 1 - np.arange(k_max + 1))
+    targets = cells[-1] * np.arange(1, bands) / bands
+    inner = np.searchsorted(cells, targets) + 1
+    return sorted({0, k_max + 1} | {int(c) for c in inner if 0 < c <= k_max})
+
+
+def _band_worker(table_buffer: Any, shape: Tuple[int, int], bounds: List[int], band: int,
+                 alpha: float, beta: float, block_rows: int, progress: Any, ready: Any,
+                 busy: Any) -> None:
+    """
+    Worker process entry point: fill one column band of a shared triangle.
+    
+    Cell (n, k) needs (n-1, k-1) and (n-1, k), so band j only depends on the
+    last column of band j-1. Bands run as a pipeline: band j fills a block of
+    rows as soon as band j-1 has published the rows before it in
+    progress[j-1], then publishes its own progress and wakes the waiting bands.
+    
+    Args:
+        table_buffer: Shared float64 buffer of the (n_max+1, k_max+1) table,
+                      with row 0 already filled in
+        shape: Shape of the table
+        bounds: Column boundaries from _band_boundaries
+        band: Index of the band to fill
+        alpha: Weight parameter for non-head elements
+        beta: Weight parameter for head elements
+        block_rows: Number of rows filled between synchronizations
+        progress: Shared int64 array; progress[j] is the last row band j has filled
+        ready: Condition guarding progress
+        busy: Shared float64 array receiving each band's compute time
+    """
+    table = np.frombuffer(table_buffer, dtype=np.float64).reshape(shape)
+    lo, hi = bounds[band], bounds[band + 1]
+    columns = np.arange(lo, hi, dtype=float)
+    busy_time = 0.0
+    
+    # Rows above the band's first column are zero and need no work
+    for block_start in range(max(1, lo), shape[0], block_rows):
+        block_end = min(block_start + block_rows, shape[0])
+        if band > 0:
+            with ready:
+                ready.wait_for(lambda: progress[band - 1] >= block_end - 2)
         
-        This method automatically selects the most appropriate algorithm
-        based on the input size if method='auto'.
+        start_time = time.perf_counter()
+        for n in range(block_start, block_end):
+            top = min(n, hi - 1)
+            prev, row = table[n - 1], table[n]
+            row[lo:top + 1] = (alpha * (n - 1) + beta * columns[:top + 1 - lo]) * prev[lo:top + 1]
+            if lo > 0:
+                row[lo:top + 1] += prev[lo - 1:top]
+            else:
+                row[1:top + 1] += prev[:top]
+        busy_time += time.perf_counter() - start_time
         
-        Args:
-            n: Number of elements
-            k: Number of ordered lists
-            method: Method to use. Options are:
-                - 'auto': Automatically select the best method
-                - 'triangular': Use triangular recurrence relation
-                - 'explicit': Use explicit formula
-                - 'bottom_up': Use bottom-up dynamic programming
+        with ready:
+            progress[band] = block_end - 1
+            ready.notify_all()
+    busy[band] = busy_time
+
+
+def _cells_worker(args: Tuple[float, float, str, List[int]]) -> List[Tuple[int, List[float]]]:
+    """Process-pool entry point: rows of the triangle computed cell by cell with one method."""
+    alpha, beta, method, rows = args
+    gs = GeneralizedStirling(alpha=alpha, beta=beta)
+    return [(n, [gs.compute(n, k, method=method) for k in range(1, n + 1)]) for n in rows]
+
+
+#---------------------------------------------------------------------------
+# Generalized rising factorial kernel
+#---------------------------------------------------------------------------
+
+def _scipy_special() -> Any:
+    """Return scipy.special, importing it on first use."""
+    import scipy.special
+    return scipy.special
+
+
+_lgamma = np.vectorize(math.lgamma, otypes=[float])
+
+
+def _gammaln(x: Any) -> np.ndarray:
+    """Elementwise log|Γ(x)|, from scipy when available."""
+    return _scipy_special().gammaln(x) if HAS_SCIPY else _lgamma(x)
+
+
+def _log_rising_factorial(x: Any, n: Any, increment: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute (x|h)^n̄ = x(x+h)...(x+(n-1)h) elementwise as (log|value|, sign).
+    
+    For h != 0 the product is h^n (t)_n with t = x/h, and (t)_n splits into
+    its m = min(n, ceil(-t)) negative factors and its positive ones:
+    
+        |(t)_n| = Γ(1-t)/Γ(1-t-m) * Γ(t+n)/Γ(t+m),  sign = (-1)^m
+    
+    Every log-gamma argument is positive, so the cost is O(1) per element
+    whatever n is. A zero factor (t a non-positive integer with n > -t) gives
+    an exact zero, and h = 0 reduces to x^n.
+    
+    Args:
+        x: Base values (array-like)
+        n: Numbers of factors (non-negative integers, broadcast against x)
+        increment: Increments h (broadcast against x)
+        
+    Returns:
+        Tuple (log_value, sign) of float arrays of the broadcast shape;
+        zeros are returned as (-inf, 0.0)
+        
+    Raises:
+        ValueError: If any n is negative
+    """
+    x, n, h = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(n, dtype=np.int64),
+                                  np.asarray(increment, dtype=float))
+    if n.size and n.min() < 0:
+        raise ValueError(f"n must be non-negative, got {n.min()}")
+    nf = n.astype(float)
+    flat = h == 0
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(flat, 1.0, x / np.where(flat, 1.0, h))
+        m = np.where(t < 0, np.minimum(np.ceil(-t), nf), 0.0)
+        zero = (t <= 0) & (t == np.round(t)) & (nf > -t)
+        
+        # Substitute harmless arguments wherever a factor group is empty
+        t_neg = np.where(m > 0, t, 0.0)
+        log_neg = _gammaln(1.0 - t_neg) - _gammaln(1.0 - t_neg - m)
+        has_pos = (m < nf) & ~zero
+        t_pos = np.where(has_pos, t, 1.0)
+        log_pos = np.where(has_pos, _gammaln(t_pos + nf) - _gammaln(t_pos + m), 0.0)
+        
+        log_value = log_neg + log_pos + nf * np.log(np.abs(np.where(flat, 1.0, h)))
+        sign = np.where(m % 2 == 1, -1.0, 1.0) * np.where((h < 0) & (n % 2 == 1), -1.0, 1.0)
+        
+        # Zero increment: x^n
+        log_value = np.where(flat, nf * np.log(np.abs(x)), log_value)
+        sign = np.where(flat, np.where((x < 0) & (n % 2 == 1), -1.0, 1.0), sign)
+        zero = np.where(flat, (x == 0) & (n > 0), zero)
+    
+    log_value = np.where(n == 0, 0.0, np.where(zero, -np.inf, log_value))
+    sign = np.where(n == 0, 1.0, np.where(zero, 0.0, sign))
+    return log_value, sign
+
+
+def _rising_factorial(x: Any, n: Any, increment: Any) -> np.ndarray:
+    """
+    Compute (x|h)^n̄ elementwise in O(1) per element.
+    
+    Uses scipy.special.poch(x/h, n) * h^n where both factors are finite and
+    non-zero, which is accurate to a few ulps, and the log-gamma kernel
+    otherwise (results beyond the float64 range come back as ±inf).
+    
+    Returns:
+        Float array of the broadcast shape of x, n and increment
+    """
+    if HAS_SCIPY:
+        x, n, h = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(n, dtype=np.int64),
+                                      np.asarray(increment, dtype=float))
+        with np.errstate(over='ignore', under='ignore', divide='ignore', invalid='ignore'):
+            safe_h = np.where(h == 0, 1.0, h)
+            scale = safe_h ** n
+            value = _scipy_special().poch(x / safe_h, n) * scale
+        usable = (h != 0) & np.isfinite(value) & (scale != 0) & np.isfinite(scale)
+        if usable.all():
+            return value
+    
+    log_value, sign = _log_rising_factorial(x, n, increment)
+    with np.errstate(over='ignore', under='ignore'):
+        fallback = sign * np.exp(log_value)
+    return np.where(usable, value, fallback) if HAS_SCIPY else fallback
+
+
+def _fft_row(alpha: float, beta: float, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute row n of the triangle from the explicit formula as one FFT convolution.
+    
+    With a_i = (βi|α)^n̄ / i! and b_m = (-1)^m / m!, the explicit formula reads
+    β^k L{n,k} = Σ_i a_i b_{k-i}, so the whole row is the first n+1 terms of
+    a * b. The a_i are scaled by their largest magnitude before the transform
+    and the scale is restored in the log domain afterwards.
+    
+    The error estimate adds the FFT rounding bound 5ε log2(N) ||a|| ||b|| to the
+    input rounding Σ_i δ_i |a_i| |b_{k-i}|, where δ_i is the relative error of
+    a_i; dividing by |β^k L{n,k}| turns it into a relative error, which is
+    large wherever the alternating sum cancels.
+    
+    Args:
+        alpha: Weight parameter for non-head elements
+        beta: Weight parameter for head elements (must be non-zero)
+        n: Row number
+        
+    Returns:
+        Tuple (values, errors) of arrays of length n+1 with the row values and
+        their estimated relative errors (inf where the computed value is 0)
+    """
+    eps = np.finfo(float).eps
+    i = np.arange(n + 1)
+    log_rising, sign_rising = _log_rising_factorial(beta * i, n, alpha)
+    log_factorials = _gammaln(i + 1.0)
+    log_a = log_rising - log_factorials
+    if not sign_rising.any():
+        return np.zeros(n + 1), np.zeros(n + 1)
+    
+    shift = np.max(log_a[sign_rising != 0])
+    a = sign_rising * np.exp(log_a - shift)
+    b = np.where(i % 2 == 0, 1.0, -1.0) * np.exp(-log_factorials)
+    
+    size = 1 << int(2 * n + 1).bit_length()
+    def convolve(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        return np.fft.irfft(np.fft.rfft(u, size) * np.fft.rfft(v, size), size)[:n + 1]
+    
+    c = convolve(a, b)
+    input_error = (4 * eps * (1.0 + np.abs(np.where(sign_rising != 0, log_rising, 0.0)))) * np.abs(a)
+    abs_error = (5 * eps * math.log2(size) * np.linalg.norm(a) * np.linalg.norm(b) +
+                 np.abs(convolve(input_error, np.abs(b))))
+    
+    # Undo the scaling: L{n,k} = c_k e^shift / β^k
+    with np.errstate(divide='ignore', over='ignore', invalid='ignore'):
+        log_values = np.log(np.abs(c)) + shift - i * math.log(abs(beta))
+        signs = np.sign(c) * np.where((beta < 0) & (i % 2 == 1), -1.0, 1.0)
+        values = np.where(c != 0, signs * np.exp(log_values), 0.0)
+        errors = np.where(c != 0, abs_error / np.abs(c), np.inf)
+    return values, errors
+
+
+#---------------------------------------------------------------------------
+# Truncated power series in log space
+#---------------------------------------------------------------------------
+
+def _log_series_mul(log_a: np.ndarray, sign_a: np.ndarray, log_b: np.ndarray, sign_b: np.ndarray,
+                    block_size: int = 1 << 22) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Multiply two power series truncated to len(log_a) terms, in log space.
+    
+    Coefficients are stored as (log|c|, sign(c)) pairs so that series whose
+    coefficients span far beyond the float64 range (such as EGFs, whose t^n
+    coefficient carries a 1/n!) can be multiplied. Each output coefficient is
+    a max-shifted sum over its terms; blocks of output coefficients are formed
+    at once, keeping about block_size terms in memory.
+    
+    Returns:
+        Tuple (log|c|, sign(c)) of the truncated product; zero coefficients
+        are (-inf, 0.0)
+    """
+    size = len(log_a)
+    log_c = np.full(size, -np.inf)
+    sign_c = np.zeros(size)
+    step = max(1, block_size // max(size, 1))
+    for start in range(0, size, step):
+        m = np.arange(start, min(start + step, size))[:, None]
+        j = np.arange(m[-1, 0] + 1)[None, :]
+        valid = j <= m
+        other = np.where(valid, m - j, 0)
+        terms = np.where(valid, log_a[j] + log_b[other], -np.inf)
+        signs = np.where(valid, sign_a[j] * sign_b[other], 0.0)
+        with np.errstate(invalid='ignore'):
+            shift = np.max(np.where(signs != 0, terms, -np.inf), axis=1)
+            shift = np.where(np.isfinite(shift), shift, 0.0)
+            total = np.sum(signs * np.exp(terms - shift[:, None]), axis=1)
+        with np.errstate(divide='ignore'):
+            log_c[start:start + len(total)] = np.log(np.abs(total)) + shift
+        sign_c[start:start + len(total)] = np.sign(total)
+    log_c[sign_c == 0] = -np.inf
+    return log_c, sign_c
+
+
+def _log_series_pow(log_a: np.ndarray, sign_a: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Raise a truncated log-space power series to the integer power k >= 0 by binary powering."""
+    log_result = np.full(len(log_a), -np.inf)
+    sign_result = np.zeros(len(log_a))
+    log_result[0], sign_result[0] = 0.0, 1.0
+    log_base, sign_base = log_a, sign_a
+    while k:
+        if k & 1:
+            log_result, sign_result = _log_series_mul(log_result, sign_result, log_base, sign_base)
+        k >>= 1
+        if k:
+            log_base, sign_base = _log_series_mul(log_base, sign_base, log_base, sign_base)
+    return log_result, sign_result
+
+
+def _log_column(alpha: float, beta: float, k: int, n_max: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute column k, L{k..n_max, k}, from its exponential generating function.
+    
+    Σ_n L{n,k} t^n/n! = f(t)^k / k! with f(t) = ((1-αt)^(-β/α) - 1)/β, whose
+    limits are (e^(βt) - 1)/β for α = 0 and -log(1-αt)/α for β = 0. In every
+    case f(t) = t g(t) with g_j = (β+α|α)^j̄ / (j+1)!, so the column is read
+    off the power g^k: L{k+m,k} = (k+m)!/k! [t^m] g(t)^k.
+    
+    Returns:
+        Tuple (log|L|, sign) of arrays of length n_max-k+1, indexed by n-k
+    """
+    size = n_max - k + 1
+    j = np.arange(size)
+    log_rising, sign = _log_rising_factorial(beta + alpha, j, alpha)
+    log_g = np.where(sign != 0, log_rising - _gammaln(j + 2.0), -np.inf)
+    log_power, sign_power = _log_series_pow(log_g, sign, k)
+    log_values = log_power + _gammaln(j + k + 1.0) - _gammaln(k + 1.0)
+    return np.where(sign_power != 0, log_values, -np.inf), sign_power
+
+
+#---------------------------------------------------------------------------
+# Closed-form kernels for the classical families
+#---------------------------------------------------------------------------
+
+# Shared integer rows of the first-kind family, up to _FAMILY_TABLE_ROWS rows per shift r
+# with |r| < _FAMILY_TABLE_SHIFTS (other shifts build their rows per call):
+# _FIRST_KIND_ROWS[r][n][k] is the coefficient of x^k in (x+r)(x+r+1)...(x+r+n-1)
+_FAMILY_TABLE_ROWS = 256
+_FAMILY_TABLE_SHIFTS = 16
+_FIRST_KIND_ROWS: Dict[int, List[List[int]]] = {}
+
+
+def _classical_family(alpha: Union[float, Fraction], beta: Union[float, Fraction],
+                      r: Union[float, Fraction] = 0) -> Optional[Tuple[str, Union[float, Fraction], int]]:
+    """
+    Recognize a classical family in the recurrence weight α(n-1) + βk + r.
+    
+    Since the weight c·w + r equals c·(w + r/c), the numbers are c^{n-k} times
+    the unit family with weight w + r/c: 'first' (w = n-1, the r-Stirling
+    numbers of the first kind), 'second' (w = k, the r-Stirling numbers of the
+    second kind) or 'lah' (w = n-1+k, with r = 0).
+    
+    Returns:
+        Tuple (family, c, shift) with an integer shift r/c, or None if (α, β, r)
+        is not a scaled classical family
+    """
+    if alpha == 0 and beta != 0:
+        family, scale = 'second', beta
+    elif beta == 0 and alpha != 0:
+        family, scale = 'first', alpha
+    elif alpha == beta != 0 and r == 0:
+        family, scale = 'lah', alpha
+    else:
+        return None
+    shift = r / scale
+    if shift != int(shift):
+        return None
+    return family, scale, int(shift)
+
+
+def _family_unit(family: str, shift: int, n: int, k: int) -> Optional[int]:
+    """
+    Exact value of the unit family member for row n and column k.
+    
+    Lah numbers are C(n-1,k-1)·n!/k!, the second kind is the power sum
+    Σ_j (-1)^{k-j} C(k,j) (j+r)^n / k!, and the first kind is read from the
+    shared table of integer rows (None beyond _FAMILY_TABLE_ROWS rows).
+    """
+    if k > n:
+        return 0
+    if family == 'lah':
+        return int(n == 0) if k == 0 else math.comb(n - 1, n - k) * math.perm(n, n - k)
+    if family == 'second':
+        total = 0
+        binomial = 1
+        for j in range(k, -1, -1):
+            term = binomial * (j + shift) ** n
+            total += term if (k - j) % 2 == 0 else -term
+            binomial = binomial * j // (k - j + 1)
+        return total // math.factorial(k)
+    if n >= _FAMILY_TABLE_ROWS:
+        return None
+    rows = _FIRST_KIND_ROWS.get(shift, [[1]])
+    if len(rows) <= n:
+        # Extend a copy and publish it in one assignment, so concurrent
+        # callers never see a partly built table
+        rows = list(rows)
+        while len(rows) <= n:
+            m = len(rows)
+            weight = m - 1 + shift
+            prev = rows[-1]
+            rows.append([weight * prev[0]] + [prev[j - 1] + weight * prev[j] for j in range(1, m)] + [1])
+        if abs(shift) < _FAMILY_TABLE_SHIFTS:
+            _FIRST_KIND_ROWS[shift] = rows
+    return rows[n][k]
+
+
+def _family_exact(family: Tuple[str, Union[float, Fraction], int], n: int, k: int) -> Optional[Union[int, Fraction]]:
+    """Exact c^{n-k} times the unit family value, as an int when integral (None if unavailable)."""
+    name, scale, shift = family
+    unit = _family_unit(name, shift, n, k)
+    if unit is None:
+        return None
+    value = unit * Fraction(scale) ** (n - k)
+    return value.numerator if value.denominator == 1 else value
+
+
+def _scaled_log(unit: int, scale: Union[float, Fraction], power: int) -> Tuple[float, float]:
+    """Return unit·scale^power as (log|L|, sign), with zero as (-inf, 0.0)."""
+    if unit == 0:
+        return float('-inf'), 0.0
+    sign = -1.0 if (unit < 0) != (scale < 0 and power % 2 == 1) else 1.0
+    # math.log accepts ints of any size
+    log_value = math.log(abs(unit))
+    if power:
+        log_value += power * math.log(abs(scale))
+    return log_value, sign
+
+
+def _scaled_float(unit: int, scale: Union[float, Fraction], power: int) -> float:
+    """Return unit·scale^power as a float, ±inf beyond the float64 range."""
+    if unit == 0:
+        return 0.0
+    try:
+        value = float(unit) * float(scale) ** power
+    except OverflowError:
+        value = math.inf
+    if math.isfinite(value) and abs(value) >= sys.float_info.min:
+        return value
+    # Overflow or underflow in one factor: combine the factors in log space
+    log_value, sign = _scaled_log(unit, scale, power)
+    if log_value > math.log(sys.float_info.max):
+        return math.copysign(math.inf, sign)
+    return sign * math.exp(log_value)
+
+
+def _family_cost(family: Tuple[str, Union[float, Fraction], int], n: int, k: int) -> float:
+    """
+    Estimated cost of one family value, in the units of column()'s cost model.
+    
+    One log-space row step of the recurrence to L{n,k} costs about 1000 + k
+    units. Each of the k+1 big-int powers of the second-kind power sum costs
+    about n log2(k) / 5 units (measured); Lah and tabulated first-kind values
+    are nearly free.
+    """
+    name = family[0]
+    if name == 'second':
+        return k * n * math.log2(k + 2) / 5
+    return 0 if name == 'lah' or n < _FAMILY_TABLE_ROWS else math.inf
+
+
+def _family_log(family: Tuple[str, Union[float, Fraction], int], n: int, k: int,
+                max_cost: float = math.inf) -> Optional[Tuple[float, float]]:
+    """
+    Family value as (log|L|, sign), with zero as (-inf, 0.0).
+    
+    Returns None if the value is unavailable or estimated to cost more than
+    max_cost (see _family_cost).
+    """
+    name, scale, shift = family
+    if _family_cost(family, n, k) > max_cost:
+        return None
+    unit = _family_unit(name, shift, n, k)
+    return None if unit is None else _scaled_log(unit, scale, n - k)
+
+
+def _family_value(family: Tuple[str, Union[float, Fraction], int], n: int, k: int,
+                  max_cost: float = math.inf) -> Optional[float]:
+    """
+    Family value as a float, ±inf beyond the float64 range.
+    
+    Returns None if the value is unavailable or estimated to cost more than
+    max_cost (see _family_cost). A second-kind value known to overflow is
+    returned as ±inf without evaluating the power sum.
+    """
+    name, scale, shift = family
+    if name == 'second' and shift >= 0 and k + shift > 0 and n > k:
+        # With r >= 0 every path weight is non-negative, and the path down
+        # column k alone gives a unit value of at least (k+r)^{n-k}
+        if (n - k) * math.log(abs(scale) * (k + shift)) > math.log(sys.float_info.max):
+            return math.copysign(math.inf, scale if (n - k) % 2 else 1.0)
+    if _family_cost(family, n, k) > max_cost:
+        return None
+    unit = _family_unit(name, shift, n, k)
+    return None if unit is None else _scaled_float(unit, scale, n - k)
+
+
+def _family_column(family: Tuple[str, Union[float, Fraction], int], k: int, n_max: int) -> Optional[List[int]]:
+    """
+    Exact unit family values for rows k..n_max of column k (None if unavailable).
+    
+    The family value in row n is the entry times scale^{n-k}.
+    
+    Second-kind columns keep the k+1 powers (j+r)^n of the power sum and
+    advance them by one multiplication per row; Lah columns step by the
+    ratio L(n+1,k)/L(n,k) = n(n+1)/(n-k+1).
+    """
+    name, _, shift = family
+    if name == 'second':
+        bases = [j + shift for j in range(k + 1)]
+        coefficients = [(-1) ** (k - j) * math.comb(k, j) for j in range(k + 1)]
+        powers = [base ** k for base in bases]
+        factorial = math.factorial(k)
+        column = []
+        for _ in range(k, n_max + 1):
+            column.append(sum(c * p for c, p in zip(coefficients, powers)) // factorial)
+            powers = [p * base for p, base in zip(powers, bases)]
+        return column
+    if name == 'lah':
+        column = [_family_unit(name, shift, k, k)]
+        for n in range(k, n_max):
+            column.append(column[-1] * n * (n + 1) // (n - k + 1) if k else 0)
+        return column
+    if n_max >= _FAMILY_TABLE_ROWS:
+        return None
+    return [_family_unit(name, shift, n, k) for n in range(k, n_max + 1)]
+
+
+#---------------------------------------------------------------------------
+# Adaptive precision
+#---------------------------------------------------------------------------
+
+# Working precisions tried after float64, in decimal digits
+_ADAPTIVE_START_DPS = 30
+_ADAPTIVE_MAX_DPS = 4000
+
+
+def _float_value_with_bound(alpha: float, beta: float, n: int, k: int) -> Tuple[float, float]:
+    """
+    Run the triangular recurrence for L{n,k} in float64 with a running error bound.
+    
+    For r = a + c*b with c = α(m-1) + βj, the rounding of c, of the product
+    and of the sum add at most u(2(|α(m-1)| + |βj|)|b| + |cb| + |r|) to the
+    propagated bound E_a + |c| E_b (first order in the unit roundoff u). The
+    bound stays near n*u relative to L when all terms share a sign and grows
+    with the cancellation caused by negative weights.
+    
+    Returns:
+        Tuple (value, absolute error bound); the bound is inf on overflow
+    """
+    u = np.finfo(float).eps / 2
+    values = np.zeros(k + 1)
+    bounds = np.zeros(k + 1)
+    values[0] = 1.0
+    j = np.arange(k + 1, dtype=float)
+    with np.errstate(over='ignore', invalid='ignore'):
+        for m in range(1, n + 1):
+            scale = np.abs(alpha * (m - 1)) + np.abs(beta * j)
+            weights = alpha * (m - 1) + beta * j
+            products = weights * values
+            new_values = products.copy()
+            new_values[1:] += values[:-1]
+            new_bounds = np.abs(weights) * bounds + u * (2 * scale * np.abs(values) + np.abs(products) +
+                                                          np.abs(new_values))
+            new_bounds[1:] += bounds[:-1]
+            values, bounds = new_values, new_bounds
+    value, bound = float(values[k]), float(bounds[k])
+    if not (math.isfinite(value) and math.isfinite(bound)):
+        return value, math.inf
+    return value, bound
+
+
+def _mpmath_value_with_bound(alpha: float, beta: float, n: int, k: int, dps: int) -> Tuple[Any, Any]:
+    """
+    Run the triangular recurrence for L{n,k} in mpmath at dps digits with a running error bound.
+    
+    Same recurrence and bound as _float_value_with_bound with u = 2^-prec;
+    only the band of columns that reaches L{n,k} is advanced.
+    
+    Returns:
+        Tuple (value, absolute error bound) of mpf numbers
+    """
+    import mpmath
+    with mpmath.workdps(dps):
+        u = mpmath.ldexp(1, -mpmath.mp.prec)
+        a, b = mpmath.mpf(alpha), mpmath.mpf(beta)
+        zero = mpmath.mpf(0)
+        values = [mpmath.mpf(1)] + [zero] * k
+        bounds = [zero] * (k + 1)
+        for m in range(1, n + 1):
+            # Column j of row m only feeds L{n,k} if k - (n - m) <= j <= k
+            for j in range(min(m, k), max(0, k - (n - m)) - 1, -1):
+                weight = a * (m - 1) + b * j
+                product = weight * values[j]
+                previous = values[j - 1] if j > 0 else zero
+                result = previous + product
+                scale = abs(a * (m - 1)) + abs(b * j)
+                bounds[j] = ((bounds[j - 1] if j > 0 else zero) + abs(weight) * bounds[j] +
+                             u * (2 * scale * abs(values[j]) + abs(product) + abs(result)))
+                values[j] = result
+        return +values[k], +bounds[k]
+
+
+def _is_exact_zero(alpha: float, beta: float, n: int, k: int) -> bool:
+    """
+    Decide exactly whether L{n,k} vanishes for the binary values of α and β.
+    
+    A zero weight can wipe out the band that reaches L{n,k}; the rounding
+    bounds cannot tell that from a tiny value, so zero results are settled
+    with the integer row recurrence over the exact binary fractions.
+    """
+    alpha_q, beta_q = Fraction(alpha), Fraction(beta)
+    d = alpha_q.denominator * beta_q.denominator // math.gcd(alpha_q.denominator, beta_q.denominator)
+    for _, row in _iter_exact_rows(int(alpha_q * d), int(beta_q * d), n, k):
+        pass
+    return row[k] == 0
+
+
+class GeneralizedStirling:
+    """
+    Implementation of generalized Stirling numbers with parameters α and β.
+    
+    These numbers have a combinatorial interpretation as the total weight
+    of distributing n elements into k ordered non-empty lists, where:
+    1. The head of each list has weight β
+    2. Other elements in lists have weight α
+    3. The first element placed in each list has weight 1
+    
+    The generalized Stirling numbers include several classical number sequences
+    as special cases:
+    - Stirling numbers of the first kind: L{n,k}^{1,0}
+    - Stirling numbers of the second kind: L{n,k}^{0,1}
+    - Lah numbers: L{n,k}^{1,1}
+    
+    Attributes:
+        alpha (float): Weight parameter for non-head elements
+        beta (float): Weight parameter for head elements
+        cache_size (int): Maximum number of entries in the memory cache
+        use_disk_cache (bool): Whether to use disk-based caching for large computations
+        cache_dir (str): Directory for disk cache
+        _memory_cache (BoundedCache): Bounded per-instance cache for quick lookups
+        _family (Optional[Tuple]): Classical family (name, scale, shift) of (α, β)
+                                   computed by closed-form kernels, or None
+        compute_time (DefaultDict): Time spent in each computation method
+        cache_hits (DefaultDict): Number of cache hits for each method
+        cache_misses (DefaultDict): Number of cache misses for each method
+    """
+    
+    def __init__(self, alpha: float = 1.0, beta: float = 1.0, 
+                 cache_size: int = 10000, use_disk_cache: bool = False, 
+                 cache_dir: Optional[str] = None, exact: bool = False,
+                 use_scale_cache: bool = False, cache_bytes: Optional[int] = None,
+                 cache_policy: str = 'lru') -> None:
+        """
+        Initialize with parameters α and β.
+        
+        Args:
+            alpha: Weight parameter for non-head elements
+            beta: Weight parameter for head elements
+            cache_size: Maximum number of entries in the memory cache
+                        (None for no entry limit)
+            use_disk_cache: Whether to keep whole triangles in a memory-mapped
+                            TriangleStore on disk for large computations
+            cache_dir: Directory for disk cache (if None, uses temporary directory)
+            exact: If True, compute() returns exact ints/Fractions from the
+                   integer row recurrence (α and β are read as rationals)
+            use_scale_cache: If True, 'auto' lookups, compute_log and
+                   triangle_array go through the process-wide
+                   ScaledTriangleCache shared by all proportional (α, β)
+            cache_bytes: Approximate memory budget in bytes for the memory
+                         cache, the rows of the instance's LazyTriangle used
+                         by the triangular recurrence, and the shared
+                         scaled triangles it reads (None for no byte limit)
+            cache_policy: Eviction policy of the memory cache, 'lru' or 'lfu'
+            
+        Raises:
+            ValueError: If alpha or beta are not valid floating point numbers,
+                        or the cache limits/policy are invalid
+        """
+        # Validate input parameters
+        if not isinstance(alpha, (int, float, Fraction)) or math.isnan(alpha) or math.isinf(alpha):
+            raise ValueError(f"alpha must be a valid number, got {alpha}")
+        if not isinstance(beta, (int, float, Fraction)) or math.isnan(beta) or math.isinf(beta):
+            raise ValueError(f"beta must be a valid number, got {beta}")
+            
+        self.alpha = float(alpha)
+        self.beta = float(beta)
+        self.cache_size = cache_size
+        self.cache_bytes = cache_bytes
+        self.use_disk_cache = use_disk_cache
+        self.exact = exact
+        self.use_scale_cache = use_scale_cache
+        
+        # Integer parameters (a, b) over a shared denominator d for the exact backend
+        self._exact_params = _exact_parameters(alpha, beta)
+        
+        # Set up disk cache directory
+        if use_disk_cache:
+            if cache_dir is None:
+                self.cache_dir = os.path.join(tempfile.gettempdir(), f"gsn_cache_{hash((alpha, beta))}")
+            else:
+                self.cache_dir = cache_dir
+                
+            # Create cache directory if it doesn't exist
+            if not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir)
+                logger.info(f"Created disk cache directory: {self.cache_dir}")
+            
+            # Whole triangles stored as memory-mapped files in the cache directory
+            self._triangle_store: Optional[TriangleStore] = TriangleStore(self.cache_dir, self.alpha, self.beta)
+        else:
+            self.cache_dir = cache_dir
+            self._triangle_store = None
+        
+        # Bounded in-memory cache for quick lookups, private to this instance
+        self._memory_cache = BoundedCache(max_entries=cache_size, max_bytes=cache_bytes,
+                                          policy=cache_policy)
+        
+        # Lah, first- and second-kind directions are computed by closed-form kernels
+        self._family = _classical_family(self.alpha, self.beta)
+        
+        # Rows materialized on demand, grown across generate_triangle calls
+        self._lazy_triangle: Optional[LazyTriangle] = None
+        
+        # Performance metrics
+        self.compute_time: DefaultDict[str, float] = defaultdict(float)
+        self.cache_hits: DefaultDict[str, int] = defaultdict(int)
+        self.cache_misses: DefaultDict[str, int] = defaultdict(int)
+    
+    #---------------------------------------------------------------------------
+    # Core public API methods
+    #---------------------------------------------------------------------------
+    
+    def compute(self, n: int, k: int, method: str = 'auto', rtol: Optional[float] = None) -> float:
+        """
+        Compute L{n,k}^{α,β} using the specified method.
+        
+        This method automatically selects the most appropriate algorithm
+        based on the input size if method='auto'. With rtol, the value is
+        computed to that relative accuracy instead (see compute_adaptive).
+        
+        Args:
+            n: Number of elements
+            k: Number of ordered lists
+            method: Method to use. Options are:
+                - 'auto': Automatically select the best method (closed-form
+                  kernels for the Lah, first- and second-kind directions)
+                - 'triangular': Use triangular recurrence relation
+                - 'explicit': Use explicit formula
+                - 'bottom_up': Use bottom-up dynamic programming
                 - 'horizontal': Use horizontal recurrence relation
                 - 'vertical': Use vertical recurrence relation
                 - 'symmetric': Use symmetric function formula
                 - 'single_list': Use special case formula for k=1
+                - 'polynomial': Evaluate the shared (α, β) polynomial table
+                  (the triangular recurrence beyond _POLYNOMIAL_MAX_ROWS rows
+                  or when its error bound exceeds _POLYNOMIAL_RTOL)
+            rtol: If given, guarantee this relative accuracy (to first order)
+                  by escalating from float64 to mpmath as needed; only
+                  valid with method='auto'
             
         Returns:
             Value of the generalized Stirling number
             
         Raises:
-            ValueError: If n or k are negative, or if method is not recognized
+            ValueError: If n or k are negative, if method is not recognized,
+                        or if rtol is combined with another method
             
         Examples:
             >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
@@ -249,7 +1458,7 @@ class GeneralizedStirling:
             6.0
             
             >>> gs.compute(5, 3, method='explicit')  # Use explicit formula
-            60.0
+            120.0
             
             >>> gs.compute(4, 2, method='bottom_up')  # Use bottom-up approach
             36.0
@@ -259,10 +1468,19 @@ class GeneralizedStirling:
             raise ValueError(f"n and k must be non-negative, got n={n}, k={k}")
             
         valid_methods = {'auto', 'triangular', 'explicit', 'horizontal', 'vertical', 
-                         'bottom_up', 'symmetric', 'single_list'}
+                         'bottom_up', 'symmetric', 'single_list', 'polynomial'}
         if method not in valid_methods:
             raise ValueError(f"Unknown method: {method}. Valid methods are: {valid_methods}")
         
+        # In exact mode every method reduces to the exact row recurrence
+        if self.exact:
+            return self.compute_exact(n, k)
+        
+        if rtol is not None:
+            if method != 'auto':
+                raise ValueError(f"rtol selects the adaptive-precision path and needs method='auto', got '{method}'")
+            return self.compute_adaptive(n, k, rtol)[0]
+        
         # Handle base cases first for efficiency
         if k == 0:
             return 1.0 if n == 0 else 0.0
@@ -273,6 +1491,21 @@ class GeneralizedStirling:
         if k == n:
             return 1.0  # L_{n,n} = 1
         
+        # Proportional parameter pairs share one cached triangle
+        if self.use_scale_cache and method == 'auto' and self._scaled_table_fits(n, k):
+            return _scaled_triangle_cache.get(self.alpha, self.beta, n, k)
+        
+        # With the disk cache on, 'auto' reads the stored recurrence triangle
+        if self.use_disk_cache and method == 'auto':
+            method = 'triangular'
+        
+        # Lah, first- and second-kind directions have closed forms, used
+        # unless the recurrence to L{n,k} is estimated to be cheaper
+        if method == 'auto' and self._family is not None:
+            value = _family_value(self._family, n, k, max_cost=(n + 1) * (1000 + k))
+            if value is not None:
+                return value
+        
         # For k=1, use the single_list_case formula which is more efficient
         if k == 1:
             return self.single_list_case(n, k)
@@ -295,6 +1528,15 @@ class GeneralizedStirling:
             return method_map[method](n, k)
         elif method == 'vertical':
             return self.vertical_recurrence(n-1, k-1) if n > 0 and k > 0 else self.triangular_recurrence(n, k)
+        elif method == 'polynomial':
+            # The float64 table stops at _POLYNOMIAL_MAX_ROWS and signed
+            # parameters cancel, so fall back to the recurrence past either
+            if n <= _POLYNOMIAL_MAX_ROWS:
+                value, error = polynomial_table(n).compute(n, k, self.alpha, self.beta, return_error=True)
+                if error <= _POLYNOMIAL_RTOL:
+                    return value
+            logger.debug(f"Polynomial table unsuitable for n={n}, k={k}; using the triangular recurrence")
+            return self.triangular_recurrence(n, k)
         elif method == 'symmetric':
             # Note: symmetric function computes L{n+k,n}, so we need to adjust parameters
             if n >= k:
@@ -312,7 +1554,8 @@ class GeneralizedStirling:
         Args:
             n_max: Maximum row number
             format_str: Format string for displaying numbers
-            method: Method to use for computation
+            method: Method to use for computation ('auto' builds whole rows
+                   with the vectorized recurrence, see triangle_array)
             sparse: If True, only store non-zero values as a dictionary
                    If False, return a list of lists (dense representation)
             
@@ -337,12 +1580,24 @@ class GeneralizedStirling:
         if n_max < 0:
             raise ValueError(f"n_max must be non-negative, got {n_max}")
         
+        if method == 'auto' and not (self.use_disk_cache or self.use_scale_cache):
+            # Reuse the rows built by earlier calls and only compute new ones
+            triangle_view = self.lazy_triangle()
+            triangle_view.extend(n_max)
+            value_at = lambda n, k: triangle_view.row(n)[k]
+        elif method == 'auto':
+            # Build whole rows at once instead of dispatching per cell
+            table = self.triangle_array(n_max)
+            value_at = lambda n, k: table[n, k]
+        else:
+            value_at = lambda n, k: self.compute(n, k, method=method)
+        
         if sparse:
             # Return a sparse representation as a dictionary
             triangle = {}
             for n in range(1, n_max + 1):
                 for k in range(1, n + 1):
-                    value = self.compute(n, k, method=method)
+                    value = value_at(n, k)
                     if value != 0:
                         triangle[(n, k)] = format_str.format(value)
             return triangle
@@ -352,821 +1607,2814 @@ class GeneralizedStirling:
             for n in range(1, n_max + 1):
                 row = []
                 for k in range(1, n + 1):
-                    row.append(format_str.format(self.compute(n, k, method=method)))
+                    row.append(format_str.format(value_at(n, k)))
                 triangle.append(row)
             return triangle
     
-    def summary(self) -> None:
+    def lazy_triangle(self) -> 'LazyTriangle':
         """
-        Print a summary of performance statistics.
+        Return the instance's LazyTriangle view, which grows rows on demand.
         
-        This method provides a nicely formatted display of cache performance,
-        computation times, and other metrics.
+        The same view is returned on every call, so rows materialized through
+        it (or by generate_triangle) are never recomputed until clear_cache.
         
-        Examples:
-            >>> gs = GeneralizedStirling()
-            >>> for n in range(1, 10):
-            ...     for k in range(1, n+1):
-            ...         gs.compute(n, k)
-            >>> gs.summary()
-            Performance Summary
-            ------------------
-            Parameters: α=1.0, β=1.0
+        Returns:
+            LazyTriangle over L{n,k}^{α,β}
             
-            Cache Statistics:
-              Total operations: 45
-              Cache hits: 10
-              Cache misses: 35
-              Overall hit ratio: 22.2%
-            
-            Per-Method Statistics:
-              triangular:
-                Operations: 35
-                Hit ratio: 0.0%
-                Compute time: 0.002104 seconds
-              ...
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+            >>> tri = gs.lazy_triangle()
+            >>> tri[5]
+            array([  0., 120., 240., 120.,  20.,   1.])
+            >>> tri[3:6, 2]
+            array([  6.,  36., 240.])
         """
-        stats = self.get_performance_stats()
-        
-        print("\nPerformance Summary")
-        print("-" * 50)
-        print(f"Parameters: α={self.alpha}, β={self.beta}")
-        
-        # Cache statistics
-        total_hits = sum(stats['cache_hits'].values())
-        total_misses = sum(stats['cache_misses'].values())
-        total_operations = total_hits + total_misses
-        hit_ratio = total_hits / total_operations if total_operations > 0 else 0
+        if self._lazy_triangle is None:
+            self._lazy_triangle = LazyTriangle(self)
+        return self._lazy_triangle
+    
+    def _fits_budget(self, nbytes: int) -> bool:
+        """Whether a table of nbytes fits within cache_bytes (always true without a budget)."""
+        return self.cache_bytes is None or nbytes <= self.cache_bytes
+    
+    def _scaled_table_fits(self, n: int, k: int) -> bool:
+        """Whether the shared scaled triangle serving (n, k) fits within cache_bytes."""
+        return self._fits_budget(_scaled_triangle_cache.nbytes_for(self.alpha, self.beta, n, k))
+    
+    def triangle_array(self, n_max: int, k_max: Optional[int] = None) -> np.ndarray:
+        """
+        Compute the triangle of generalized Stirling numbers as a dense array.
         
-        print(f"\nCache Statistics:")
-        print(f"  Total operations: {total_operations}")
-        print(f"  Cache hits: {total_hits}")
-        print(f"  Cache misses: {total_misses}")
-        print(f"  Overall hit ratio: {hit_ratio:.1%}")
+        Whole rows are built at once with the vectorized triangular recurrence
+        L{n,k} = L{n-1,k-1} + (α(n-1) + βk) * L{n-1,k}, so the cost is O(n_max * k_max)
+        NumPy operations with no per-cell dispatch or caching overhead.
         
-        # Per-method statistics
-        print("\nPer-Method Statistics:")
-        for method in sorted(set(list(stats['cache_hits'].keys()) + list(stats['cache_misses'].keys()))):
-            hits = stats['cache_hits'].get(method, 0)
-            misses = stats['cache_misses'].get(method, 0)
-            method_total = hits + misses
-            ratio = hits / method_total if method_total > 0 else 0
-            time = stats['compute_time'].get(method, 0)
+        Args:
+            n_max: Maximum row number
+            k_max: Maximum column number (defaults to n_max)
             
-            print(f"  {method}:")
-            print(f"    Operations: {method_total}")
-            print(f"    Hit ratio: {ratio:.1%}")
-            print(f"    Compute time: {time:.6f} seconds")
-        
-        # Disk cache info
-        if stats['disk_cache_enabled']:
-            print(f"\nDisk Cache:")
-            print(f"  Directory: {stats['disk_cache_dir']}")
-            print(f"  Size: {stats['disk_cache_size'] / 1024:.1f} KB")
+        Returns:
+            Array of shape (n_max+1, k_max+1) where table[n, k] = L{n,k}^{α,β}
+            
+        Raises:
+            ValueError: If n_max or k_max is negative
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+            >>> gs.triangle_array(4)[4]
+            array([ 0., 24., 36., 12.,  1.])
+        """
+        if k_max is None:
+            k_max = n_max
+        if n_max < 0 or k_max < 0:
+            raise ValueError(f"n_max and k_max must be non-negative, got n_max={n_max}, k_max={k_max}")
         
-        print("-" * 50)
+        if self.use_disk_cache:
+            return self._triangle_store.values(n_max, k_max)
+        if self.use_scale_cache and self._scaled_table_fits(n_max, k_max):
+            return _scaled_triangle_cache.triangle(self.alpha, self.beta, n_max, k_max)
+        return _triangle_array(self.alpha, self.beta, n_max, k_max)
     
-    def get_performance_stats(self) -> Dict[str, Any]:
+    def row(self, n: int, method: str = 'recurrence', rtol: float = 1e-10,
+            fallback: Optional[str] = 'recurrence',
+            return_error: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
         """
-        Get performance statistics for the different computation methods.
+        Compute row n of the triangle, L{n,0..n}^{α,β}, as an array.
         
+        method='fft' evaluates the explicit formula for all k at once: it is a
+        binomial convolution in k, computed with one real FFT in O(n log n)
+        (see _fft_row). The alternating sum cancels heavily, so each entry
+        comes with a relative error estimate, and entries estimated worse than
+        rtol are recomputed by the fallback. Cancellation grows with k (the
+        terms of the sum reach about e^n while L{n,n} = 1), so only columns
+        K..n are recomputed, K being the smallest flagged column; column k of
+        row n depends only on a band of n-k+1 columns of each earlier row, so
+        the fallback costs O(n (n-K)) rather than O(n^2). In float64 the FFT
+        mostly supplies the low columns and the band up to the diagonal is
+        recomputed; the error estimates show which entries came from the FFT.
+        
+        Args:
+            n: Row number
+            method: 'recurrence' (row recurrence, O(n^2)) or 'fft'
+            rtol: Largest acceptable estimated relative error of an FFT entry
+            fallback: How flagged FFT entries are recomputed: 'recurrence',
+                      'exact' (rational arithmetic, then rounded) or None to
+                      keep the FFT values
+            return_error: If True, also return the relative error estimates
+            
         Returns:
-            Dictionary containing computation times, cache hits/misses, and hit ratios
+            Array of length n+1 with row[k] = L{n,k}^{α,β}; with return_error,
+            a tuple (row, errors). Recomputed entries report n*ε
+            ('recurrence') or 0 ('exact'), as does the whole row for
+            method='recurrence'
+            
+        Raises:
+            ValueError: If n is negative or method/fallback is not recognized
             
         Examples:
-            >>> gs = GeneralizedStirling()
-            >>> for n in range(1, 5):
-            ...     for k in range(1, n+1):
-            ...         gs.compute(n, k)
-            >>> stats = gs.get_performance_stats()
-            >>> print(f"Cache hit ratio: {stats['hit_ratio']}")
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+            >>> gs.row(5, method='fft')
+            array([  0., 120., 240., 120.,  20.,   1.])
+            >>> values, errors = gs.row(30, method='fft', return_error=True)
+            >>> bool(np.all(errors <= 1e-10))  # Flagged columns were recomputed
+            True
         """
-        stats = {
-            'compute_time': dict(self.compute_time),
-            'cache_hits': dict(self.cache_hits),
-            'cache_misses': dict(self.cache_misses),
-            'hit_ratio': {},
-            'disk_cache_enabled': self.use_disk_cache,
-            'disk_cache_dir': self.cache_dir if self.use_disk_cache else None,
-            'disk_cache_size': 0
-        }
+        if n < 0:
+            raise ValueError(f"n must be non-negative, got {n}")
+        if method not in ('recurrence', 'fft'):
+            raise ValueError(f"Unknown method: {method}. Valid methods are: ('recurrence', 'fft')")
+        if fallback not in ('recurrence', 'exact', None):
+            raise ValueError(f"Unknown fallback: {fallback}. Valid fallbacks are: ('recurrence', 'exact', None)")
         
-        # Calculate hit ratios
-        for method in self.cache_hits:
-            total = self.cache_hits[method] + self.cache_misses[method]
-            if total > 0:
-                stats['hit_ratio'][method] = self.cache_hits[method] / total
-            else:
-                stats['hit_ratio'][method] = 0
+        recurrence_error = n * np.finfo(float).eps
+        if method == 'recurrence' or n == 0 or self.beta == 0:
+            # The explicit formula divides by β^k, so β = 0 always uses the recurrence
+            values = self._row_by_recurrence(n)
+            errors = np.full(n + 1, recurrence_error)
+            return (values, errors) if return_error else values
         
-        # Calculate disk cache size if enabled
-        if self.use_disk_cache and os.path.exists(self.cache_dir):
-            try:
-                total_size = 0
-                for filename in os.listdir(self.cache_dir):
-                    if filename.endswith('.pkl'):
-                        total_size += os.path.getsize(os.path.join(self.cache_dir, filename))
-                stats['disk_cache_size'] = total_size
-            except OSError:
-                pass
+        values, errors = _fft_row(self.alpha, self.beta, n)
+        values[0], errors[0] = 0.0, 0.0  # L{n,0} = 0 for n > 0
         
-        return stats
+        flagged = np.nonzero(errors > rtol)[0]
+        if flagged.size and fallback is not None:
+            k_min = int(flagged.min())
+            logger.debug(f"FFT row {n}: recomputing columns {k_min}..{n} with fallback '{fallback}'")
+            if fallback == 'recurrence':
+                values[k_min:] = self._row_by_recurrence(n, k_min)[k_min:]
+                errors[k_min:] = recurrence_error
+            else:
+                a, b, d = self._exact_params
+                for _, exact_row in _iter_exact_rows(a, b, n, n):
+                    pass
+                values[k_min:] = [float(_exact_value(exact_row[k], d, n - k)) for k in range(k_min, n + 1)]
+                errors[k_min:] = 0.0
+        return (values, errors) if return_error else values
     
-    def clear_cache(self) -> None:
+    def _row_by_recurrence(self, n: int, k_min: int = 0) -> np.ndarray:
         """
-        Clear all caches to free memory.
+        Return row n from the row recurrence, correct in columns k_min..n.
         
-        This clears both the in-memory cache and disk cache if enabled.
+        Column k of row n needs columns k-(n-m)..m of row m, so row m is only
+        advanced on that band; entries below k_min are left at zero.
+        """
+        current = np.zeros(n + 1)
+        current[0] = 1.0
+        spare = np.zeros(n + 1)
+        with np.errstate(over='ignore', invalid='ignore'):
+            for m in range(1, n + 1):
+                lo = max(0, k_min - (n - m))
+                ks = np.arange(lo, m + 1, dtype=float)
+                spare[lo:m + 1] = (self.alpha * (m - 1) + self.beta * ks) * current[lo:m + 1]
+                if lo > 0:
+                    spare[lo:m + 1] += current[lo - 1:m]
+                else:
+                    spare[1:m + 1] += current[:m]
+                current, spare = spare, current
+        return current
+    
+    def compute_many(self, ns: Any, ks: Any) -> np.ndarray:
+        """
+        Compute L{n,k}^{α,β} for many (n, k) queries in one row sweep.
         
-        Returns:
-            None
+        The queries are grouped by n and the row recurrence is run once up to
+        the largest n, reading every query off its row as the sweep passes it.
+        The cost is one O(max(n) * max(k)) sweep however many queries there
+        are, with no per-query method selection or caching.
         
+        Args:
+            ns: Row numbers (int or array, broadcast against ks)
+            ks: Column numbers (int or array, broadcast against ns)
+            
+        Returns:
+            Float array of the broadcast shape with result[i] = L{ns[i], ks[i]}
+            
+        Raises:
+            ValueError: If any n or k is negative
+            
         Examples:
-            >>> gs = GeneralizedStirling()
-            >>> gs.compute(10, 5)  # Compute a value
-            >>> gs.clear_cache()   # Clear all caches
-            >>> stats = gs.get_performance_stats()  # Should show 0 cache hits
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+            >>> gs.compute_many([4, 3, 4, 9], [2, 2, 5, 1])
+            array([3.6000e+01, 6.0000e+00, 0.0000e+00, 3.6288e+05])
         """
-        self._memory_cache.clear()
-        self.triangular_recurrence.cache_clear()
-        
-        # Clear disk cache if enabled
-        if self.use_disk_cache and os.path.exists(self.cache_dir):
-            try:
-                for filename in os.listdir(self.cache_dir):
-                    if filename.endswith('.pkl'):
-                        os.remove(os.path.join(self.cache_dir, filename))
-                logger.info(f"Cleared disk cache in {self.cache_dir}")
-            except OSError as e:
-                logger.warning(f"Failed to clear disk cache: {e}")
-        
-        # Reset performance counters
-        self.compute_time.clear()
-        self.cache_hits.clear()
-        self.cache_misses.clear()
+        if self.exact:
+            return self.compute_many_exact(ns, ks)
+        ns, ks, shape = _query_arrays(ns, ks)
+        result = np.zeros(ns.size)
+        if ns.size:
+            k_max = int(min(ks.max(), ns.max()))
+            for positions, _, (row,) in _gather_queries(_iter_rows(self.alpha, self.beta, int(ns.max()), k_max), ns):
+                positions = positions[ks[positions] <= k_max]
+                result[positions] = row[ks[positions]]
+        return result.reshape(shape)
     
-    #---------------------------------------------------------------------------
-    # Computational methods - each implements a different algorithm
-    #---------------------------------------------------------------------------
-    
-    @disk_cache_decorator
-    def explicit_formula(self, n: int, k: int) -> float:
+    def compute_adaptive(self, n: int, k: int, rtol: float = 1e-12,
+                         max_dps: int = _ADAPTIVE_MAX_DPS) -> Tuple[float, float, int]:
         """
-        Compute L{n,k}^{α,β} using the explicit formula.
+        Compute L{n,k}^{α,β} to a relative accuracy, escalating precision only when needed.
         
-        Formula: L{n,k}^{α,β} = (1/(β^k * k!)) * ∑_{j=0}^k (-1)^j * C(k,j) * (β(k-j)|α)^n̄
+        The triangular recurrence first runs in float64 alongside a running
+        first-order bound on its rounding error (see _float_value_with_bound).
+        For same-sign weights the bound stays near n*ε and float64 is
+        returned; when negative α or β make the recurrence cancel, the bound
+        shows it, and the recurrence is re-run in mpmath with the same bound,
+        starting at enough digits to cover the observed loss and doubling the
+        precision until the bound meets rtol or max_dps is reached.
         
-        This is an inclusion-exclusion formula derived from the combinatorial 
-        interpretation of generalized Stirling numbers.
+        Results are cached as (value, bound, digits), so a later call with the
+        same or a looser rtol is a lookup and a stricter one resumes from the
+        precision already reached.
         
         Args:
             n: Number of elements
             k: Number of ordered lists
+            rtol: Required relative accuracy
+            max_dps: Largest mpmath precision to try, in decimal digits
             
         Returns:
-            Value of the generalized Stirling number
+            Tuple (value, relative_error_bound, digits), where digits is the
+            working precision that was used (15 for float64) and the bound
+            applies before the final rounding to float64. Values beyond the
+            float64 range are returned as ±inf
             
-        Examples:
-            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
-            >>> gs.explicit_formula(3, 2)
-            6.0
+        Raises:
+            ValueError: If n or k are negative or rtol is not positive
             
-            >>> gs = GeneralizedStirling(alpha=0.0, beta=1.0)
-            >>> gs.explicit_formula(4, 2)  # Stirling number of the second kind
-            7.0
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=-0.75, beta=2.0)
+            >>> value, bound, digits = gs.compute_adaptive(60, 20, rtol=1e-12)
+            >>> digits  # float64 is certified to 1e-12
+            15
+            >>> value, bound, digits = gs.compute_adaptive(60, 20, rtol=1e-15)
+            >>> digits > 15, bound <= 1e-15  # but not to 1e-15
+            (True, True)
         """
-        # Handle base cases
-        if k == 0:
-            return 1.0 if n == 0 else 0.0
-        if n == 0 or k > n:
-            return 0.0
-        if k == n:
-            return 1.0
+        if n < 0 or k < 0:
+            raise ValueError(f"n and k must be non-negative, got n={n}, k={k}")
+        if not rtol > 0:
+            raise ValueError(f"rtol must be positive, got {rtol}")
         
-        # Special case for k=1
-        if k == 1:
-            return self.single_list_case(n)
+        cache_key = ('adaptive', n, k)
+        cached = self._memory_cache.get(cache_key)
+        if cached is not None and cached[1] <= rtol:
+            self.cache_hits['adaptive'] += 1
+            return cached
+        self.cache_misses['adaptive'] += 1
+        start_time = time.time()
         
-        # Main computation with numerical stability improvements
-        # For large values, compute in log space
-        if n > 50 or k > 20:
-            try:
-                return self._explicit_formula_log_space(n, k)
-            except (OverflowError, ValueError) as e:
-                warnings.warn(f"Numerical issues in explicit formula with n={n}, k={k}: {e}")
-                # Fall back to triangular recurrence
-                return self.triangular_recurrence(n, k)
+        if cached is None:
+            value, bound = _float_value_with_bound(self.alpha, self.beta, n, k)
+            if not math.isfinite(value):
+                # Values beyond the float64 range come back as ±inf without escalating
+                log_value, sign = self.compute_log(n, k)
+                if log_value > math.log(sys.float_info.max):
+                    result = (math.copysign(math.inf, sign), 0.0, sys.float_info.dig)
+                    self._memory_cache[cache_key] = result
+                    return result
+            if not (math.isfinite(value) and math.isfinite(bound)):
+                # Intermediate overflow (or inf - inf) in float64: escalate
+                relative = math.inf
+            elif value == 0:
+                relative = 0.0 if bound == 0 or _is_exact_zero(self.alpha, self.beta, n, k) else math.inf
+            else:
+                relative = bound / abs(value)
+            digits = sys.float_info.dig
+            # Digits lost to cancellation in float64 are lost at any precision
+            lost = math.log10(relative / (sys.float_info.epsilon / 2)) if 0 < relative < math.inf else 0.0
+            dps = max(_ADAPTIVE_START_DPS, math.ceil(lost - math.log10(rtol)) + 10)
         else:
-            return self._explicit_formula_direct(n, k)
+            value, relative, digits = cached
+            dps = 2 * max(digits, _ADAPTIVE_START_DPS // 2)
+        
+        if not relative <= rtol and not HAS_MPMATH:
+            warnings.warn(f"L{{{n},{k}}} has an estimated relative error of {relative:.3g} > rtol={rtol} "
+                          f"in float64 and mpmath is not installed")
+        elif not relative <= rtol:
+            while True:
+                mp_value, mp_bound = _mpmath_value_with_bound(self.alpha, self.beta, n, k, dps)
+                value = float(mp_value)
+                if mp_value != 0:
+                    relative = float(mp_bound / abs(mp_value))
+                else:
+                    relative = 0.0 if mp_bound == 0 or _is_exact_zero(self.alpha, self.beta, n, k) else math.inf
+                digits = dps
+                logger.debug(f"Adaptive L{{{n},{k}}}: {dps} digits, relative error bound {relative:.3g}")
+                if relative <= rtol or dps >= max_dps:
+                    break
+                dps = min(2 * dps, max_dps)
+            if not relative <= rtol:
+                warnings.warn(f"L{{{n},{k}}} did not reach rtol={rtol} at {dps} digits "
+                              f"(relative error bound {relative:.3g})")
+        
+        result = (value, relative, digits)
+        self._memory_cache[cache_key] = result
+        self.compute_time['adaptive'] += time.time() - start_time
+        return result
     
-    @disk_cache_decorator
-    @lru_cache(maxsize=10000)
-    def triangular_recurrence(self, n: int, k: int) -> float:
+    def compute_log(self, n: int, k: int) -> Tuple[float, float]:
         """
-        Compute L{n,k}^{α,β} using the triangular recurrence relation.
+        Compute L{n,k}^{α,β} in the log domain as (log|L|, sign).
         
-        L{n,k}^{α,β} = L{n-1,k-1}^{α,β} + (α(n-1) + βk) * L{n-1,k}^{α,β}
-        
-        This recurrence relation has a clear combinatorial interpretation:
-        - The first term represents placing element n in its own list
-        - The second term represents placing element n into an existing list,
-          either after an element (weight α) or at the head (weight β)
+        The triangular recurrence is run over whole rows of (log|L|, sign)
+        arrays with a signed log-sum-exp, so values far beyond the float64
+        range (n in the tens of thousands) are represented without overflow.
+        Ratios of huge values can then be formed as exp(log_a - log_b).
+        Lah, first- and second-kind directions take the log of the exact
+        closed-form value instead.
         
         Args:
             n: Number of elements
             k: Number of ordered lists
             
         Returns:
-            Value of the generalized Stirling number
+            Tuple (log|L{n,k}|, sign) where sign is 1.0, -1.0 or 0.0;
+            zero values are returned as (-inf, 0.0)
+            
+        Raises:
+            ValueError: If n or k are negative
             
         Examples:
             >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
-            >>> gs.triangular_recurrence(3, 2)
-            6.0
+            >>> log_value, sign = gs.compute_log(4, 2)
+            >>> round(sign * math.exp(log_value))
+            36
+        """
+        if n < 0 or k < 0:
+            raise ValueError(f"n and k must be non-negative, got n={n}, k={k}")
+        if k > n:
+            return float('-inf'), 0.0
+        if self.use_disk_cache:
+            return self._triangle_store.log_value(n, k)
+        if self.use_scale_cache and self._scaled_table_fits(n, k):
+            return _scaled_triangle_cache.get_log(self.alpha, self.beta, n, k)
+        
+        cache_key = ('log', n, k)
+        if cache_key in self._memory_cache:
+            self.cache_hits['log'] += 1
+            return self._memory_cache[cache_key]
+        
+        self.cache_misses['log'] += 1
+        start_time = time.time()
+        
+        result = None
+        if self._family is not None:
+            result = _family_log(self._family, n, k, max_cost=(n + 1) * (1000 + k))
+        if result is None:
+            # Only columns 0..k are needed to reach L{n,k}
+            for _, log_row, sign_row in _iter_log_rows(self.alpha, self.beta, n, k):
+                pass
+            result = (float(log_row[k]), float(sign_row[k]))
+        
+        self._memory_cache[cache_key] = result
+        self.compute_time['log'] += time.time() - start_time
+        return result
+    
+    def log_triangle(self, n_max: int, k_max: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the triangle of generalized Stirling numbers in the log domain.
+        
+        Args:
+            n_max: Maximum row number
+            k_max: Maximum column number (defaults to n_max)
             
-            >>> gs = GeneralizedStirling(alpha=1.0, beta=0.0)
-            >>> gs.triangular_recurrence(4, 2)  # Stirling number of the first kind
-            11.0
+        Returns:
+            Tuple (log_table, sign_table) of arrays with shape (n_max+1, k_max+1)
+            where L{n,k}^{α,β} = sign_table[n, k] * exp(log_table[n, k])
+            
+        Raises:
+            ValueError: If n_max or k_max is negative
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+            >>> log_table, sign_table = gs.log_triangle(500)
+            >>> bool(np.isfinite(log_table[500, 250]))
+            True
         """
-        return self.triangular_recurrence_internal(n, k)
+        if k_max is None:
+            k_max = n_max
+        if n_max < 0 or k_max < 0:
+            raise ValueError(f"n_max and k_max must be non-negative, got n_max={n_max}, k_max={k_max}")
+        
+        return _log_triangle_arrays(self.alpha, self.beta, n_max, k_max)
     
-    @disk_cache_decorator
-    def bottom_up_computation(self, n: int, k: int) -> float:
+    def compute_many_log(self, ns: Any, ks: Any) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Compute L{n,k}^{α,β} using a bottom-up dynamic programming approach.
+        Compute many (n, k) queries in the log domain in one row sweep.
         
-        This method builds a table of values from smaller to larger parameters,
-        which is more efficient for computing a single value when n and k are large.
-        It avoids the recursion depth issues that can occur with the triangular
-        recurrence relation.
+        Log-domain counterpart of compute_many, for queries whose values
+        overflow float64.
         
         Args:
-            n: Number of elements
-            k: Number of ordered lists
+            ns: Row numbers (int or array, broadcast against ks)
+            ks: Column numbers (int or array, broadcast against ns)
             
         Returns:
-            Value of the generalized Stirling number
+            Tuple (log_values, signs) of float arrays of the broadcast shape,
+            with zero values as (-inf, 0.0)
+            
+        Raises:
+            ValueError: If any n or k is negative
             
         Examples:
             >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
-            >>> gs.bottom_up_computation(3, 2)
-            6.0
-            
-            >>> gs = GeneralizedStirling(alpha=1.0, beta=0.0)
-            >>> gs.bottom_up_computation(4, 2)  # Stirling number of the first kind
-            11.0
+            >>> log_values, signs = gs.compute_many_log([1000, 2000], [10, 3])
+            >>> bool(np.all(np.isfinite(log_values)))
+            True
         """
-        # Handle base cases
-        if k == 0:
-            return 1.0 if n == 0 else 0.0
-        if n == 0 or k > n:
-            return 0.0
-        if k == n:
-            return 1.0
-        if k == 1:
-            return self.single_list_case(n)
+        ns, ks, shape = _query_arrays(ns, ks)
+        log_values = np.full(ns.size, -np.inf)
+        signs = np.zeros(ns.size)
+        if ns.size:
+            k_max = int(min(ks.max(), ns.max()))
+            rows = _iter_log_rows(self.alpha, self.beta, int(ns.max()), k_max)
+            for positions, _, (log_row, sign_row) in _gather_queries(rows, ns):
+                positions = positions[ks[positions] <= k_max]
+                log_values[positions] = log_row[ks[positions]]
+                signs[positions] = sign_row[ks[positions]]
+        return log_values.reshape(shape), signs.reshape(shape)
+    
+    def compute_exact(self, n: int, k: int) -> Union[int, Fraction]:
+        """
+        Compute L{n,k}^{α,β} exactly.
         
-        # Create a 2D table for dynamic programming
-        # Only need to store two rows at a time to save memory
-        current_row = [0.0] * (k+1)
-        next_row = [0.0] * (k+1)
+        α and β are written over a shared denominator d as a/d and b/d, the
+        triangular recurrence is run over whole rows of Python ints for (a, b),
+        and the result is divided by d^{n-k}. Integer parameters therefore never
+        touch a Fraction. Lah, first- and second-kind directions are computed
+        from their closed forms instead.
         
-        # Base cases
-        current_row[0] = 1.0 if 0 == 0 else 0.0
-        for j in range(1, k+1):
-            current_row[j] = 0.0
+        Args:
+            n: Number of elements
+            k: Number of ordered lists
+            
+        Returns:
+            The exact value as an int, or a Fraction if it is not integral
+            
+        Raises:
+            ValueError: If n or k are negative
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1, beta=1)
+            >>> gs.compute_exact(30, 3)
+            17948776847291594967723540480000000
+            
+            >>> gs = GeneralizedStirling(alpha=Fraction(1, 2), beta=1)
+            >>> gs.compute_exact(4, 2)
+            Fraction(75, 4)
+        """
+        if n < 0 or k < 0:
+            raise ValueError(f"n and k must be non-negative, got n={n}, k={k}")
+        if k > n:
+            return 0
         
-        # Fill the table row by row
-        for i in range(1, n+1):
-            next_row[0] = 0.0
-            for j in range(1, min(i, k)+1):
-                if i == j:
-                    next_row[j] = 1.0
+        cache_key = ('exact', n, k)
+        if cache_key in self._memory_cache:
+            self.cache_hits['exact'] += 1
+            return self._memory_cache[cache_key]
+        
+        self.cache_misses['exact'] += 1
+        start_time = time.time()
+        
+        a, b, d = self._exact_params
+        family = _classical_family(Fraction(a, d), Fraction(b, d))
+        result = _family_exact(family, n, k) if family is not None else None
+        if result is None:
+            for _, row in _iter_exact_rows(a, b, n, k):
+                pass
+            result = _exact_value(row[k], d, n - k)
+        
+        self._memory_cache[cache_key] = result
+        self.compute_time['exact'] += time.time() - start_time
+        return result
+    
+    def exact_triangle(self, n_max: int, k_max: Optional[int] = None) -> np.ndarray:
+        """
+        Compute the triangle of generalized Stirling numbers exactly.
+        
+        Args:
+            n_max: Maximum row number
+            k_max: Maximum column number (defaults to n_max)
+            
+        Returns:
+            Object array of shape (n_max+1, k_max+1) holding ints (or Fractions
+            for non-integral values) with table[n, k] = L{n,k}^{α,β}
+            
+        Raises:
+            ValueError: If n_max or k_max is negative
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1, beta=0)
+            >>> gs.exact_triangle(4)[4].tolist()
+            [0, 6, 11, 6, 1]
+        """
+        if k_max is None:
+            k_max = n_max
+        if n_max < 0 or k_max < 0:
+            raise ValueError(f"n_max and k_max must be non-negative, got n_max={n_max}, k_max={k_max}")
+        
+        a, b, d = self._exact_params
+        table = np.zeros((n_max + 1, k_max + 1), dtype=object)
+        for n, row in _iter_exact_rows(a, b, n_max, k_max):
+            if d == 1:
+                table[n] = row
+            else:
+                for k in range(min(n, k_max) + 1):
+                    table[n, k] = _exact_value(row[k], d, n - k)
+        return table
+    
+    def compute_many_exact(self, ns: Any, ks: Any) -> np.ndarray:
+        """
+        Compute many (n, k) queries exactly in one integer row sweep.
+        
+        Exact counterpart of compute_many, returning the same values as
+        compute_exact.
+        
+        Args:
+            ns: Row numbers (int or array, broadcast against ks)
+            ks: Column numbers (int or array, broadcast against ns)
+            
+        Returns:
+            Object array of the broadcast shape holding ints (or Fractions
+            for non-integral values)
+            
+        Raises:
+            ValueError: If any n or k is negative
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1, beta=0)
+            >>> gs.compute_many_exact([30, 5], [3, 2])
+            array([62262192842035613491057459200000, 50], dtype=object)
+        """
+        ns, ks, shape = _query_arrays(ns, ks)
+        result = np.zeros(ns.size, dtype=object)
+        if ns.size:
+            a, b, d = self._exact_params
+            k_max = int(min(ks.max(), ns.max()))
+            for positions, n, (row,) in _gather_queries(_iter_exact_rows(a, b, int(ns.max()), k_max), ns):
+                for i in positions[ks[positions] <= k_max]:
+                    result[i] = _exact_value(row[ks[i]], d, n - int(ks[i]))
+        return result.reshape(shape)
+    
+    def column(self, k: int, n_max: int, method: str = 'auto',
+               log: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Compute column k of the triangle, L{k..n_max, k}^{α,β}, as an array.
+        
+        method='series' reads the column off its exponential generating
+        function f(t)^k / k!, f(t) = ((1-αt)^(-β/α) - 1)/β, raising the
+        truncated series of f(t)/t to the k-th power in log space (see
+        _log_column). It needs only the n_max-k+1 coefficients of the column
+        and costs O((n_max-k)^2 log k), so it is cheapest for columns close to
+        the diagonal. method='recurrence' runs the log-space row recurrence on
+        columns 0..k only, at O(n_max k). method='closed_form' is available for
+        the Lah, first- and second-kind directions: Lah columns step by an
+        exact ratio, first-kind columns are read from the shared table (the
+        recurrence takes over past its last row), and second-kind columns
+        evaluate the power-sum formula, advancing its k+1 powers by one
+        product per row. 'auto' picks the cheapest available.
+        None of them touches the rest of the triangle or any cache.
+        
+        Args:
+            k: Column number
+            n_max: Last row number
+            method: 'auto', 'series', 'recurrence' or 'closed_form'
+            log: If True, return (log|L|, sign) arrays instead of values
+            
+        Returns:
+            Float array of length n_max-k+1 with column[m] = L{k+m, k}
+            (inf where a value overflows), or with log=True a tuple
+            (log_values, signs) with zero values as (-inf, 0.0). Empty if
+            n_max < k
+            
+        Raises:
+            ValueError: If k or n_max is negative, method is not recognized,
+                        or 'closed_form' is requested outside the classical
+                        directions
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=0.0, beta=1.0)
+            >>> gs.column(2, 6, method='closed_form')
+            array([ 1.,  3.,  7., 15., 31.])
+            >>> gs.column(2, 6, method='series')
+            array([ 1.,  3.,  7., 15., 31.])
+            >>> log_values, signs = gs.column(2, 5000, log=True)
+            >>> round(float(log_values[-1]), 3)  # log S(5000, 2) = log(2^4999 - 1)
+            3465.043
+        """
+        if k < 0 or n_max < 0:
+            raise ValueError(f"k and n_max must be non-negative, got k={k}, n_max={n_max}")
+        if method not in ('auto', 'series', 'recurrence', 'closed_form'):
+            raise ValueError(f"Unknown method: {method}. "
+                             f"Valid methods are: ('auto', 'series', 'recurrence', 'closed_form')")
+        if method == 'closed_form' and self._family is None:
+            raise ValueError(f"method='closed_form' needs a Lah, first- or second-kind direction, "
+                             f"got α={self.alpha}, β={self.beta}")
+        
+        size = n_max - k + 1
+        if size <= 0:
+            empty = np.zeros(0)
+            return (empty, empty.copy()) if log else empty
+        
+        if method == 'auto':
+            # Measured costs: one log-space row step is about as expensive as
+            # 1000 series terms, and each series product forms size^2/2 terms
+            products = k.bit_length() - 1 + bin(k).count('1') if k else 0
+            series_cost = products * size * size / 2
+            recurrence_cost = (n_max + 1) * (1000 + k)
+            method = 'series' if series_cost < recurrence_cost else 'recurrence'
+            # Lah and tabulated first-kind columns are nearly free; each big-int
+            # product of the power sum costs about n_max log2(k) / 200 series terms
+            if self._family is not None:
+                if self._family[0] == 'second':
+                    closed_cost = k * size * n_max * math.log2(k + 2) / 200
                 else:
-                    next_row[j] = current_row[j-1] + (self.alpha * (i-1) + self.beta * j) * current_row[j]
+                    closed_cost = _family_cost(self._family, n_max, k)
+                if closed_cost < min(series_cost, recurrence_cost):
+                    method = 'closed_form'
+        
+        units = _family_column(self._family, k, n_max) if method == 'closed_form' else None
+        if units is not None:
+            scale = self._family[1]
+            if not log:
+                return np.array([_scaled_float(unit, scale, m) for m, unit in enumerate(units)])
+            log_values, signs = np.array([_scaled_log(unit, scale, m) for m, unit in enumerate(units)]).T
+            return log_values, signs
+        
+        if method == 'series':
+            log_values, signs = _log_column(self.alpha, self.beta, k, n_max)
+        else:
+            log_values = np.empty(size)
+            signs = np.empty(size)
+            for n, log_row, sign_row in _iter_log_rows(self.alpha, self.beta, n_max, k):
+                if n >= k:
+                    log_values[n - k], signs[n - k] = log_row[k], sign_row[k]
+        
+        if log:
+            return log_values, signs
+        with np.errstate(over='ignore'):
+            return signs * np.exp(log_values)
+    
+    def write_bfile(self, path: str, n_max: int, offset: int = 1) -> int:
+        """
+        Write the triangle rows 1..n_max in OEIS b-file format.
+        
+        Entries L{n,k} for 1 <= k <= n are read by rows and written as
+        "index value" lines. Rows are streamed from the exact recurrence, so
+        only one row is held in memory regardless of n_max. The file is
+        written under a temporary name and renamed on success.
+        
+        Args:
+            path: Output file path
+            n_max: Last row to write
+            offset: Index of the first entry
             
-            # Swap rows for next iteration
-            current_row, next_row = next_row, current_row
+        Returns:
+            Number of entries written
+            
+        Raises:
+            ValueError: If n_max is negative or an entry is not an integer
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1, beta=1)
+            >>> gs.write_bfile("b008297.txt", 3)
+            6
+        """
+        if n_max < 0:
+            raise ValueError(f"n_max must be non-negative, got {n_max}")
         
-        return current_row[k]
+        a, b, d = self._exact_params
+        index = offset
+        
+        # Python 3.11+ refuses to print ints longer than 4300 digits by default
+        previous_limit = sys.get_int_max_str_digits() if hasattr(sys, 'get_int_max_str_digits') else None
+        if previous_limit is not None:
+            sys.set_int_max_str_digits(0)
+        # Write to a temporary file and rename it, so a failure leaves no truncated b-file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                for n, row in _iter_exact_rows(a, b, n_max, n_max):
+                    for k in range(1, n + 1):
+                        value = _exact_value(row[k], d, n - k)
+                        if isinstance(value, Fraction):
+                            raise ValueError(f"L{{{n},{k}}} = {value} is not an integer")
+                        f.write(f"{index} {value}\n")
+                        index += 1
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            if previous_limit is not None:
+                sys.set_int_max_str_digits(previous_limit)
+        return index - offset
     
-    def horizontal_recurrence(self, n: int, k: int) -> float:
+    def compute_mod(self, n: int, k: int, p: int) -> int:
+        """
+        Compute L{n,k}^{α,β} modulo p.
+        
+        α and β are read as rationals a/d and b/d; the integer recurrence for
+        (a, b) runs in int64 row vectors modulo p and the result is scaled by
+        d^{-(n-k)} mod p.
+        
+        Args:
+            n: Number of elements
+            k: Number of ordered lists
+            p: Modulus with 2 <= p < 2^31 and gcd(p, d) = 1
+            
+        Returns:
+            The residue of L{n,k}^{α,β} in [0, p)
+            
+        Raises:
+            ValueError: If n or k are negative, p is out of range, or the
+                        denominator of α, β is not invertible modulo p
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1, beta=1)
+            >>> gs.compute_mod(100, 50, 1000000007)
+            292877136
+        """
+        if n < 0 or k < 0:
+            raise ValueError(f"n and k must be non-negative, got n={n}, k={k}")
+        if not 2 <= p < _MAX_MODULUS:
+            raise ValueError(f"p must satisfy 2 <= p < 2^31, got {p}")
+        if k > n:
+            return 0
+        
+        cache_key = ('mod', n, k, p)
+        if cache_key in self._memory_cache:
+            self.cache_hits['mod'] += 1
+            return self._memory_cache[cache_key]
+        
+        self.cache_misses['mod'] += 1
+        start_time = time.time()
+        
+        a, b, d = self._exact_params
+        if math.gcd(d, p) != 1:
+            raise ValueError(f"Denominator {d} of alpha, beta is not invertible modulo {p}")
+        # Only the current row is kept, so memory is O(k)
+        for _, row in _iter_mod_rows(a, b, n, k, p):
+            pass
+        result = int(row[k]) * pow(d, -(n - k), p) % p
+        
+        self._memory_cache[cache_key] = result
+        self.compute_time['mod'] += time.time() - start_time
+        return result
+    
+    def triangle_mod(self, n_max: int, p: int, k_max: Optional[int] = None) -> np.ndarray:
+        """
+        Compute the triangle of generalized Stirling numbers modulo p.
+        
+        Args:
+            n_max: Maximum row number
+            p: Modulus with 2 <= p < 2^31 and gcd(p, d) = 1
+            k_max: Maximum column number (defaults to n_max)
+            
+        Returns:
+            int64 array of shape (n_max+1, k_max+1) with residues in [0, p)
+            
+        Raises:
+            ValueError: If n_max or k_max is negative, p is out of range, or the
+                        denominator of α, β is not invertible modulo p
+        """
+        if k_max is None:
+            k_max = n_max
+        if n_max < 0 or k_max < 0:
+            raise ValueError(f"n_max and k_max must be non-negative, got n_max={n_max}, k_max={k_max}")
+        if not 2 <= p < _MAX_MODULUS:
+            raise ValueError(f"p must satisfy 2 <= p < 2^31, got {p}")
+        
+        a, b, d = self._exact_params
+        if math.gcd(d, p) != 1:
+            raise ValueError(f"Denominator {d} of alpha, beta is not invertible modulo {p}")
+        return _triangle_mod(a, b, d, n_max, k_max, p)
+    
+    def summary(self) -> None:
+        """
+        Print a summary of performance statistics.
+        
+        This method provides a nicely formatted display of cache performance,
+        computation times, and other metrics.
+        
+        Examples:
+            >>> gs = GeneralizedStirling()
+            >>> for n in range(1, 10):
+            ...     for k in range(1, n+1):
+            ...         gs.compute(n, k)
+            >>> gs.summary()
+            Performance Summary
+            ------------------
+            Parameters: α=1.0, β=1.0
+            
+            Cache Statistics:
+              Total operations: 45
+              Cache hits: 10
+              Cache misses: 35
+              Overall hit ratio: 22.2%
+            
+            Per-Method Statistics:
+              triangular:
+                Operations: 35
+                Hit ratio: 0.0%
+                Compute time: 0.002104 seconds
+              ...
+        """
+        stats = self.get_performance_stats()
+        
+        print("\nPerformance Summary")
+        print("-" * 50)
+        print(f"Parameters: α={self.alpha}, β={self.beta}")
+        
+        # Cache statistics
+        total_hits = sum(stats['cache_hits'].values())
+        total_misses = sum(stats['cache_misses'].values())
+        total_operations = total_hits + total_misses
+        hit_ratio = total_hits / total_operations if total_operations > 0 else 0
+        
+        print(f"\nCache Statistics:")
+        print(f"  Total operations: {total_operations}")
+        print(f"  Cache hits: {total_hits}")
+        print(f"  Cache misses: {total_misses}")
+        print(f"  Overall hit ratio: {hit_ratio:.1%}")
+        
+        # Per-method statistics
+        print("\nPer-Method Statistics:")
+        for method in sorted(set(list(stats['cache_hits'].keys()) + list(stats['cache_misses'].keys()))):
+            hits = stats['cache_hits'].get(method, 0)
+            misses = stats['cache_misses'].get(method, 0)
+            method_total = hits + misses
+            ratio = hits / method_total if method_total > 0 else 0
+            time = stats['compute_time'].get(method, 0)
+            
+            print(f"  {method}:")
+            print(f"    Operations: {method_total}")
+            print(f"    Hit ratio: {ratio:.1%}")
+            print(f"    Compute time: {time:.6f} seconds")
+        
+        # Disk cache info
+        if stats['disk_cache_enabled']:
+            print(f"\nDisk Cache:")
+            print(f"  Directory: {stats['disk_cache_dir']}")
+            print(f"  Size: {stats['disk_cache_size'] / 1024:.1f} KB")
+        
+        print("-" * 50)
+    
+    def get_performance_stats(self) -> Dict[str, Any]:
+        """
+        Get performance statistics for the different computation methods.
+        
+        Returns:
+            Dictionary containing computation times, cache hits/misses, and hit ratios
+            
+        Examples:
+            >>> gs = GeneralizedStirling()
+            >>> for n in range(1, 5):
+            ...     for k in range(1, n+1):
+            ...         gs.compute(n, k)
+            >>> stats = gs.get_performance_stats()
+            >>> print(f"Cache hit ratio: {stats['hit_ratio']}")
+        """
+        stats = {
+            'compute_time': dict(self.compute_time),
+            'cache_hits': dict(self.cache_hits),
+            'cache_misses': dict(self.cache_misses),
+            'hit_ratio': {},
+            'disk_cache_enabled': self.use_disk_cache,
+            'disk_cache_dir': self.cache_dir if self.use_disk_cache else None,
+            'disk_cache_size': 0,
+            'evictions': self._memory_cache.evictions,
+            'memory_cache': {
+                'entries': len(self._memory_cache),
+                'bytes': self._memory_cache.nbytes,
+                'evictions': self._memory_cache.evictions,
+                'policy': self._memory_cache.policy,
+                'max_entries': self._memory_cache.max_entries,
+                'max_bytes': self._memory_cache.max_bytes
+            }
+        }
+        
+        if self.use_scale_cache:
+            stats['scale_cache'] = {
+                'hits': _scaled_triangle_cache.hits,
+                'misses': _scaled_triangle_cache.misses,
+                'directions': len(_scaled_triangle_cache._entries)
+            }
+        
+        # Calculate hit ratios
+        for method in self.cache_hits:
+            total = self.cache_hits[method] + self.cache_misses[method]
+            if total > 0:
+                stats['hit_ratio'][method] = self.cache_hits[method] / total
+            else:
+                stats['hit_ratio'][method] = 0
+        
+        # Calculate disk cache size if enabled
+        if self.use_disk_cache:
+            try:
+                stats['disk_cache_size'] = self._triangle_store.nbytes()
+            except OSError:
+                pass
+            stats['disk_cache_rows'] = self._triangle_store.n_max()
+        
+        return stats
+    
+    def clear_cache(self) -> None:
+        """
+        Clear all caches to free memory.
+        
+        This clears both the in-memory cache and disk cache if enabled.
+        
+        Returns:
+            None
+        
+        Examples:
+            >>> gs = GeneralizedStirling()
+            >>> gs.compute(10, 5)  # Compute a value
+            >>> gs.clear_cache()   # Clear all caches
+            >>> stats = gs.get_performance_stats()  # Should show 0 cache hits
+        """
+        self._memory_cache.clear()
+        self._memory_cache.resize(self.cache_bytes)
+        self._lazy_triangle = None
+        
+        # Clear disk cache if enabled
+        if self.use_disk_cache:
+            try:
+                self._triangle_store.clear()
+                logger.info(f"Cleared disk cache in {self.cache_dir}")
+            except OSError as e:
+                logger.warning(f"Failed to clear disk cache: {e}")
+        
+        # Reset performance counters
+        self.compute_time.clear()
+        self.cache_hits.clear()
+        self.cache_misses.clear()
+    
+    #---------------------------------------------------------------------------
+    # Computational methods - each implements a different algorithm
+    #---------------------------------------------------------------------------
+    
+    @disk_cache_decorator
+    def explicit_formula(self, n: int, k: int) -> float:
+        """
+        Compute L{n,k}^{α,β} using the explicit formula.
+        
+        Formula: L{n,k}^{α,β} = (1/(β^k * k!)) * ∑_{j=0}^k (-1)^j * C(k,j) * (β(k-j)|α)^n̄
+        
+        This is an inclusion-exclusion formula derived from the combinatorial 
+        interpretation of generalized Stirling numbers.
+        
+        Args:
+            n: Number of elements
+            k: Number of ordered lists
+            
+        Returns:
+            Value of the generalized Stirling number
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+            >>> gs.explicit_formula(3, 2)
+            6.0
+            
+            >>> gs = GeneralizedStirling(alpha=0.0, beta=1.0)
+            >>> gs.explicit_formula(4, 2)  # Stirling number of the second kind
+            7.0
+        """
+        # Handle base cases
+        if k == 0:
+            return 1.0 if n == 0 else 0.0
+        if n == 0 or k > n:
+            return 0.0
+        if k == n:
+            return 1.0
+        
+        # Special case for k=1
+        if k == 1:
+            return self.single_list_case(n)
+        
+        # Main computation with numerical stability improvements
+        # For large values, compute in log space
+        if n > 50 or k > 20:
+            try:
+                return self._explicit_formula_log_space(n, k)
+            except (OverflowError, ValueError) as e:
+                warnings.warn(f"Numerical issues in explicit formula with n={n}, k={k}: {e}")
+                # Fall back to triangular recurrence
+                return self.triangular_recurrence(n, k)
+        else:
+            return self._explicit_formula_direct(n, k)
+    
+    @disk_cache_decorator
+    def triangular_recurrence(self, n: int, k: int) -> float:
+        """
+        Compute L{n,k}^{α,β} using the triangular recurrence relation.
+        
+        L{n,k}^{α,β} = L{n-1,k-1}^{α,β} + (α(n-1) + βk) * L{n-1,k}^{α,β}
+        
+        This recurrence relation has a clear combinatorial interpretation:
+        - The first term represents placing element n in its own list
+        - The second term represents placing element n into an existing list,
+          either after an element (weight α) or at the head (weight β)
+        
+        The recurrence is filled iteratively into the instance's LazyTriangle
+        (see triangular_recurrence_internal), so there is no recursion depth
+        limit on n and later queries reuse the rows already filled.
+        
+        Args:
+            n: Number of elements
+            k: Number of ordered lists
+            
+        Returns:
+            Value of the generalized Stirling number
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+            >>> gs.triangular_recurrence(3, 2)
+            6.0
+            
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=0.0)
+            >>> gs.triangular_recurrence(4, 2)  # Stirling number of the first kind
+            11.0
+        """
+        return self.triangular_recurrence_internal(n, k)
+    
+    @disk_cache_decorator
+    def bottom_up_computation(self, n: int, k: int) -> float:
+        """
+        Compute L{n,k}^{α,β} using a bottom-up dynamic programming approach.
+        
+        This method builds a table of values from smaller to larger parameters,
+        which is more efficient for computing a single value when n and k are large.
+        It avoids the recursion depth issues that can occur with the triangular
+        recurrence relation.
+        
+        Args:
+            n: Number of elements
+            k: Number of ordered lists
+            
+        Returns:
+            Value of the generalized Stirling number
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+            >>> gs.bottom_up_computation(3, 2)
+            6.0
+            
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=0.0)
+            >>> gs.bottom_up_computation(4, 2)  # Stirling number of the first kind
+            11.0
+        """
+        # Handle base cases
+        if k == 0:
+            return 1.0 if n == 0 else 0.0
+        if n == 0 or k > n:
+            return 0.0
+        if k == n:
+            return 1.0
+        if k == 1:
+            return self.single_list_case(n)
+        
+        # Create a 2D table for dynamic programming
+        # Only need to store two rows at a time to save memory
+        current_row = [0.0] * (k+1)
+        next_row = [0.0] * (k+1)
+        
+        # Base cases
+        current_row[0] = 1.0 if 0 == 0 else 0.0
+        for j in range(1, k+1):
+            current_row[j] = 0.0
+        
+        # Fill the table row by row
+        for i in range(1, n+1):
+            next_row[0] = 0.0
+            for j in range(1, min(i, k)+1):
+                if i == j:
+                    next_row[j] = 1.0
+                else:
+                    next_row[j] = current_row[j-1] + (self.alpha * (i-1) + self.beta * j) * current_row[j]
+            
+            # Swap rows for next iteration
+            current_row, next_row = next_row, current_row
+        
+        return current_row[k]
+    
+    def horizontal_recurrence(self, n: int, k: int) -> float:
+        """
+        Compute L{n,k}^{α,β} using the horizontal recurrence relation.
+        
+        L{n,k}^{α,β} = ∑_{j=0}^{n-k} (-1)^j * ((k+1)β + nα|β)^j̄ * L{n+1,k+j+1}^{α,β}
+        
+        This recurrence provides a relationship between values in adjacent rows
+        of the generalized Stirling number triangle. It follows from solving
+        the triangular recurrence for L{n,k} and iterating along row n.
+        
+        Row n+1 is fetched as one array (only its columns k+1..n+1 are
+        computed, see _row_by_recurrence), the rising factorials come from one
+        cumulative product, and the sum is a single dot product. The sum
+        alternates and cancels once n-k grows beyond about 10, so this is a
+        cross-check path for entries near the diagonal.
+        
+        Args:
+            n: Number of elements
+            k: Number of ordered lists
+            
+        Returns:
+            Value of the generalized Stirling number
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+            >>> gs.horizontal_recurrence(3, 2)
+            6.0
+        """
+        if k > n:
+            return 0.0
+        row = self._row_by_recurrence(n + 1, k + 1)[k + 1:]
+        
+        # (-1)^j ((k+1)β + nα|β)^j̄ for j = 0..n-k
+        factors = -(self.alpha * n + self.beta * np.arange(k + 1, n + 1, dtype=float))
+        with np.errstate(over='ignore', invalid='ignore'):
+            weights = np.concatenate(([1.0], np.cumprod(factors)))
+            return float(np.dot(weights, row))
+    
+    def vertical_recurrence(self, n: int, k: int) -> float:
+        """
+        Compute L{n+1,k+1}^{α,β} using the vertical recurrence relation.
+        
+        L{n+1,k+1}^{α,β} = ∑_{i=k}^n (α+β|α)^{n-i} * C(n,i) * L{i,k}^{α,β}
+        
+        This recurrence relates values along diagonals of the generalized
+        Stirling number triangle.
+        
+        Column k is fetched as one array and the weights C(n,i) (α+β|α)^{n-i}
+        come from cumulative products, so the sum is a single dot product.
+        When a column entry or weight overflows, the same sum is formed from
+        logarithms (see column) and scaled by its largest term.
+        
+        Args:
+            n: Parameter for resulting L{n+1,k+1}^{α,β}
+            k: Parameter for resulting L{n+1,k+1}^{α,β}
+            
+        Returns:
+            Value of L{n+1,k+1}^{α,β}
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+            >>> gs.vertical_recurrence(3, 2)  # Computes L{4,3}
+            12.0
+        """
+        if k > n:
+            return 0.0
+        
+        # (α+β|α)^m̄ for m = 0..n-k; entry m weights L{n-m,k}
+        factors = self.alpha + self.beta + self.alpha * np.arange(n - k, dtype=float)
+        i = np.arange(k, n + 1)
+        with np.errstate(over='ignore', invalid='ignore'):
+            column = np.empty(n - k + 1)
+            for m, row in _iter_rows(self.alpha, self.beta, n, k):
+                if m >= k:
+                    column[m - k] = row[k]
+            rising = np.concatenate(([1.0], np.cumprod(factors)))
+            # C(n,i) for i = k..n from C(n,i+1) = C(n,i) (n-i) / (i+1) in exact integers
+            binomials = list(itertools.accumulate(range(k, n), lambda c, j: c * (n - j) // (j + 1),
+                                                  initial=math.comb(n, k)))
+            try:
+                weights = np.array(binomials, dtype=float) * rising[n - i]
+            except OverflowError:
+                weights = np.full(len(i), np.inf)
+            if np.all(np.isfinite(weights)) and np.all(np.isfinite(column)):
+                return float(np.dot(weights, column))
+        
+        log_column, sign_column = self.column(k, n, log=True)
+        with np.errstate(divide='ignore'):
+            log_rising = np.concatenate(([0.0], np.cumsum(np.log(np.abs(factors)))))
+        sign_rising = np.concatenate(([1.0], np.cumprod(np.sign(factors))))
+        log_binomial = _gammaln(n + 1.0) - _gammaln(i + 1.0) - _gammaln(n - i + 1.0)
+        
+        log_terms = log_binomial + log_rising[n - i] + log_column
+        signs = sign_rising[n - i] * sign_column
+        nonzero = signs != 0
+        if not nonzero.any():
+            return 0.0
+        shift = np.max(log_terms[nonzero])
+        with np.errstate(over='ignore'):
+            total = np.dot(signs[nonzero], np.exp(log_terms[nonzero] - shift))
+            return float(total * np.exp(shift))
+    
+    @disk_cache_decorator
+    def single_list_case(self, n: int, k: int = 1) -> float:
+        """
+        Compute L{n,1}^{α,β} using the special case formula for k=1.
+        
+        L{n,1}^{α,β} = ∏_{j=1}^{n-1} (jα + β)
+        
+        This formula applies only when k=1 (single list case) and provides
+        a much more efficient calculation than the general methods.
+        
+        Args:
+            n: Number of elements
+            k: Should be 1 for this special case
+            
+        Returns:
+            Value of L{n,1}^{α,β}
+            
+        Raises:
+            ValueError: If k is not 1 or n is negative
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+            >>> gs.single_list_case(4)
+            24.0  # Factorial of 4
+            
+            >>> gs = GeneralizedStirling(alpha=0.0, beta=2.0)
+            >>> gs.single_list_case(3)
+            8.0  # 2^(3-1)
+        """
+        if k != 1:
+            raise ValueError("This special case only applies for k=1")
+            
+        # Special base cases
+        if n == 0:
+            return 0.0  # L_{0,1} = 0 by definition
+        if n == 1:
+            return 1.0  # L_{1,1} = 1 by definition
+        
+        # Optimized calculation for special cases
+        if self.alpha == 1.0 and self.beta == 0.0:
+            # Stirling numbers of the first kind s(n,1) = (n-1)!
+            return math.factorial(n-1)
+        elif self.alpha == 0.0 and self.beta == 1.0:
+            # Stirling numbers of the second kind S(n,1) = 1
+            return 1.0
+        elif self.alpha == 0.0:
+            # When alpha = 0: L_{n,1} = β^(n-1)
+            return self.beta ** (n-1)
+        elif self.alpha == 1.0 and self.beta == 1.0:
+            # Lah numbers L(n,1) = n!
+            return math.factorial(n)
+        
+        # For large n, compute in log space to avoid overflow
+        if n > 100:
+            log_result = 0.0
+            sign = 1.0
+            for j in range(1, n):
+                factor = j * self.alpha + self.beta
+                if factor <= 0:
+                    # Handle possible negative or zero factors
+                    if factor == 0:
+                        return 0.0
+                    else:
+                        log_result += math.log(abs(factor))
+                        if factor < 0:
+                            sign *= -1
+                else:
+                    log_result += math.log(factor)
+            
+            return sign * math.exp(log_result)
+        else:
+            result = 1.0
+            for j in range(1, n):
+                result *= (j * self.alpha + self.beta)
+            return result
+    
+    @disk_cache_decorator
+    def symmetric_function(self, n: int, k: int) -> float:
+        """
+        Compute L{n+k,n}^{α,β} using the symmetric function formula.
+        
+        L{n+k,n}^{α,β} = ∑_{1≤i₁≤...≤iₖ≤n} ∏_{j=1}^k ((α+β)iⱼ + α(j-1))
+        
+        The sum is filled iteratively as prefix sums over the largest index
+        (see symmetric_function_values), in O(nk).
+        
+        The symmetric function formula provides an alternative way to compute
+        generalized Stirling numbers, expressing them in terms of elementary
+        symmetric functions of weighted sequences.
+        
+        Args:
+            n: First parameter
+            k: Second parameter
+            
+        Returns:
+            Value of L{n+k,n}^{α,β}
+            
+        Raises:
+            ValueError: If n or k are negative
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+            >>> gs.symmetric_function(3, 2)  # Computes L{5,3}
+            120.0
+            
+            >>> gs = GeneralizedStirling(alpha=0.0, beta=1.0)
+            >>> gs.symmetric_function(2, 1)  # Computes L{3,2} = S(3,2)
+            3.0
+        """
+        return float(self.symmetric_function_values(n, k)[k])
+    
+    def symmetric_function_values(self, n: int, k: int) -> np.ndarray:
+        """
+        Compute L{n+j,n}^{α,β} for all j = 0..k in one pass.
+        
+        With H_j(m) the symmetric sum restricted to i_j ≤ m, conditioning on
+        the largest index i_j = i gives the prefix-sum recurrence
+        
+            H_j(m) = ∑_{i=1}^m ((α+β)i + α(j-1)) H_{j-1}(i),  H_0 = 1
+        
+        so each j is one cumulative sum over m = 1..n, and H_j(n) = L{n+j,n}
+        (see _iter_diagonals).
+        
+        Args:
+            n: First parameter
+            k: Largest second parameter
+            
+        Returns:
+            Float array of length k+1 with values[j] = L{n+j,n}^{α,β}
+            
+        Raises:
+            ValueError: If n or k are negative
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=0.0, beta=1.0)
+            >>> gs.symmetric_function_values(3, 3)  # S(3,3), S(4,3), S(5,3), S(6,3)
+            array([ 1.,  6., 25., 90.])
+        """
+        if n < 0 or k < 0:
+            raise ValueError(f"n and k must be non-negative, got n={n}, k={k}")
+        
+        values = np.empty(k + 1)
+        for j, diagonal in self._iter_diagonals(n, k):
+            values[j] = diagonal[n]
+        return values
+    
+    def diagonal(self, d: int, n_max: int) -> np.ndarray:
+        """
+        Compute the d-th subdiagonal L{k+d,k}^{α,β} for k = 0..n_max.
+        
+        Near-diagonal entries are the ones where only d merges happen, so
+        this is the natural access pattern for sparse groupings. The
+        symmetric-function recurrence of symmetric_function_values yields
+        whole subdiagonals, H_j(m) = L{m+j,m} for all m, so d prefix-sum
+        passes over k = 0..n_max produce the result in O(d n_max) without
+        computing any other part of the triangle.
+        
+        Args:
+            d: Diagonal offset (0 is the main diagonal L{k,k} = 1)
+            n_max: Largest column k
+            
+        Returns:
+            Float array of length n_max+1 with diagonal[k] = L{k+d,k}^{α,β}
+            (inf where a value overflows)
+            
+        Raises:
+            ValueError: If d or n_max is negative
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=1.0, beta=0.0)
+            >>> gs.diagonal(1, 5)  # Stirling numbers of the first kind [k+1, k] = C(k+1, 2)
+            array([ 0.,  1.,  3.,  6., 10., 15.])
+        """
+        if d < 0 or n_max < 0:
+            raise ValueError(f"d and n_max must be non-negative, got d={d}, n_max={n_max}")
+        for _, diagonal in self._iter_diagonals(n_max, d):
+            pass
+        return diagonal.copy()
+    
+    def anti_diagonal(self, s: int) -> np.ndarray:
+        """
+        Compute the anti-diagonal L{s-k,k}^{α,β} for k = 0..s//2.
+        
+        The anti-diagonal n + k = s crosses subdiagonal d = s - 2k at column
+        k, so it is read off the same subdiagonal passes as diagonal, keeping
+        one subdiagonal of length s//2+1 in memory at a time (O(s^2) time,
+        O(s) memory). Entries with k > s - k are zero and are not returned.
+        
+        Args:
+            s: Anti-diagonal index n + k
+            
+        Returns:
+            Float array of length s//2+1 with values[k] = L{s-k,k}^{α,β}
+            
+        Raises:
+            ValueError: If s is negative
+            
+        Examples:
+            >>> gs = GeneralizedStirling(alpha=0.0, beta=1.0)
+            >>> gs.anti_diagonal(8)  # S(8,0), S(7,1), S(6,2), S(5,3), S(4,4)
+            array([ 0.,  1., 31., 25.,  1.])
+        """
+        if s < 0:
+            raise ValueError(f"s must be non-negative, got {s}")
+        m_max = s // 2
+        values = np.empty(m_max + 1)
+        for j, diagonal in self._iter_diagonals(m_max, s):
+            if (s - j) % 2 == 0 and (s - j) // 2 <= m_max:
+                values[(s - j) // 2] = diagonal[(s - j) // 2]
+        return values
+    
+    def _iter_diagonals(self, m_max: int, j_max: int) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Yield (j, H_j) for j = 0..j_max, where H_j[m] = L{m+j,m} for m = 0..m_max.
+        
+        Each subdiagonal is one prefix sum of the previous one; the yielded
+        array is replaced, not modified, by later steps.
+        """
+        weights = (self.alpha + self.beta) * np.arange(m_max + 1, dtype=float)
+        diagonal = np.ones(m_max + 1)
+        yield 0, diagonal
+        with np.errstate(over='ignore', invalid='ignore'):
+            for j in range(1, j_max + 1):
+                # The m = 0 term vanishes (zero weight for j = 1, H_{j-1}[0] = 0 after),
+                # so H_j[0] = L{j,0} = 0
+                diagonal = np.cumsum((weights + self.alpha * (j - 1)) * diagonal)
+                yield j, diagonal
+    
+    #---------------------------------------------------------------------------
+    # Internal helper methods
+    #---------------------------------------------------------------------------
+    
+    def _select_best_method(self, n: int, k: int) -> str:
+        """
+        Select the most efficient computation method based on input parameters.
+        
+        The decision table of the calibration profile is used when one exists
+        (see calibrate_methods); otherwise fixed thresholds apply.
+        
+        Args:
+            n: Number of elements
+            k: Number of ordered lists
+            
+        Returns:
+            Name of the selected method
+        """
+        calibrated = _profile_method(self.alpha, self.beta, n, k)
+        if calibrated is not None:
+            return calibrated
+        
+        # Special case for known parameter combinations
+        if self.alpha == 0.0 or self.beta == 0.0:
+            # For classical Stirling numbers, triangular recurrence is usually best
+            return 'triangular'
+        elif n > 100 or k > 50:
+            # For very large values, use bottom-up to avoid recursion depth issues
+            return 'bottom_up'
+        elif n - k < 5 and n < 30:
+            # For values close to the diagonal, symmetric function is efficient
+            return 'symmetric'
+        elif k < 3 or n < 20:
+            # For small values, triangular recurrence with memoization works well
+            return 'triangular'
+        else:
+            # For medium-large values, bottom-up approach is generally best
+            return 'bottom_up'
+    
+    def triangular_recurrence_internal(self, n: int, k: int) -> float:
+        """
+        Internal implementation of triangular recurrence without caching.
+        
+        The recurrence is filled iteratively, row by row, instead of
+        recursing, so large n cannot hit the recursion limit. Up to
+        _SHARED_TABLE_ROWS rows, and as long as the rows fit within
+        cache_bytes, it reads the instance's LazyTriangle, so the rows are
+        shared with lazy_triangle() and a larger n only adds the missing
+        rows; the memory cache then gets the rest of the budget. Otherwise
+        columns 0..k are streamed without being stored.
+        """
+        # Handle base cases
+        if k == 0:
+            return 1.0 if n == 0 else 0.0
+        if n == 0 or k > n:
+            return 0.0
+        if k == n:
+            return 1.0
+        if k == 1:
+            return self.single_list_case(n)
+        
+        with np.errstate(over='ignore', invalid='ignore'):
+            triangle = self._lazy_triangle
+            if triangle is not None and n <= triangle.n_max:
+                return triangle[n, k]
+            if n <= _SHARED_TABLE_ROWS and self._fits_budget(LazyTriangle.rows_nbytes(n)):
+                value = self.lazy_triangle()[n, k]
+                if self.cache_bytes is not None:
+                    # The rows share the budget with the memory cache
+                    self._memory_cache.resize(self.cache_bytes - self._lazy_triangle.nbytes)
+                return value
+            # Beyond that many rows or the budget, stream columns 0..k in O(k) memory instead
+            for _, row in _iter_rows(self.alpha, self.beta, n, k):
+                pass
+        return float(row[k])
+    
+    def _explicit_formula_direct(self, n: int, k: int) -> float:
+        """Direct computation of explicit formula for moderate values"""
+        # All k+1 rising factorials (β(k-j)|α)^n̄ at once, O(1) each
+        j = np.arange(k + 1)
+        rising_facts = _rising_factorial(self.beta * (k - j), n, self.alpha)
+        terms = np.where(j % 2 == 0, 1.0, -1.0) * np.array([math.comb(k, i) for i in j], dtype=float) * rising_facts
+        result = math.fsum(terms)
+        
+        # Divide by β^k * k!
+        denominator = (self.beta ** k) * math.factorial(k)
+        return result / denominator if denominator != 0 else 0.0
+    
+    def _explicit_formula_log_space(self, n: int, k: int) -> float:
+        """Compute explicit formula in log space for numerical stability"""
+        if self.beta == 0:
+            return 0.0  # Result is 0 when denominator is 0
+        
+        j = np.arange(k + 1)
+        log_rising_facts, rising_signs = _log_rising_factorial(self.beta * (k - j), n, self.alpha)
+        log_binoms = np.array([math.lgamma(k + 1) - math.lgamma(i + 1) - math.lgamma(k - i + 1) for i in j])
+        log_terms = log_binoms + log_rising_facts
+        signs = np.where(j % 2 == 0, 1.0, -1.0) * rising_signs
+        
+        # Signed log-sum-exp relative to the largest term
+        nonzero = signs != 0
+        if not nonzero.any():
+            return 0.0
+        log_max = np.max(log_terms[nonzero])
+        total = math.fsum(signs[nonzero] * np.exp(log_terms[nonzero] - log_max))
+        if total == 0:
+            return 0.0
+        
+        # Apply denominator β^k * k! in log space
+        log_denominator = k * math.log(abs(self.beta)) + math.lgamma(k + 1)
+        sign = math.copysign(1.0, total) * (-1.0 if self.beta < 0 and k % 2 == 1 else 1.0)
+        return sign * math.exp(log_max + math.log(abs(total)) - log_denominator)
+    
+    def rising_factorial(self, x: Union[float, np.ndarray], n: Union[int, np.ndarray],
+                         increment: float = 1.0) -> Union[float, np.ndarray]:
+        """
+        Compute generalized rising factorial (x|α)^n̄
+        
+        This calculates x(x+α)(x+2α)...(x+(n-1)α)
+        
+        Evaluated as α^n Γ(x/α+n)/Γ(x/α) with sign handling for negative
+        bases, so the cost is O(1) whatever n is (scipy.special.poch is used
+        for accuracy when available). Zero factors give an exact 0.
+        
+        Args:
+            x: Base value (float or array)
+            n: Number of terms (int or array, broadcast against x)
+            increment: The increment between terms
+            
+        Returns:
+            The value of the rising factorial, as a float for scalar inputs
+            and an array otherwise
+            
+        Raises:
+            ValueError: If n is negative
+            
+        Examples:
+            >>> gs = GeneralizedStirling()
+            >>> gs.rising_factorial(2.0, 3, 0.5)
+            15.0  # 2.0 * 2.5 * 3.0
+            
+            >>> gs.rising_factorial(1.0, 4, 1.0)
+            24.0  # 1 * 2 * 3 * 4
+            
+            >>> gs.rising_factorial(np.array([1.0, 2.0]), 3)
+            array([ 6., 24.])
+        """
+        if np.min(n) < 0:
+            raise ValueError(f"n must be non-negative, got {n}")
+        
+        value = _rising_factorial(x, n, increment)
+        if not np.all(np.isfinite(value)):
+            warnings.warn(f"Numerical overflow in rising factorial with x={x}, n={n}, increment={increment}")
+        return float(value) if value.ndim == 0 else value
+
+# Maintain compatibility with old method name
+GeneralizedStirling.special_case = GeneralizedStirling.single_list_case
+
+
+#---------------------------------------------------------------------------
+# Benchmark-calibrated method selection
+#---------------------------------------------------------------------------
+
+# Methods compute(method='auto') chooses between, and the default calibration grid
+_TUNABLE_METHODS = ('triangular', 'bottom_up', 'symmetric', 'explicit')
+_CALIBRATION_N = (8, 16, 32, 64, 128, 256)
+_CALIBRATION_D = (1, 2, 4, 8, 16, 32, 64, 128)
+_CALIBRATION_PARAMETERS = {
+    'classical': ((1.0, 0.0), (0.0, 1.0)),
+    'general': ((1.0, 1.0), (0.5, 2.0), (2.0, 0.5)),
+}
+_PROFILE_VERSION = 1
+
+# Profile location; GENERALIZED_STIRLING_PROFILE overrides it
+_DEFAULT_PROFILE_PATH = os.path.join(os.path.expanduser('~'), '.generalized_stirling', 'method_profile.json')
+
+# Decision table used by _select_best_method, loaded on first use
+# (False until loaded; None when no valid profile exists)
+_active_profile: Any = False
+
+
+def _parameter_family(alpha: float, beta: float) -> str:
+    """Classify (α, β) as 'classical' (α or β zero) or 'general'."""
+    return 'classical' if alpha == 0.0 or beta == 0.0 else 'general'
+
+
+def _grid_index(value: int, points: Tuple[int, ...]) -> int:
+    """Return the index of the largest grid point <= value (0 below the grid)."""
+    index = 0
+    for i, point in enumerate(points):
+        if point <= value:
+            index = i
+    return index
+
+
+def _accurate(value: float, log_ref: float, sign_ref: float, rtol: float) -> bool:
+    """Check a float result against a (log|L|, sign) reference."""
+    if sign_ref == 0 or log_ref < math.log(sys.float_info.min):
+        return value == 0 or abs(value) < sys.float_info.min
+    if log_ref > math.log(sys.float_info.max):
+        return math.isinf(value) and math.copysign(1.0, value) == sign_ref
+    if not math.isfinite(value) or value == 0 or math.copysign(1.0, value) != sign_ref:
+        return False
+    return abs(math.log(abs(value)) - log_ref) <= math.log1p(rtol)
+
+
+def calibrate_methods(n_points: Tuple[int, ...] = _CALIBRATION_N, d_points: Tuple[int, ...] = _CALIBRATION_D,
+                      methods: Tuple[str, ...] = _TUNABLE_METHODS, repeat: int = 3, rtol: float = 1e-9,
+                      time_limit: float = 0.05, path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Time each method over a grid of (n, k, α, β) and fit the decision table used by 'auto'.
+    
+    For every parameter family ('classical': α or β zero, 'general': both
+    non-zero), grid row n and diagonal distance d = n - k, each method is run
+    on fresh instances (cold caches) for the family's representative (α, β)
+    pairs, and the best of repeat timings is kept. A method is only eligible
+    at a grid point if it matches the log-space recurrence to rtol for every
+    pair, so fast but inaccurate methods (such as the explicit formula where
+    it cancels) are never chosen. The cell's choice is the eligible method
+    with the smallest total time. A method that takes longer than time_limit
+    is not timed again at larger n for the same d.
+    
+    Args:
+        n_points: Grid rows n (increasing)
+        d_points: Grid diagonal distances d = n - k (increasing, points with
+                  k < 2 are skipped since compute handles them directly)
+        methods: Candidate methods
+        repeat: Timings per method and point (the minimum is kept)
+        rtol: Relative tolerance for a result to count as accurate
+        time_limit: Seconds after which a method is dropped for larger n
+        path: If given, write the profile there as JSON (see save_method_profile)
+        
+    Returns:
+        Profile dictionary with the grid, the per-family decision tables
+        ('table'[family][i][j] is the method for n_points[i], d_points[j],
+        None where no point was measured) and the measured 'timings'
+        
+    Raises:
+        ValueError: If a method is not a tunable method or repeat < 1
+        
+    Examples:
+        >>> profile = calibrate_methods(n_points=(8, 16), d_points=(1, 4), repeat=1)
+        >>> sorted(profile['table'])
+        ['classical', 'general']
+    """
+    unknown = set(methods) - set(_TUNABLE_METHODS)
+    if unknown:
+        raise ValueError(f"Unknown methods: {sorted(unknown)}. Valid methods are: {_TUNABLE_METHODS}")
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+    
+    table: Dict[str, List[List[Optional[str]]]] = {}
+    timings: Dict[str, List[List[Dict[str, Optional[float]]]]] = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        # Warm up lazily imported kernels so the first timing is not an import
+        for method in methods:
+            GeneralizedStirling(0.5, 2.0).compute(10, 4, method=method)
+        
+        for family, parameters in _CALIBRATION_PARAMETERS.items():
+            table[family] = []
+            timings[family] = []
+            too_slow: Set[Tuple[str, int]] = set()
+            for n in n_points:
+                table_row: List[Optional[str]] = []
+                timing_row: List[Dict[str, Optional[float]]] = []
+                for d in d_points:
+                    k = n - d
+                    if k < 2:
+                        table_row.append(None)
+                        timing_row.append({})
+                        continue
+                    references = [GeneralizedStirling(alpha, beta).compute_log(n, k) for alpha, beta in parameters]
+                    cell: Dict[str, Optional[float]] = {}
+                    for method in methods:
+                        if (method, d) in too_slow:
+                            cell[method] = None
+                            continue
+                        total = 0.0
+                        for (alpha, beta), (log_ref, sign_ref) in zip(parameters, references):
+                            best = math.inf
+                            for _ in range(repeat):
+                                gs = GeneralizedStirling(alpha, beta)
+                                start = time.perf_counter()
+                                value = gs.compute(n, k, method=method)
+                                best = min(best, time.perf_counter() - start)
+                            if not _accurate(value, log_ref, sign_ref, rtol):
+                                total = math.inf
+                                break
+                            total += best
+                        cell[method] = total if math.isfinite(total) else None
+                        if total > time_limit:
+                            too_slow.add((method, d))
+                    eligible = {method: t for method, t in cell.items() if t is not None}
+                    table_row.append(min(eligible, key=eligible.get) if eligible else None)
+                    timing_row.append(cell)
+                table[family].append(table_row)
+                timings[family].append(timing_row)
+    
+    profile = {
+        'version': _PROFILE_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'n_points': list(n_points),
+        'd_points': list(d_points),
+        'rtol': rtol,
+        'table': table,
+        'timings': timings,
+    }
+    if path is not None:
+        save_method_profile(profile, path)
+    return profile
+
+
+def save_method_profile(profile: Dict[str, Any], path: Optional[str] = None) -> str:
+    """
+    Write a calibration profile as JSON and make it the active decision table.
+    
+    Args:
+        profile: Profile returned by calibrate_methods
+        path: Destination (default: GENERALIZED_STIRLING_PROFILE or
+              ~/.generalized_stirling/method_profile.json)
+        
+    Returns:
+        The path written
+    """
+    global _active_profile
+    import json
+    path = path or os.environ.get('GENERALIZED_STIRLING_PROFILE', _DEFAULT_PROFILE_PATH)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp',
+                                     delete=False) as f:
+        json.dump(profile, f, indent=1)
+    os.replace(f.name, path)
+    _active_profile = profile
+    logger.info(f"Saved method profile to {path}")
+    return path
+
+
+def load_method_profile(path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Load a calibration profile and make it the active decision table.
+    
+    compute(method='auto') loads the default profile by itself on first use;
+    call this to switch to another file, or after editing the profile.
+    
+    Args:
+        path: Profile file (default: GENERALIZED_STIRLING_PROFILE or
+              ~/.generalized_stirling/method_profile.json)
+        
+    Returns:
+        The profile, or None if the file is missing or not a valid profile
+        (the built-in heuristics are used then)
+    """
+    global _active_profile
+    import json
+    path = path or os.environ.get('GENERALIZED_STIRLING_PROFILE', _DEFAULT_PROFILE_PATH)
+    try:
+        with open(path) as f:
+            profile = json.load(f)
+        valid = (profile.get('version') == _PROFILE_VERSION and
+                 all(len(rows) == len(profile['n_points']) and
+                     all(len(row) == len(profile['d_points']) for row in rows)
+                     for rows in profile['table'].values()))
+    except FileNotFoundError:
+        profile, valid = None, False
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        logger.warning(f"Ignoring invalid method profile {path}: {e}")
+        profile, valid = None, False
+    _active_profile = profile if valid else None
+    return _active_profile
+
+
+def _profile_method(alpha: float, beta: float, n: int, k: int) -> Optional[str]:
+    """Look up the calibrated method for (n, k), or None without an applicable profile."""
+    # Calibration only measures non-negative (α, β); signed weights can make
+    # the explicit and symmetric formulas cancel, so they keep the heuristics
+    if alpha < 0 or beta < 0:
+        return None
+    if _active_profile is False:
+        load_method_profile()
+    if not _active_profile:
+        return None
+    rows = _active_profile['table'].get(_parameter_family(alpha, beta))
+    if rows is None:
+        return None
+    row = rows[_grid_index(n, tuple(_active_profile['n_points']))]
+    method = row[_grid_index(n - k, tuple(_active_profile['d_points']))]
+    return method if method in _TUNABLE_METHODS else None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line interface: python generalized_stirling.py calibrate|show.
+    
+    'calibrate' re-runs calibrate_methods and writes the profile; 'show'
+    prints the decision table of the active profile.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(prog='generalized_stirling',
+                                     description="Calibrate the method selection of compute(method='auto')")
+    commands = parser.add_subparsers(dest='command', required=True)
+    calibrate = commands.add_parser('calibrate', help='time the methods and write the decision table')
+    calibrate.add_argument('--output', help='profile path (default: %(default)s)', default=None)
+    calibrate.add_argument('--n-points', type=int, nargs='+', default=list(_CALIBRATION_N))
+    calibrate.add_argument('--d-points', type=int, nargs='+', default=list(_CALIBRATION_D))
+    calibrate.add_argument('--repeat', type=int, default=3)
+    show = commands.add_parser('show', help='print the active decision table')
+    show.add_argument('--profile', default=None, help='profile path')
+    args = parser.parse_args(argv)
+    
+    if args.command == 'calibrate':
+        profile = calibrate_methods(tuple(args.n_points), tuple(args.d_points), repeat=args.repeat)
+        path = save_method_profile(profile, args.output)
+        print(f"Wrote method profile to {path}")
+    else:
+        profile = load_method_profile(args.profile)
+        if profile is None:
+            print("No method profile; compute(method='auto') uses the built-in heuristics")
+            return 1
+    
+    print(f"{'n':>6} {'d=n-k':>6}  " + "  ".join(f"{family:<10}" for family in profile['table']))
+    for i, n in enumerate(profile['n_points']):
+        for j, d in enumerate(profile['d_points']):
+            choices = [rows[i][j] or '-' for rows in profile['table'].values()]
+            if any(choice != '-' for choice in choices):
+                print(f"{n:>6} {d:>6}  " + "  ".join(f"{choice:<10}" for choice in choices))
+    return 0
+
+
+#---------------------------------------------------------------------------
+# Polynomial representation in (α, β)
+#---------------------------------------------------------------------------
+
+# The coefficients of row n sum to the Lah number L^{1,1}_{n,k}, which stays
+# below 1e293 up to row 160, so float64 holds every coefficient; the table
+# also grows as n_max^3 / 6 floats (5.5 MB at the cap)
+_POLYNOMIAL_MAX_ROWS = 160
+
+# Largest relative error bound accepted from compute(method='polynomial')
+# before it falls back to the triangular recurrence
+_POLYNOMIAL_RTOL = 1e-10
+
+
+class StirlingPolynomials:
+    """
+    Generalized Stirling numbers as polynomials in the parameters α and β.
+    
+    Since L^{cα,cβ}_{n,k} = c^{n-k} L^{α,β}_{n,k}, each L{n,k} is a homogeneous
+    polynomial of total degree d = n-k:
+    
+        L{n,k}^{α,β} = ∑_{i=0}^{d} c_{n,k,i} α^i β^{d-i}
+    
+    with non-negative integer coefficients. They are computed once, without
+    reference to any particular (α, β), and stored per diagonal d as an array
+    of shape (n_max-d+1, d+1) indexed by [k, i]. Evaluating the whole triangle
+    for a new parameter pair (or thousands of them) is then a vectorized
+    Horner pass per diagonal instead of a full recomputation.
+    
+    Coefficients are held in float64, so they are exact up to 2^53 and
+    rounded beyond, and n_max is capped at _POLYNOMIAL_MAX_ROWS, past which
+    they overflow. All coefficients are non-negative, so for α, β >= 0 the
+    evaluation is accurate to a few hundred ulps; signed parameters cancel,
+    and compute and evaluate can return a relative error bound for that.
+    
+    Attributes:
+        n_max (int): Largest row covered by the table
+        _diagonals (List[np.ndarray]): Coefficient arrays, one per diagonal d
+    
+    Examples:
+        >>> table = StirlingPolynomials(5)
+        >>> table.coefficients(3, 2)  # L{3,2} = 3β + 3α
+        array([3., 3.])
+        >>> table.compute(4, 2, alpha=1.0, beta=1.0)
+        36.0
+    """
+    
+    def __init__(self, n_max: int) -> None:
+        """
+        Build the coefficient table for 0 <= k <= n <= n_max.
+        
+        Args:
+            n_max: Largest row to cover
+            
+        Raises:
+            ValueError: If n_max is negative or exceeds _POLYNOMIAL_MAX_ROWS
         """
-        Compute L{n,k}^{α,β} using the horizontal recurrence relation.
+        if not 0 <= n_max <= _POLYNOMIAL_MAX_ROWS:
+            raise ValueError(f"n_max must be between 0 and {_POLYNOMIAL_MAX_ROWS}, got {n_max}")
         
-        L{n,k}^{α,β} = ∑_{j=0}^{n-k} (-1)^j * ((k+1)β + nα|α)^j̄ * L{n+1,k+j+1}^{α,β}
+        self.n_max = n_max
         
-        This recurrence provides a relationship between values in adjacent rows
-        of the generalized Stirling number triangle.
+        # Diagonal d = 0 holds L{k,k} = 1
+        self._diagonals: List[np.ndarray] = [np.ones((n_max + 1, 1))]
+        
+        # With n = k + d the recurrence reads
+        #   P{k+d,k} = P{k+d-1,k-1} + ((k+d-1)α + kβ) P{k+d-1,k},
+        # so diagonal d is the cumulative sum over k of the previous diagonal
+        # multiplied by the weight polynomial (P{d,0} = 0 for d >= 1).
+        for d in range(1, n_max + 1):
+            prev = self._diagonals[d - 1][:n_max - d + 1]
+            ks = np.arange(n_max - d + 1, dtype=float)[:, None]
+            weighted = np.zeros((n_max - d + 1, d + 1))
+            weighted[:, :d] += ks * prev            # β term keeps the power of α
+            weighted[:, 1:] += (ks + d - 1) * prev  # α term raises it by one
+            self._diagonals.append(np.cumsum(weighted, axis=0))
+    
+    def coefficients(self, n: int, k: int) -> np.ndarray:
+        """
+        Return the coefficients of L{n,k} as a polynomial in (α, β).
         
         Args:
-            n: Number of elements
+            n: Number of elements (at most n_max)
             k: Number of ordered lists
             
         Returns:
-            Value of the generalized Stirling number
+            Array c of length n-k+1 with L{n,k}^{α,β} = ∑_i c[i] α^i β^{n-k-i};
+            an empty array when k > n
             
-        Examples:
-            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
-            >>> gs.horizontal_recurrence(3, 2)
-            6.0
+        Raises:
+            ValueError: If n or k are negative or n exceeds n_max
         """
-        result = 0.0
-        for j in range(n-k+1):
-            # Calculate rising factorial ((k+1)β + nα|α)^j̄
-            base = (k+1) * self.beta + n * self.alpha
-            rising_fact = self.rising_factorial(base, j, self.alpha)
-            
-            # Calculate L{n+1,k+j+1}^{α,β} using triangular recurrence
-            gs_value = self.triangular_recurrence(n+1, k+j+1)
-            
-            # Add to sum with alternating sign
-            result += ((-1) ** j) * rising_fact * gs_value
-        
-        return result
+        if n < 0 or k < 0:
+            raise ValueError(f"n and k must be non-negative, got n={n}, k={k}")
+        if n > self.n_max:
+            raise ValueError(f"n={n} exceeds the table size n_max={self.n_max}")
+        if k > n:
+            return np.zeros(0)
+        return self._diagonals[n - k][k]
     
-    def vertical_recurrence(self, n: int, k: int) -> float:
+    def compute(self, n: int, k: int, alpha: float, beta: float,
+                return_error: bool = False) -> Union[float, Tuple[float, float]]:
         """
-        Compute L{n+1,k+1}^{α,β} using the vertical recurrence relation.
-        
-        L{n+1,k+1}^{α,β} = ∑_{i=k}^n (α+β|α)^{n-i} * C(n,i) * L{i,k}^{α,β}
-        
-        This recurrence relates values along diagonals of the generalized
-        Stirling number triangle.
+        Evaluate L{n,k}^{α,β} from its coefficients.
         
         Args:
-            n: Parameter for resulting L{n+1,k+1}^{α,β}
-            k: Parameter for resulting L{n+1,k+1}^{α,β}
+            n: Number of elements (at most n_max)
+            k: Number of ordered lists
+            alpha: Weight parameter for non-head elements
+            beta: Weight parameter for head elements
+            return_error: If True, also return a bound on the relative error
             
         Returns:
-            Value of L{n+1,k+1}^{α,β}
-            
-        Examples:
-            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
-            >>> gs.vertical_recurrence(3, 2)  # Computes L{4,3}
-            6.0
+            Value of the generalized Stirling number; with return_error, a
+            tuple (value, relative error bound), the bound being inf on
+            overflow or when the value cancels to zero
         """
-        result = 0.0
-        for i in range(k, n+1):
-            # Calculate rising factorial (α+β|α)^{n-i}
-            rising_fact = self.rising_factorial(self.alpha + self.beta, n-i, self.alpha)
-            
-            # Calculate binomial coefficient C(n,i)
-            binom = math.comb(n, i)
-            
-            # Calculate L{i,k}^{α,β} using triangular recurrence
-            gs_value = self.triangular_recurrence(i, k)
-            
-            # Add to sum
-            result += rising_fact * binom * gs_value
-        
-        return result
+        coeffs = self.coefficients(n, k)
+        if len(coeffs) == 0:
+            return (0.0, 0.0) if return_error else 0.0
+        alpha_array, beta_array = np.array([alpha], dtype=float), np.array([beta], dtype=float)
+        with np.errstate(over='ignore', invalid='ignore'):
+            value = float(self._horner(coeffs[None, :], alpha_array, beta_array)[0, 0])
+        if not return_error:
+            return value
+        error = self._relative_errors(coeffs[None, :], alpha_array, beta_array,
+                                      np.array([[value]]), np.array([n]))
+        return value, float(error[0, 0])
     
-    @disk_cache_decorator
-    def single_list_case(self, n: int, k: int = 1) -> float:
+    def evaluate(self, alpha: Union[float, np.ndarray], beta: Union[float, np.ndarray],
+                 n_max: Optional[int] = None,
+                 return_error: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
         """
-        Compute L{n,1}^{α,β} using the special case formula for k=1.
-        
-        L{n,1}^{α,β} = ∏_{j=1}^{n-1} (jα + β)
-        
-        This formula applies only when k=1 (single list case) and provides
-        a much more efficient calculation than the general methods.
+        Evaluate the whole triangle for one or many parameter pairs.
         
         Args:
-            n: Number of elements
-            k: Should be 1 for this special case
+            alpha: Value or array of α values
+            beta: Value or array of β values (broadcast against alpha)
+            n_max: Largest row to evaluate (defaults to the table size)
+            return_error: If True, also return relative error bounds
             
         Returns:
-            Value of L{n,1}^{α,β}
+            Array of shape broadcast(alpha, beta).shape + (n_max+1, n_max+1)
+            with result[..., n, k] = L{n,k}^{α,β}; with return_error, a tuple
+            (values, errors) of two such arrays (see compute)
             
         Raises:
-            ValueError: If k is not 1 or n is negative
+            ValueError: If n_max exceeds the table size
             
         Examples:
-            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
-            >>> gs.single_list_case(4)
-            24.0  # Factorial of 4
-            
-            >>> gs = GeneralizedStirling(alpha=0.0, beta=2.0)
-            >>> gs.single_list_case(3)
-            8.0  # 2^(3-1)
+            >>> table = StirlingPolynomials(4)
+            >>> table.evaluate([1.0, 0.0], [1.0, 1.0])[:, 4, 2]  # Lah and S(4,2)
+            array([36.,  7.])
         """
-        if k != 1:
-            raise ValueError("This special case only applies for k=1")
-            
-        # Special base cases
-        if n == 0:
-            return 0.0  # L_{0,1} = 0 by definition
-        if n == 1:
-            return 1.0  # L_{1,1} = 1 by definition
+        if n_max is None:
+            n_max = self.n_max
+        if not 0 <= n_max <= self.n_max:
+            raise ValueError(f"n_max must be between 0 and {self.n_max}, got {n_max}")
         
-        # Optimized calculation for special cases
-        if self.alpha == 1.0 and self.beta == 0.0:
-            # Stirling numbers of the first kind s(n,1) = (n-1)!
-            return math.factorial(n-1)
-        elif self.alpha == 0.0 and self.beta == 1.0:
-            # Stirling numbers of the second kind S(n,1) = 1
-            return 1.0
-        elif self.alpha == 0.0:
-            # When alpha = 0: L_{n,1} = β^(n-1)
-            return self.beta ** (n-1)
-        elif self.alpha == 1.0 and self.beta == 1.0:
-            # Lah numbers L(n,1) = n!
-            return math.factorial(n)
+        alpha, beta = np.broadcast_arrays(np.asarray(alpha, dtype=float), np.asarray(beta, dtype=float))
+        shape = alpha.shape
+        alpha, beta = alpha.ravel(), beta.ravel()
         
-        # For large n, compute in log space to avoid overflow
-        if n > 100:
-            log_result = 0.0
-            sign = 1.0
-            for j in range(1, n):
-                factor = j * self.alpha + self.beta
-                if factor <= 0:
-                    # Handle possible negative or zero factors
-                    if factor == 0:
-                        return 0.0
-                    else:
-                        log_result += math.log(abs(factor))
-                        if factor < 0:
-                            sign *= -1
-                else:
-                    log_result += math.log(factor)
-            
-            return sign * math.exp(log_result)
-        else:
-            result = 1.0
-            for j in range(1, n):
-                result *= (j * self.alpha + self.beta)
-            return result
+        result = np.zeros((alpha.size, n_max + 1, n_max + 1))
+        errors = np.zeros_like(result) if return_error else None
+        for d in range(n_max + 1):
+            ks = np.arange(n_max - d + 1)
+            coeffs = self._diagonals[d][:n_max - d + 1]
+            with np.errstate(over='ignore', invalid='ignore'):
+                values = self._horner(coeffs, alpha, beta)
+            result[:, ks + d, ks] = values
+            if return_error:
+                errors[:, ks + d, ks] = self._relative_errors(coeffs, alpha, beta, values, ks + d)
+        result = result.reshape(shape + (n_max + 1, n_max + 1))
+        return (result, errors.reshape(result.shape)) if return_error else result
     
-    @disk_cache_decorator
-    def symmetric_function(self, n: int, k: int) -> float:
+    @classmethod
+    def _relative_errors(cls, coeffs: np.ndarray, alpha: np.ndarray, beta: np.ndarray,
+                         values: np.ndarray, ns: np.ndarray) -> np.ndarray:
         """
-        Compute L{n+k,n}^{α,β} using the symmetric function formula.
+        Bound the relative error of Horner values on one diagonal d.
         
-        L{n+k,n}^{α,β} = ∑_{1≤i₁≤...≤iₖ≤n} ∏_{j=1}^k ((α+β)iⱼ + α(j-1))
-        
-        This implementation uses lru_cache for efficient dynamic programming.
-        
-        The symmetric function formula provides an alternative way to compute
-        generalized Stirling numbers, expressing them in terms of elementary
-        symmetric functions of weighted sequences.
+        Each coefficient carries at most d(n+2) roundings from the cumulative
+        sums that built it, and each Horner term at most 2d+1 more, all on
+        non-negative quantities. The absolute error is therefore at most
+        (d(n+2) + 2d + 1)·u times ∑_i c_i |α|^i |β|^{d-i}, which equals |L|
+        when α, β >= 0 and exceeds it by the cancellation otherwise.
         
         Args:
-            n: First parameter
-            k: Second parameter
+            coeffs: Array of shape (cells, d+1)
+            alpha: Array of shape (P,)
+            beta: Array of shape (P,)
+            values: Horner values of shape (P, cells)
+            ns: Row numbers of the cells, shape (cells,)
             
         Returns:
-            Value of L{n+k,n}^{α,β}
-            
-        Raises:
-            ValueError: If n or k are negative
-            
-        Examples:
-            >>> gs = GeneralizedStirling(alpha=1.0, beta=1.0)
-            >>> gs.symmetric_function(3, 2)  # Computes L{5,3}
-            60.0
-            
-            >>> gs = GeneralizedStirling(alpha=0.0, beta=1.0)
-            >>> gs.symmetric_function(2, 1)  # Computes L{3,2} = S(3,2)
-            3.0
+            Array of shape (P, cells); inf where the value overflowed or
+            cancelled to zero
         """
-        # Validate inputs
-        if n < 0 or k < 0:
-            raise ValueError(f"n and k must be non-negative, got n={n}, k={k}")
-            
-        if k == 0:
-            return 1.0
-        
-        # For k=1, use the special formula
-        if k == 1:
-            result = 0
-            for i in range(1, n+1):
-                result += (self.alpha + self.beta) * i
-            return result
+        d = coeffs.shape[1] - 1
+        u = np.finfo(float).eps / 2
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            magnitudes = cls._horner(coeffs, np.abs(alpha), np.abs(beta))
+            bounds = (d * (ns + 2) + 2 * d + 1) * u * magnitudes
+            errors = np.where(bounds == 0, 0.0, bounds / np.abs(values))
+        return np.where(np.isnan(errors), np.inf, errors)
+    
+    @staticmethod
+    def _horner(coeffs: np.ndarray, alpha: np.ndarray, beta: np.ndarray) -> np.ndarray:
+        """
+        Evaluate homogeneous polynomials ∑_i c[m, i] α^i β^{d-i} for all pairs.
         
-        # Define a nested function with lru_cache for efficient DP
-        @lru_cache(maxsize=None)
-        def compute_dp(depth: int, start: int) -> float:
-            """Recursively compute the sum using dynamic programming with lru_cache"""
-            if depth == k:
-                return 1.0
+        Args:
+            coeffs: Array of shape (cells, d+1)
+            alpha: Array of shape (P,)
+            beta: Array of shape (P,)
             
-            return sum(((self.alpha + self.beta) * i + self.alpha * depth) * 
-                      compute_dp(depth+1, i) for i in range(start, n+1))
-        
-        result = compute_dp(0, 1)
+        Returns:
+            Array of shape (P, cells)
+        """
+        degree = coeffs.shape[1] - 1
+        acc = np.broadcast_to(coeffs[:, degree], (alpha.size, coeffs.shape[0])).copy()
+        beta_power = np.ones_like(beta)
+        for i in range(degree - 1, -1, -1):
+            beta_power = beta_power * beta
+            acc = acc * alpha[:, None] + coeffs[:, i][None, :] * beta_power[:, None]
+        return acc
+
+
+# Shared table reused by every GeneralizedStirling instance
+_polynomial_table: Optional[StirlingPolynomials] = None
+
+
+def polynomial_table(n_max: int) -> StirlingPolynomials:
+    """
+    Return a shared StirlingPolynomials table covering at least n_max rows.
+    
+    The coefficients do not depend on (α, β), so one table serves every
+    parameter pair; it is rebuilt only when a larger n_max is requested.
+    
+    Args:
+        n_max: Largest row needed
         
-        # Clear the lru_cache to avoid memory leaks
-        compute_dp.cache_clear()
+    Returns:
+        A StirlingPolynomials instance with table.n_max >= n_max
         
-        return result
+    Raises:
+        ValueError: If n_max exceeds _POLYNOMIAL_MAX_ROWS
+    """
+    global _polynomial_table
+    if _polynomial_table is None or _polynomial_table.n_max < n_max:
+        _polynomial_table = StirlingPolynomials(n_max)
+    return _polynomial_table
+
+
+#---------------------------------------------------------------------------
+# Scale-normalized triangle cache
+#---------------------------------------------------------------------------
+
+class ScaledTriangleCache:
+    """
+    Triangle cache shared across proportional parameter pairs.
     
-    #---------------------------------------------------------------------------
-    # Internal helper methods
-    #---------------------------------------------------------------------------
+    Since L^{cα,cβ}_{n,k} = c^{n-k} L^{α,β}_{n,k}, every pair (α, β) is written
+    as c * (α', β') with a canonical direction (α', β') whose larger component
+    is exactly +1. One triangle is stored per direction and values for any
+    scale c are recovered on lookup. Sweeping the scale of (α, β) therefore
+    hits the same cached triangle instead of recomputing it.
+    
+    Each direction keeps a float triangle and, on demand, a (log|L|, sign)
+    triangle: when a cached float value or its rescaled value leaves the
+    float64 range, the rescaling is done in the log domain instead.
+    
+    Directions are evicted least-recently-used once max_directions is reached.
+    
+    Attributes:
+        max_directions (int): Maximum number of direction triangles kept
+        hits (int): Lookups served from an existing triangle
+        misses (int): Lookups that had to build or grow a triangle
     
-    def _precompute_common_values(self, max_n: int = 20, max_k: int = 20) -> None:
+    Examples:
+        >>> cache = ScaledTriangleCache()
+        >>> cache.get(2.0, 2.0, 4, 2)  # 2^2 * Lah L(4,2)
+        144.0
+        >>> cache.get(0.5, 0.5, 4, 2)  # Same direction, cache hit
+        9.0
+    """
+    
+    # Significant digits kept in direction keys so proportional pairs coincide
+    KEY_DIGITS = 12
+    
+    def __init__(self, max_directions: int = 32) -> None:
         """
-        Precompute values for common special cases.
+        Initialize an empty cache.
         
-        This method calculates and stores values for common parameters to improve performance
-        for frequently used values.
+        Args:
+            max_directions: Maximum number of direction triangles kept
+        """
+        self.max_directions = max_directions
+        self._entries: Dict[Tuple[float, float], Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    @classmethod
+    def canonicalize(cls, alpha: float, beta: float) -> Tuple[Tuple[float, float], float]:
+        """
+        Split (α, β) into a canonical direction and a signed scale.
         
         Args:
-            max_n: Maximum value of n to precompute
-            max_k: Maximum value of k to precompute
+            alpha: Weight parameter for non-head elements
+            beta: Weight parameter for head elements
             
         Returns:
-            None
+            Tuple ((α', β'), c) with (α, β) = c * (α', β'), max(|α'|, |β'|) = 1
+            and the larger-magnitude component of (α', β') positive; the zero
+            pair maps to ((0.0, 0.0), 1.0)
+        """
+        largest = alpha if abs(alpha) >= abs(beta) else beta
+        if largest == 0:
+            return (0.0, 0.0), 1.0
+        direction = tuple(float(f"{x / largest:.{cls.KEY_DIGITS}g}") + 0.0 for x in (alpha, beta))
+        return direction, float(largest)
+    
+    def get(self, alpha: float, beta: float, n: int, k: int) -> float:
         """
-        logger.info(f"Precomputing common values for α={self.alpha}, β={self.beta}")
+        Look up L{n,k}^{α,β}.
         
-        count = 0
-        for n in range(min(max_n, 21)):
-            for k in range(min(n+1, max_k+1)):
-                if n == k or k == 0 or n == 0:
-                    # These are base cases with known values
-                    continue
-                
-                # Compute and store in precomputed cache
-                try:
-                    self._precomputed[(n, k)] = self.triangular_recurrence_internal(n, k)
-                    count += 1
-                except (OverflowError, ValueError):
-                    # Stop precomputation if we hit numerical limits
-                    logger.warning(f"Stopped precomputation at n={n}, k={k} due to numerical issues")
-                    return
+        Args:
+            alpha: Weight parameter for non-head elements
+            beta: Weight parameter for head elements
+            n: Number of elements
+            k: Number of ordered lists
+            
+        Returns:
+            Value of the generalized Stirling number
+        """
+        if k > n:
+            return 0.0
+        direction, scale = self.canonicalize(alpha, beta)
+        entry = self._entry(direction, n, k)
+        base = entry['table'][n, k]
+        with np.errstate(over='ignore', under='ignore', invalid='ignore'):
+            value = base * scale ** (n - k)
+        if np.isfinite(base) and np.isfinite(value):
+            return float(value)
         
-        logger.info(f"Precomputed {count} values for α={self.alpha}, β={self.beta}")
+        # The cached value overflowed or the rescaled one did: rescale in the log domain
+        log_value, sign = self._log_value(entry, direction, scale, n, k)
+        with np.errstate(over='ignore'):
+            return float(sign * np.exp(log_value)) if sign else 0.0
     
-    def _select_best_method(self, n: int, k: int) -> str:
+    def get_log(self, alpha: float, beta: float, n: int, k: int) -> Tuple[float, float]:
         """
-        Select the most efficient computation method based on input parameters.
+        Look up L{n,k}^{α,β} as (log|L|, sign).
         
         Args:
+            alpha: Weight parameter for non-head elements
+            beta: Weight parameter for head elements
             n: Number of elements
             k: Number of ordered lists
             
         Returns:
-            Name of the selected method
+            Tuple (log|L{n,k}|, sign); zero values are returned as (-inf, 0.0)
         """
-        # Special case for known parameter combinations
-        if self.alpha == 0.0 or self.beta == 0.0:
-            # For classical Stirling numbers, triangular recurrence is usually best
-            return 'triangular'
-        elif n > 100 or k > 50:
-            # For very large values, use bottom-up to avoid recursion depth issues
-            return 'bottom_up'
-        elif n - k < 5 and n < 30:
-            # For values close to the diagonal, symmetric function is efficient
-            return 'symmetric'
-        elif k < 3 or n < 20:
-            # For small values, triangular recurrence with memoization works well
-            return 'triangular'
+        if k > n:
+            return float('-inf'), 0.0
+        direction, scale = self.canonicalize(alpha, beta)
+        return self._log_value(self._entry(direction, n, k), direction, scale, n, k)
+    
+    def triangle(self, alpha: float, beta: float, n_max: int, k_max: Optional[int] = None) -> np.ndarray:
+        """
+        Return the float triangle for (α, β), rescaled from the direction triangle.
+        
+        Args:
+            alpha: Weight parameter for non-head elements
+            beta: Weight parameter for head elements
+            n_max: Maximum row number
+            k_max: Maximum column number (defaults to n_max)
+            
+        Returns:
+            Array of shape (n_max+1, k_max+1) with table[n, k] = L{n,k}^{α,β}
+        """
+        if k_max is None:
+            k_max = n_max
+        direction, scale = self.canonicalize(alpha, beta)
+        entry = self._entry(direction, n_max, k_max)
+        base = entry['table'][:n_max + 1, :k_max + 1]
+        powers = np.clip(np.arange(n_max + 1)[:, None] - np.arange(k_max + 1)[None, :], 0, None)
+        with np.errstate(over='ignore', under='ignore', invalid='ignore'):
+            table = np.where(base != 0, base * scale ** powers, 0.0)
+            
+            # Entries whose direction value overflowed are rescaled in the log domain
+            overflowed = ~np.isfinite(base)
+            if overflowed.any():
+                self._log_value(entry, direction, scale, 0, 0)  # Make sure the log tables exist
+                log_table, sign_table = entry['log']
+                log_table = log_table[:n_max + 1, :k_max + 1]
+                sign_table = sign_table[:n_max + 1, :k_max + 1]
+                signs = sign_table * np.where(scale < 0, (-1.0) ** powers, 1.0)
+                rescaled = signs * np.exp(log_table + powers * math.log(abs(scale)))
+                table = np.where(overflowed, rescaled, table)
+        return table
+    
+    def clear(self) -> None:
+        """Drop all cached triangles and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def nbytes_for(self, alpha: float, beta: float, n: int, k: int) -> int:
+        """
+        Approximate bytes held by the direction triangle of (α, β) once it covers (n, k).
+        
+        The float triangle and the log and sign triangles are counted.
+        """
+        direction, _ = self.canonicalize(alpha, beta)
+        n_max, k_max = self._grown_shape(self._entries.get(direction), n, k)
+        return 3 * 8 * (n_max + 1) * (k_max + 1)
+    
+    @staticmethod
+    def _grown_shape(entry: Optional[Dict[str, Any]], n: int, k: int) -> Tuple[int, int]:
+        """Return the (n_max, k_max) of the direction triangle once it covers (n, k)."""
+        if entry is not None and entry['n_max'] >= n and entry['k_max'] >= k:
+            return entry['n_max'], entry['k_max']
+        # Grow geometrically so a slowly increasing n does not rebuild every time
+        n_max = max(n, 2 * entry['n_max']) if entry else n
+        k_max = min(max(k, 2 * entry['k_max']) if entry else k, n_max)
+        return n_max, k_max
+    
+    def _entry(self, direction: Tuple[float, float], n: int, k: int) -> Dict[str, Any]:
+        """Return the direction triangle covering (n, k), building or growing it if needed."""
+        entry = self._entries.pop(direction, None)
+        if entry is not None and entry['n_max'] >= n and entry['k_max'] >= k:
+            self.hits += 1
         else:
-            # For medium-large values, bottom-up approach is generally best
-            return 'bottom_up'
+            self.misses += 1
+            n_max, k_max = self._grown_shape(entry, n, k)
+            with np.errstate(over='ignore', invalid='ignore'):  # Overflowed cells use the log route
+                table = _triangle_array(direction[0], direction[1], n_max, k_max)
+            entry = {'n_max': n_max, 'k_max': k_max, 'table': table}
+            if len(self._entries) >= self.max_directions:
+                self._entries.pop(next(iter(self._entries)))
+        self._entries[direction] = entry  # Reinsert as most recently used
+        return entry
+    
+    def _log_value(self, entry: Dict[str, Any], direction: Tuple[float, float],
+                   scale: float, n: int, k: int) -> Tuple[float, float]:
+        """Rescale the direction value in the log domain."""
+        if 'log' not in entry:
+            entry['log'] = _log_triangle_arrays(direction[0], direction[1], entry['n_max'], entry['k_max'])
+        log_table, sign_table = entry['log']
+        sign = float(sign_table[n, k])
+        if sign == 0:
+            return float('-inf'), 0.0
+        if scale < 0 and (n - k) % 2 == 1:
+            sign = -sign
+        return float(log_table[n, k]) + (n - k) * math.log(abs(scale)), sign
+
+
+# Shared cache used by GeneralizedStirling instances created with use_scale_cache=True
+_scaled_triangle_cache = ScaledTriangleCache()
+
+
+#---------------------------------------------------------------------------
+# Memory-mapped triangle store
+#---------------------------------------------------------------------------
+
+# Fixed 64-byte header preceding the packed row-major triangle data
+_STORE_MAGIC = b'GSTRIANG'
+_STORE_VERSION = 2
+_STORE_HEADER = np.dtype([('magic', 'S8'), ('version', '<u4'), ('kind', '<u4'), ('n_max', '<i8'),
+                          ('alpha', '<f8'), ('beta', '<f8'), ('reserved', 'V24')])
+_STORE_KINDS = ('value', 'log')
+# One cell per (n, k) with k <= n: a float64 value, or a float64 log|L| and an int8 sign
+_STORE_CELLS = {'value': np.dtype('<f8'), 'log': np.dtype([('log', '<f8'), ('sign', 'i1')])}
+
+
+def _packed_offset(n: int) -> int:
+    """Index of L{n,0} in a packed row-major triangle (also the cell count of rows 0..n-1)."""
+    return n * (n + 1) // 2
+
+
+class TriangleStore:
+    """
+    Disk-backed triangle of L{n,k}^{α,β} read through numpy.memmap.
+    
+    Each kind of triangle lives in one file per (α, β): a 64-byte header
+    (magic, version, kind, n_max, α, β) followed by the packed lower triangle
+    in row-major order, L{n,k} at cell n(n+1)/2 + k for 0 <= k <= n <= n_max.
+    'value' files hold float64 cells; 'log' files hold (float64 log|L|, int8
+    sign) records. Lookups are O(1) offset reads into the mapped file, and
+    processes opening the same file share its pages through the OS page cache.
+    
+    Since rows are packed in order, growing the triangle only appends rows:
+    when a lookup needs a row beyond n_max, the rows up to it are continued
+    from the last stored row and written after it, then n_max is updated in
+    the header. Readers map only the rows the header declares, so they never
+    see a partial row. Concurrent writers append identical bytes, since the
+    rows are a deterministic function of (α, β).
+    
+    Attributes:
+        directory (str): Directory holding the triangle files
+        alpha (float): Weight parameter for non-head elements
+        beta (float): Weight parameter for head elements
+    
+    Examples:
+        >>> store = TriangleStore(tempfile.mkdtemp(), alpha=1.0, beta=1.0)
+        >>> store.value(4, 2)
+        36.0
+        >>> store.row(4)
+        memmap([ 0., 24., 36., 12.,  1.])
+    """
+    
+    def __init__(self, directory: str, alpha: float, beta: float) -> None:
+        """
+        Initialize a store for (α, β) in a directory.
+        
+        Args:
+            directory: Directory holding the triangle files (created if missing)
+            alpha: Weight parameter for non-head elements
+            beta: Weight parameter for head elements
+        """
+        self.directory = directory
+        self.alpha = float(alpha)
+        self.beta = float(beta)
+        os.makedirs(directory, exist_ok=True)
+        # kind -> (n_max, packed cells mapped from the file, (inode, mtime) of that file)
+        self._maps: Dict[str, Tuple[int, np.ndarray, Tuple[int, int]]] = {}
     
-    def _get_disk_cache_key(self, method: str, n: int, k: int) -> str:
+    def path(self, kind: str = 'value') -> str:
+        """Return the file path of the given kind of triangle."""
+        return os.path.join(self.directory, f"triangle_{self.alpha!r}_{self.beta!r}.{kind}.gst")
+    
+    def n_max(self, kind: str = 'value') -> int:
+        """Return the last stored row of the given kind, or -1 if nothing is stored."""
+        entry = self._open(kind)
+        return entry[0] if entry else -1
+    
+    def covers(self, n: int, kind: str = 'value') -> bool:
+        """Return True if row n is already stored, so a lookup needs no computation."""
+        return self.n_max(kind) >= n
+    
+    def value(self, n: int, k: int) -> float:
         """
-        Generate a filename for disk caching based on method and parameters.
+        Look up L{n,k}^{α,β}, extending the stored triangle if needed.
         
         Args:
-            method: The calculation method used
-            n: First parameter
-            k: Second parameter
+            n: Number of elements
+            k: Number of ordered lists
             
         Returns:
-            A unique filename for the cache entry
+            Value of the generalized Stirling number (inf once it overflows float64)
         """
-        return os.path.join(self.cache_dir, f"{method}_{n}_{k}_{self.alpha}_{self.beta}.pkl")
+        if k > n:
+            return 0.0
+        return float(self._ensure('value', n)[_packed_offset(n) + k])
     
-    def _save_to_disk_cache(self, key: str, value: float) -> None:
+    def log_value(self, n: int, k: int) -> Tuple[float, float]:
         """
-        Save a value to the disk cache.
+        Look up L{n,k}^{α,β} as (log|L|, sign), extending the stored triangle if needed.
         
         Args:
-            key: Cache key
-            value: Value to cache
+            n: Number of elements
+            k: Number of ordered lists
             
         Returns:
-            None
+            Tuple (log|L{n,k}|, sign); zero values are returned as (-inf, 0.0)
         """
-        if not self.use_disk_cache:
-            return
-            
-        try:
-            with open(key, 'wb') as f:
-                pickle.dump(value, f)
-        except (OSError, pickle.PickleError) as e:
-            logger.warning(f"Failed to save to disk cache: {e}")
+        if k > n:
+            return float('-inf'), 0.0
+        cell = self._ensure('log', n)[_packed_offset(n) + k]
+        return float(cell['log']), float(cell['sign'])
     
-    def _load_from_disk_cache(self, key: str) -> Optional[float]:
+    def row(self, n: int) -> np.ndarray:
         """
-        Load a value from the disk cache.
+        Return a read-only mapped view of row n, L{n,0..n}.
+        
+        The view stays valid after the store grows, but then no longer
+        reflects the file.
+        """
+        return self._ensure('value', n)[_packed_offset(n):_packed_offset(n + 1)]
+    
+    def values(self, n_max: int, k_max: Optional[int] = None) -> np.ndarray:
+        """
+        Return the value triangle for rows 0..n_max as a dense array.
         
-        Args:
-            key: Cache key
-            
         Returns:
-            The cached value or None if not found
+            Array of shape (n_max+1, k_max+1), zero for k > n
         """
-        if not self.use_disk_cache or not os.path.exists(key):
-            return None
-            
+        if k_max is None:
+            k_max = n_max
+        cells = self._ensure('value', n_max)
+        table = np.zeros((n_max + 1, k_max + 1))
+        for n in range(n_max + 1):
+            width = min(n, k_max) + 1
+            table[n, :width] = cells[_packed_offset(n):_packed_offset(n) + width]
+        return table
+    
+    def log_values(self, n_max: int, k_max: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return dense (log|L|, sign) arrays for rows 0..n_max, (-inf, 0) for k > n."""
+        if k_max is None:
+            k_max = n_max
+        cells = self._ensure('log', n_max)
+        log_table = np.full((n_max + 1, k_max + 1), -np.inf)
+        sign_table = np.zeros((n_max + 1, k_max + 1))
+        for n in range(n_max + 1):
+            width = min(n, k_max) + 1
+            row = cells[_packed_offset(n):_packed_offset(n) + width]
+            log_table[n, :width] = row['log']
+            sign_table[n, :width] = row['sign']
+        return log_table, sign_table
+    
+    def nbytes(self) -> int:
+        """Return the total size in bytes of the stored files."""
+        return sum(os.path.getsize(self.path(kind)) for kind in _STORE_KINDS
+                   if os.path.exists(self.path(kind)))
+    
+    def clear(self) -> None:
+        """Unmap and delete the stored files."""
+        self._maps.clear()
+        for kind in _STORE_KINDS:
+            if os.path.exists(self.path(kind)):
+                os.remove(self.path(kind))
+    
+    def _ensure(self, kind: str, n: int) -> np.ndarray:
+        """Return the mapped cells of a kind, appending rows up to n if needed."""
+        entry = self._open(kind)
+        if entry is None:
+            self._create(kind)
+            entry = self._open(kind)
+        if entry[0] < n:
+            self._append(kind, n, entry)
+            entry = self._open(kind)
+        return entry[1]
+    
+    def _open(self, kind: str) -> Optional[Tuple[int, np.ndarray]]:
+        """Map the file of a kind, reusing the current mapping while the file is unchanged."""
+        path = self.path(kind)
         try:
-            with open(key, 'rb') as f:
-                return pickle.load(f)
-        except (OSError, pickle.PickleError) as e:
-            logger.warning(f"Failed to load from disk cache: {e}")
+            stat = os.stat(path)
+        except FileNotFoundError:
+            self._maps.pop(kind, None)
             return None
-    
-    def triangular_recurrence_internal(self, n: int, k: int) -> float:
-        """Internal implementation of triangular recurrence without caching"""
-        # Handle base cases
-        if k == 0:
-            return 1.0 if n == 0 else 0.0
-        if n == 0 or k > n:
-            return 0.0
-        if k == n:
-            return 1.0
-        if k == 1:
-            return self.single_list_case(n)
         
-        # Check precomputed values
-        if (n, k) in self._precomputed:
-            return self._precomputed[(n, k)]
+        # Another process (or instance) may have appended rows since
+        cached = self._maps.get(kind)
+        if cached is not None and cached[2] == (stat.st_ino, stat.st_mtime_ns):
+            return cached[0], cached[1]
         
-        # Apply recurrence relation
-        term1 = self.triangular_recurrence(n-1, k-1)
-        term2 = (self.alpha * (n-1) + self.beta * k) * self.triangular_recurrence(n-1, k)
+        header = np.fromfile(path, dtype=_STORE_HEADER, count=1)
+        if (len(header) != 1 or header['magic'][0] != _STORE_MAGIC or
+                header['version'][0] != _STORE_VERSION or
+                header['kind'][0] != _STORE_KINDS.index(kind) or
+                header['alpha'][0] != self.alpha or header['beta'][0] != self.beta):
+            logger.warning(f"Ignoring invalid triangle store file: {path}")
+            return None
         
-        return term1 + term2
-    
-    def _explicit_formula_direct(self, n: int, k: int) -> float:
-        """Direct computation of explicit formula for moderate values"""
-        result = 0.0
-        for j in range(k+1):
-            # Calculate binomial coefficient C(k,j)
-            binom = math.comb(k, j)
-            
-            # Calculate rising factorial (β(k-j)|α)^n̄
-            base = self.beta * (k - j)
-            rising_fact = self.rising_factorial(base, n, self.alpha)
-            
-            # Add to sum with alternating sign
-            term = ((-1) ** j) * binom * rising_fact
-            result += term
+        # Bytes beyond the declared rows belong to an append in progress
+        n_max = int(header['n_max'][0])
+        cell = _STORE_CELLS[kind]
+        if stat.st_size < _STORE_HEADER.itemsize + cell.itemsize * _packed_offset(n_max + 1):
+            logger.warning(f"Ignoring truncated triangle store file: {path}")
+            return None
         
-        # Divide by β^k * k!
-        denominator = (self.beta ** k) * math.factorial(k)
-        return result / denominator if denominator != 0 else 0.0
+        cells = np.memmap(path, dtype=cell, mode='r', offset=_STORE_HEADER.itemsize,
+                          shape=(_packed_offset(n_max + 1),))
+        self._maps[kind] = (n_max, cells, (stat.st_ino, stat.st_mtime_ns))
+        return n_max, cells
     
-    def _explicit_formula_log_space(self, n: int, k: int) -> float:
-        """Compute explicit formula in log space for numerical stability"""
-        log_result = float('-inf')  # log(0)
-        sign = 1.0
+    def _create(self, kind: str) -> None:
+        """Write a file holding row 0 only, replacing any invalid file atomically."""
+        header = np.zeros(1, dtype=_STORE_HEADER)
+        header['magic'] = _STORE_MAGIC
+        header['version'] = _STORE_VERSION
+        header['kind'] = _STORE_KINDS.index(kind)
+        header['n_max'] = 0
+        header['alpha'] = self.alpha
+        header['beta'] = self.beta
+        row = np.zeros(1, dtype=_STORE_CELLS[kind])
+        if kind == 'value':
+            row[0] = 1.0
+        else:
+            row[0] = (0.0, 1)
         
-        for j in range(k+1):
-            # Calculate log of binomial coefficient
-            log_binom = math.log(math.comb(k, j))
-            
-            # Calculate log of rising factorial
-            base = self.beta * (k - j)
-            log_rising_fact = 0.0
-            term_sign = 1.0
-            
-            for i in range(n):
-                factor = base + i * self.alpha
-                if factor <= 0:
-                    # Handle possible negative or zero factors
-                    if factor == 0:
-                        log_rising_fact = float('-inf')
-                        break
-                    else:
-                        term_sign *= -1 if factor < 0 else 1
-                        log_rising_fact += math.log(abs(factor))
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header.tobytes())
+                f.write(row.tobytes())
+            self._maps.pop(kind, None)
+            os.replace(tmp_path, self.path(kind))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    def _append(self, kind: str, n_max: int, old: Tuple[int, np.ndarray]) -> None:
+        """Append rows old_n+1..n_max, continuing the recurrence from the last stored row."""
+        old_n, cells = old
+        cell = _STORE_CELLS[kind]
+        with open(self.path(kind), 'r+b') as f:
+            f.seek(_STORE_HEADER.itemsize + cell.itemsize * _packed_offset(old_n + 1))
+            last = cells[_packed_offset(old_n):_packed_offset(old_n + 1)]
+            with np.errstate(over='ignore', invalid='ignore'):
+                if kind == 'value':
+                    prev = np.zeros(n_max + 1)
+                    prev[:old_n + 1] = last
+                    current = np.empty_like(prev)
+                    for n in range(old_n + 1, n_max + 1):
+                        _advance_row(prev, n, self.alpha, self.beta, out=current)
+                        f.write(current[:n + 1].astype(cell).tobytes())
+                        prev, current = current, prev
                 else:
-                    log_rising_fact += math.log(factor)
-            
-            # Add to sum using log-sum-exp for numerical stability
-            j_sign = 1 if j % 2 == 0 else -1
-            combined_sign = j_sign * term_sign
+                    prev_log = np.full(n_max + 1, -np.inf)
+                    prev_sign = np.zeros(n_max + 1)
+                    prev_log[:old_n + 1] = last['log']
+                    prev_sign[:old_n + 1] = last['sign']
+                    log_row, sign_row = np.empty_like(prev_log), np.empty_like(prev_sign)
+                    records = np.empty(n_max + 1, dtype=cell)
+                    for n in range(old_n + 1, n_max + 1):
+                        _advance_log_row(prev_log, prev_sign, n, self.alpha, self.beta, log_row, sign_row)
+                        records['log'][:n + 1] = log_row[:n + 1]
+                        records['sign'][:n + 1] = sign_row[:n + 1]
+                        f.write(records[:n + 1].tobytes())
+                        prev_log, log_row = log_row, prev_log
+                        prev_sign, sign_row = sign_row, prev_sign
             
-            if log_rising_fact != float('-inf'):
-                term = log_binom + log_rising_fact
-                if log_result == float('-inf'):
-                    log_result = term
-                    sign = combined_sign
-                else:
-                    if term > log_result + 30:
-                        # If term is much bigger, it dominates
-                        log_result = term
-                        sign = combined_sign
-                    elif log_result > term + 30:
-                        # Current result dominates, do nothing
-                        pass
-                    else:
-                        # Use log-sum-exp for numerical stability
-                        if sign == combined_sign:
-                            # Same sign, add
-                            log_result = log_result + math.log1p(math.exp(term - log_result))
-                        else:
-                            # Different sign, subtract
-                            if term > log_result:
-                                log_result = term + math.log1p(-math.exp(log_result - term))
-                                sign = combined_sign
-                            else:
-                                log_result = log_result + math.log1p(-math.exp(term - log_result))
-        
-        # Apply denominator in log space
-        if self.beta <= 0 or k == 0:
-            if self.beta == 0 and k > 0:
-                return 0.0  # Result is 0 when denominator is 0
-            # Handle special case to avoid log(0)
-            return sign * math.exp(log_result) / math.factorial(k)
-        
-        log_denominator = k * math.log(self.beta) + math.log(math.factorial(k))
-        return sign * math.exp(log_result - log_denominator)
-    
-    def rising_factorial(self, x: float, n: int, increment: float = 1.0) -> float:
+            # Publish the new rows only once they are all written
+            f.flush()
+            f.seek(_STORE_HEADER.fields['n_max'][1])
+            f.write(np.array(n_max, dtype='<i8').tobytes())
+        self._maps.pop(kind, None)
+
+
+#---------------------------------------------------------------------------
+# Lazy triangle view
+#---------------------------------------------------------------------------
+
+class LazyTriangle:
+    """
+    Sliceable view of the triangle L{n,k}^{α,β} that materializes rows on demand.
+    
+    Row n is stored as an array of its n+1 entries L{n,0..n}. Touching a row
+    beyond the last materialized one extends the stored rows with the
+    triangular recurrence from the last row, so growing the view from n_max
+    to a larger n only computes the new rows.
+    
+    Indexing follows NumPy conventions on the infinite lower triangle:
+    
+    - tri[n] is row n as a read-only array of length n+1
+    - tri[n, k] is L{n,k} (0.0 for k > n)
+    - tri[a:b] and tri[a:b, c:d] are dense 2-D arrays, zero-padded for k > n
+    - tri[a:b, k] and tri[n, c:d] are 1-D column and row slices
+    
+    Row indices must be non-negative and row slices need an explicit stop.
+    
+    Attributes:
+        alpha (float): Weight parameter for non-head elements
+        beta (float): Weight parameter for head elements
+        nbytes (int): Approximate bytes held by the materialized rows
+    
+    Examples:
+        >>> tri = LazyTriangle(GeneralizedStirling(alpha=1.0, beta=1.0))
+        >>> tri[4, 2]
+        36.0
+        >>> tri[2:5, 1:3]
+        array([[ 2.,  1.],
+               [ 6.,  6.],
+               [24., 36.]])
+        >>> tri.n_max  # Rows 0..4 have been materialized
+        4
+    """
+    
+    def __init__(self, gs: 'GeneralizedStirling') -> None:
         """
-        Compute generalized rising factorial (x|α)^n̄
+        Initialize a view holding only row 0.
         
-        This calculates x(x+α)(x+2α)...(x+(n-1)α)
+        Args:
+            gs: Instance whose parameters (α, β) define the triangle
+        """
+        self.alpha = gs.alpha
+        self.beta = gs.beta
+        row = np.ones(1)
+        row.flags.writeable = False
+        self._rows: List[np.ndarray] = [row]
+        self.nbytes = sys.getsizeof(row)
+    
+    @property
+    def n_max(self) -> int:
+        """Last materialized row."""
+        return len(self._rows) - 1
+    
+    @staticmethod
+    def rows_nbytes(n_max: int) -> int:
+        """Approximate bytes held once rows 0..n_max are materialized."""
+        return 4 * (n_max + 1) * (n_max + 2) + (n_max + 1) * sys.getsizeof(np.empty(0))
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def extend(self, n_max: int) -> None:
+        """
+        Materialize all rows up to n_max, continuing from the last stored row.
         
-        Uses scipy.special.poch for enhanced numerical stability when available.
+        Args:
+            n_max: Row to materialize up to
+        """
+        if n_max <= self.n_max:
+            return
+        ks = np.arange(n_max + 1, dtype=float)
+        prev = self._rows[-1]
+        # Entries beyond the float64 range become inf, as in the other row kernels
+        with np.errstate(over='ignore', invalid='ignore'):
+            for n in range(len(self._rows), n_max + 1):
+                row = np.empty(n + 1)
+                row[:n] = (self.alpha * (n - 1) + self.beta * ks[:n]) * prev
+                row[n] = 0.0
+                row[1:] += prev
+                row.flags.writeable = False
+                self._rows.append(row)
+                self.nbytes += sys.getsizeof(row)
+                prev = row
+    
+    def row(self, n: int) -> np.ndarray:
+        """
+        Return row n as a read-only array of L{n,0..n}.
         
         Args:
-            x: Base value
-            n: Number of terms
-            increment: The increment between terms
+            n: Row number
             
         Returns:
-            The value of the rising factorial
-            
-        Examples:
-            >>> gs = GeneralizedStirling()
-            >>> gs.rising_factorial(2.0, 3, 0.5)
-            8.75  # 2.0 * 2.5 * 3.0
+            Array of length n+1
             
-            >>> gs.rising_factorial(1.0, 4, 1.0)
-            24.0  # 1 * 2 * 3 * 4
+        Raises:
+            IndexError: If n is negative
         """
         if n < 0:
-            raise ValueError(f"n must be non-negative, got {n}")
-            
-        if n == 0:
-            return 1.0
-        
-        # Use scipy's pochammer function if available (handles large values better)
-        if HAS_SCIPY and increment == 1.0:
-            try:
-                return scipy.special.poch(x, n)
-            except (OverflowError, ValueError):
-                pass  # Fall back to our implementation
+            raise IndexError(f"Row index must be non-negative, got {n}")
+        self.extend(n)
+        return self._rows[n]
+    
+    def __getitem__(self, index: Any) -> Union[float, np.ndarray]:
+        if isinstance(index, tuple):
+            if len(index) != 2:
+                raise IndexError(f"LazyTriangle takes at most 2 indices, got {len(index)}")
+            row_index, column_index = index
+        else:
+            row_index, column_index = index, slice(None)
         
-        # Fast path for small n
-        if n <= 20:
-            result = 1.0
-            for i in range(n):
-                factor = x + i * increment
-                result *= factor
-                if result == 0:  # Early exit for zero result
-                    return 0.0
-            return result
+        if isinstance(row_index, slice):
+            if row_index.stop is None or row_index.stop < 0 or (row_index.start or 0) < 0:
+                raise IndexError(f"Row slices need a non-negative start and an explicit non-negative stop, got {row_index}")
+            rows = range(*row_index.indices(row_index.stop))
+            if rows:
+                self.extend(max(rows))
+            width = self._width(column_index, max(rows) + 1 if rows else 0)
+            table = np.zeros((len(rows), width))
+            for i, n in enumerate(rows):
+                row = self._rows[n][:width]
+                table[i, :len(row)] = row
+            return table[:, column_index]
         
-        # For large n, use logarithms to avoid overflow
-        try:
-            log_result = 0.0
-            sign = 1.0
-            for i in range(n):
-                factor = x + i * increment
-                if factor == 0:
-                    return 0.0  # Early exit for zero result
-                elif factor < 0:
-                    sign *= -1
-                    log_result += math.log(abs(factor))
-                else:
-                    log_result += math.log(factor)
-            
-            return sign * math.exp(log_result)
-        except (OverflowError, ValueError) as e:
-            warnings.warn(f"Numerical overflow in rising factorial with x={x}, n={n}, increment={increment}: {e}")
-            return float('inf') if sign > 0 else float('-inf')
+        row = self.row(operator.index(row_index))
+        if isinstance(column_index, slice) and column_index == slice(None):
+            return row
+        width = self._width(column_index, len(row))
+        if width > len(row):
+            row = np.concatenate([row, np.zeros(width - len(row))])
+        value = row[:width][column_index]
+        return value if isinstance(column_index, slice) else float(value)
+    
+    @staticmethod
+    def _width(column_index: Any, width: int) -> int:
+        """Return the zero-padded row width needed to apply a column index."""
+        if isinstance(column_index, slice):
+            if column_index.stop is not None and column_index.stop >= 0:
+                return max(width, column_index.stop)
+            return width
+        k = operator.index(column_index)
+        if k < 0:
+            raise IndexError(f"Column index must be non-negative, got {k}")
+        return max(width, k + 1)
 
-# Maintain compatibility with old method name
-GeneralizedStirling.special_case = GeneralizedStirling.single_list_case
 
 #---------------------------------------------------------------------------
 # Convenience functions for common special cases
 #---------------------------------------------------------------------------
 
-def stirling_first_kind(n: int, k: int) -> float:
+# Warm engines shared by the convenience functions, keyed by (α, β, backend)
+_shared_instances: Dict[Tuple[float, float, str], 'GeneralizedStirling'] = {}
+
+# Rows built when a shared float engine is created, and the last row served
+# from its lazy triangle (larger n go through compute to bound memory)
+_SHARED_PREBUILT_ROWS = 64
+_SHARED_TABLE_ROWS = 2000
+
+
+def shared_instance(alpha: float, beta: float, backend: str = 'float') -> 'GeneralizedStirling':
+    """
+    Return the process-wide GeneralizedStirling instance for (α, β, backend).
+    
+    The instance is created on first use and kept, so its caches and tables
+    stay warm across calls. Float engines start with rows 0..64 of their lazy
+    triangle built.
+    
+    Args:
+        alpha: Weight parameter for non-head elements
+        beta: Weight parameter for head elements
+        backend: 'float' or 'exact' (an instance created with exact=True)
+        
+    Returns:
+        The shared instance; callers must not change its parameters
+        
+    Raises:
+        ValueError: If backend is not recognized
+        
+    Examples:
+        >>> shared_instance(1.0, 1.0) is shared_instance(1, 1)
+        True
+    """
+    if backend not in ('float', 'exact'):
+        raise ValueError(f"Unknown backend: {backend}. Valid backends are: ('float', 'exact')")
+    key = (float(alpha), float(beta), backend)
+    gs = _shared_instances.get(key)
+    if gs is None:
+        gs = GeneralizedStirling(alpha=alpha, beta=beta, exact=backend == 'exact')
+        if backend == 'float':
+            gs.lazy_triangle().extend(_SHARED_PREBUILT_ROWS)
+        gs = _shared_instances.setdefault(key, gs)
+    return gs
+
+
+def clear_shared_instances() -> None:
+    """Drop every shared instance created by shared_instance, releasing their tables."""
+    _shared_instances.clear()
+
+
+def _shared_value(alpha: float, beta: float, n: int, k: int, exact: bool) -> Union[float, int, Fraction]:
+    """Look up L{n,k}^{α,β} in the shared engine of the convenience functions."""
+    if n < 0 or k < 0:
+        raise ValueError(f"n and k must be non-negative, got n={n}, k={k}")
+    if exact:
+        return shared_instance(alpha, beta, 'exact').compute_exact(n, k)
+    gs = shared_instance(alpha, beta)
+    if n <= _SHARED_TABLE_ROWS:
+        return gs.lazy_triangle()[n, k]
+    return gs.compute(n, k)
+
+
+def stirling_first_kind(n: int, k: int, exact: bool = False) -> Union[float, int]:
     """
     Compute the unsigned Stirling number of the first kind.
     
-    This is equivalent to L{n,k}^{1,0}.
+    This is equivalent to L{n,k}^{1,0}. Values are read from the warm shared
+    instance for these parameters (see shared_instance), so repeated calls
+    cost a table lookup.
     
     Stirling numbers of the first kind count the number of permutations
     of n elements with exactly k cycles.
@@ -1174,9 +4422,10 @@ def stirling_first_kind(n: int, k: int) -> float:
     Args:
         n: Number of elements
         k: Number of cycles
+        exact: If True, return the exact integer
         
     Returns:
-        Value of the Stirling number of the first kind
+        Value of the Stirling number of the first kind (an int if exact)
         
     Raises:
         ValueError: If n or k are negative
@@ -1187,18 +4436,16 @@ def stirling_first_kind(n: int, k: int) -> float:
         >>> stirling_first_kind(5, 3)
         35.0
     """
-    if n < 0 or k < 0:
-        raise ValueError(f"n and k must be non-negative, got n={n}, k={k}")
-        
-    gs = GeneralizedStirling(alpha=1.0, beta=0.0)
-    return gs.compute(n, k)
+    return _shared_value(1.0, 0.0, n, k, exact)
 
 
-def stirling_second_kind(n: int, k: int) -> float:
+def stirling_second_kind(n: int, k: int, exact: bool = False) -> Union[float, int]:
     """
     Compute the Stirling number of the second kind.
     
-    This is equivalent to L{n,k}^{0,1}.
+    This is equivalent to L{n,k}^{0,1}. Values are read from the warm shared
+    instance for these parameters (see shared_instance), so repeated calls
+    cost a table lookup.
     
     Stirling numbers of the second kind count the number of ways to partition
     a set of n elements into exactly k non-empty subsets.
@@ -1206,9 +4453,10 @@ def stirling_second_kind(n: int, k: int) -> float:
     Args:
         n: Number of elements
         k: Number of subsets
+        exact: If True, return the exact integer
         
     Returns:
-        Value of the Stirling number of the second kind
+        Value of the Stirling number of the second kind (an int if exact)
         
     Raises:
         ValueError: If n or k are negative
@@ -1217,20 +4465,18 @@ def stirling_second_kind(n: int, k: int) -> float:
         >>> stirling_second_kind(4, 2)
         7.0
         >>> stirling_second_kind(5, 3)
-        10.0
+        25.0
     """
-    if n < 0 or k < 0:
-        raise ValueError(f"n and k must be non-negative, got n={n}, k={k}")
-        
-    gs = GeneralizedStirling(alpha=0.0, beta=1.0)
-    return gs.compute(n, k)
+    return _shared_value(0.0, 1.0, n, k, exact)
 
 
-def lah_number(n: int, k: int) -> float:
+def lah_number(n: int, k: int, exact: bool = False) -> Union[float, int]:
     """
     Compute the Lah number.
     
-    This is equivalent to L{n,k}^{1,1}.
+    This is equivalent to L{n,k}^{1,1}. Values are read from the warm shared
+    instance for these parameters (see shared_instance), so repeated calls
+    cost a table lookup.
     
     Lah numbers count the number of ways to partition a set of n elements
     into exactly k non-empty ordered lists (or linearly ordered subsets).
@@ -1238,9 +4484,10 @@ def lah_number(n: int, k: int) -> float:
     Args:
         n: Number of elements
         k: Number of ordered lists
+        exact: If True, return the exact integer
         
     Returns:
-        Value of the Lah number
+        Value of the Lah number (an int if exact)
         
     Raises:
         ValueError: If n or k are negative
@@ -1249,13 +4496,9 @@ def lah_number(n: int, k: int) -> float:
         >>> lah_number(4, 2)
         36.0
         >>> lah_number(5, 3)
-        60.0
+        120.0
     """
-    if n < 0 or k < 0:
-        raise ValueError(f"n and k must be non-negative, got n={n}, k={k}")
-        
-    gs = GeneralizedStirling(alpha=1.0, beta=1.0)
-    return gs.compute(n, k)
+    return _shared_value(1.0, 1.0, n, k, exact)
 
 
 #---------------------------------------------------------------------------
@@ -1267,7 +4510,9 @@ def parallel_generate_triangle(n_max: int, alpha: float = 1.0, beta: float = 1.0
     """
     Generate a triangle of generalized Stirling numbers using parallel processing.
     
-    This function uses multiple CPU cores to compute the triangle faster.
+    This function uses multiple CPU cores to compute the triangle faster. With
+    method='auto' the triangle is filled by parallel_triangle_array; any other
+    method computes the cells with that method, one block of rows per worker.
     
     Args:
         n_max: Maximum row number
@@ -1292,57 +4537,401 @@ def parallel_generate_triangle(n_max: int, alpha: float = 1.0, beta: float = 1.0
     if n_max < 0:
         raise ValueError(f"n_max must be non-negative, got {n_max}")
     
-    gs = GeneralizedStirling(alpha=alpha, beta=beta)
+    if method == 'auto':
+        table = parallel_triangle_array(n_max, alpha=alpha, beta=beta, processes=processes)
+        return [table[n, 1:n + 1].tolist() for n in range(1, n_max + 1)]
+    
+    # Interleave rows so every worker gets a similar share of cells
+    workers = max(1, min(processes or os.cpu_count() or 1, n_max))
+    tasks = [(alpha, beta, method, list(range(1 + i, n_max + 1, workers))) for i in range(workers)]
+    if workers == 1:
+        results = [_cells_worker(task) for task in tasks]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_cells_worker, tasks))
+    
+    # Place results in the triangle
     triangle = [[] for _ in range(n_max)]
+    for result in results:
+        for n, row in result:
+            triangle[n - 1] = row
+    return triangle
+
+
+# Fewest triangle cells worth a worker process of their own when processes=None
+_PARALLEL_MIN_CELLS = 250_000
+
+
+def parallel_triangle_array(n_max: int, alpha: float = 1.0, beta: float = 1.0,
+                            k_max: Optional[int] = None, processes: Optional[int] = None,
+                            block_rows: Optional[int] = None,
+                            return_stats: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, Dict[str, Any]]]:
+    """
+    Compute the triangle as a dense array with one worker process per column band.
+    
+    The columns are split into bands of about equal cell count, and each worker
+    fills its band into a shared-memory table with the vectorized triangular
+    recurrence. A band only needs the last column of the band to its left, so
+    the workers run as a pipeline synchronized once per block of rows, and no
+    cell is ever computed twice.
+    
+    Args:
+        n_max: Maximum row number
+        alpha: Weight parameter for non-head elements
+        beta: Weight parameter for head elements
+        k_max: Maximum column number (defaults to n_max)
+        processes: Number of worker processes (None = one per available core,
+                   but no more than one per _PARALLEL_MIN_CELLS cells of the
+                   triangle; 1 = compute in the calling process)
+        block_rows: Rows filled between synchronizations (None = chosen from
+                    n_max and the number of bands)
+        return_stats: If True, also return a dictionary of timing statistics
+        
+    Returns:
+        Array of shape (n_max+1, k_max+1) with table[n, k] = L{n,k}^{α,β}, the
+        same values as GeneralizedStirling.triangle_array. With return_stats,
+        a tuple (table, stats) where stats holds 'processes', 'bands',
+        'block_rows', 'wall_time', 'busy_time' (summed worker compute time),
+        'parallelism' (busy_time / wall_time, the average number of busy
+        workers rather than a speedup measured against the serial builder)
+        and 'efficiency' (parallelism / processes)
+        
+    Raises:
+        ValueError: If n_max or k_max is negative
+        RuntimeError: If a worker process fails
+        
+    Examples:
+        >>> table, stats = parallel_triangle_array(2000, processes=4, return_stats=True)
+        >>> table[4, 2]
+        36.0
+        >>> sorted(stats)
+        ['bands', 'block_rows', 'busy_time', 'efficiency', 'parallelism', 'processes', 'wall_time']
+    """
+    import multiprocessing
     
-    def compute_value(n: int, k: int) -> Tuple[int, int, float]:
-        return (n, k, gs.compute(n, k, method=method))
+    if k_max is None:
+        k_max = n_max
+    if n_max < 0 or k_max < 0:
+        raise ValueError(f"n_max and k_max must be non-negative, got n_max={n_max}, k_max={k_max}")
     
-    # Generate all (n,k) pairs to compute
-    pairs = [(n, k) for n in range(1, n_max + 1) for k in range(1, n + 1)]
+    start_time = time.perf_counter()
+    if processes is None:
+        # Starting a worker costs more than the recurrence on a small band
+        cells = (k_max + 1) * (n_max + 1) - k_max * (k_max + 1) // 2
+        processes = max(1, min(os.cpu_count() or 1, cells // _PARALLEL_MIN_CELLS))
+    bounds = _band_boundaries(n_max, k_max, processes)
+    bands = len(bounds) - 1
+    if block_rows is None:
+        block_rows = max(1, min(64, n_max // (4 * bands)))
     
-    # Compute values in parallel
-    with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
-        results = list(executor.map(lambda p: compute_value(*p), pairs))
+    if bands == 1:
+        table = _triangle_array(alpha, beta, n_max, k_max)
+        busy_time = time.perf_counter() - start_time
+    else:
+        ctx = multiprocessing.get_context()
+        shape = (n_max + 1, k_max + 1)
+        table_buffer = ctx.RawArray('d', shape[0] * shape[1])
+        table = np.frombuffer(table_buffer, dtype=np.float64).reshape(shape)
+        table[0, 0] = 1.0
+        
+        # Band j has nothing to do above row bounds[j], so those rows count as done
+        progress = ctx.RawArray('q', [max(0, lo - 1) for lo in bounds[:-1]])
+        busy = ctx.RawArray('d', bands)
+        ready = ctx.Condition()
+        workers = [ctx.Process(target=_band_worker,
+                               args=(table_buffer, shape, bounds, band, float(alpha), float(beta),
+                                     block_rows, progress, ready, busy))
+                   for band in range(bands)]
+        for worker in workers:
+            worker.start()
+        
+        # Bands only wait on their left neighbors, so joining left to right
+        # finds the first failure before anything waits on it forever
+        try:
+            for band, worker in enumerate(workers):
+                worker.join()
+                if worker.exitcode != 0:
+                    raise RuntimeError(f"Band worker {band} failed with exit code {worker.exitcode}")
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                    worker.join()
+        busy_time = sum(busy)
     
-    # Place results in the triangle
-    for n, k, value in results:
-        triangle[n-1].append(value)
+    if not return_stats:
+        return table
+    wall_time = time.perf_counter() - start_time
+    parallelism = busy_time / wall_time if wall_time > 0 else 1.0
+    stats = {
+        'processes': bands,
+        'bands': [(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])],
+        'block_rows': block_rows,
+        'wall_time': wall_time,
+        'busy_time': busy_time,
+        'parallelism': parallelism,
+        'efficiency': parallelism / bands
+    }
+    return table, stats
+
+
+def sweep_triangles(alphas: Union[float, np.ndarray], betas: Union[float, np.ndarray],
+                    n_max: int, k_max: Optional[int] = None) -> np.ndarray:
+    """
+    Compute triangles for many (α, β) pairs in one pass.
     
-    return triangle
+    The row recurrence is run once with NumPy broadcasting over a leading
+    parameter axis, so a scan over P parameter pairs costs n_max row steps on
+    (P, k_max+1) arrays instead of P separate GeneralizedStirling instances.
+    
+    Args:
+        alphas: α values (scalar or array, broadcast against betas)
+        betas: β values (scalar or array, broadcast against alphas)
+        n_max: Maximum row number
+        k_max: Maximum column number (defaults to n_max)
+        
+    Returns:
+        Array of shape (P, n_max+1, k_max+1) where P is the number of broadcast
+        parameter pairs and result[p, n, k] = L{n,k}^{α_p,β_p}
+        
+    Raises:
+        ValueError: If n_max or k_max is negative
+        
+    Examples:
+        >>> alphas, betas = np.meshgrid(np.linspace(0, 1, 3), np.linspace(0, 1, 3))
+        >>> sweep_triangles(alphas.ravel(), betas.ravel(), 10).shape
+        (9, 11, 11)
+    """
+    if k_max is None:
+        k_max = n_max
+    if n_max < 0 or k_max < 0:
+        raise ValueError(f"n_max and k_max must be non-negative, got n_max={n_max}, k_max={k_max}")
+    
+    alphas, betas = np.broadcast_arrays(np.asarray(alphas, dtype=float), np.asarray(betas, dtype=float))
+    alphas, betas = alphas.reshape(-1, 1), betas.reshape(-1, 1)
+    
+    table = np.zeros((alphas.shape[0], n_max + 1, k_max + 1))
+    table[:, 0, 0] = 1.0
+    for n in range(1, n_max + 1):
+        _advance_row(table[:, n - 1], n, alphas, betas, out=table[:, n])
+    return table
+
+
+def multimodular_rows(rows: List[int], alpha: Union[int, float, Fraction] = 1,
+                      beta: Union[int, float, Fraction] = 1, k_max: Optional[int] = None,
+                      processes: Optional[int] = None) -> np.ndarray:
+    """
+    Compute exact rows of the triangle by multi-prime modular arithmetic and CRT.
+    
+    The integer triangle for α = a/d, β = b/d is swept modulo enough word-size
+    primes to cover the largest magnitude in the requested rows, one prime per
+    task in a process pool, using int64 row vectors. Big integers only appear
+    when the residues of the requested rows are combined by the Chinese
+    remainder theorem, never in the recurrence itself.
+    
+    The sweep costs O(n_max * k_max) int64 operations per prime, with the
+    primes split into one batch per worker and each batch advanced as a single
+    2-D array, while the reconstruction costs one big-integer operation per
+    prime and entry. The residue sweep is the part that scales across cores;
+    on a single core the big-integer recurrence of exact_triangle is usually
+    faster, so this path pays off for a few large rows on many-core machines.
+    
+    Args:
+        rows: Row numbers n to reconstruct
+        alpha: Weight parameter for non-head elements (read as a rational)
+        beta: Weight parameter for head elements (read as a rational)
+        k_max: Maximum column number (defaults to the largest requested row)
+        processes: Number of worker processes (None = one per available core,
+                   1 = compute in the calling process)
+        
+    Returns:
+        Object array of shape (len(rows), k_max+1) holding the same exact values
+        as the corresponding rows of GeneralizedStirling.exact_triangle
+        
+    Raises:
+        ValueError: If a row number or k_max is negative
+        
+    Examples:
+        >>> table = multimodular_rows([200], alpha=1, beta=1, k_max=5)
+        >>> table[0, 1] == math.factorial(200)
+        True
+    """
+    import concurrent.futures
+    
+    rows = list(rows)
+    if not rows:
+        return np.zeros((0, 0 if k_max is None else k_max + 1), dtype=object)
+    n_max = max(rows)
+    if k_max is None:
+        k_max = n_max
+    if min(rows) < 0 or k_max < 0:
+        raise ValueError(f"Row numbers and k_max must be non-negative, got rows={rows}, k_max={k_max}")
+    
+    a, b, d = _exact_parameters(alpha, beta)
+    wanted = set(rows)
+    
+    # |L^{a,b}| <= L^{|a|,|b|}, whose log-domain rows bound the bits needed
+    max_log = 0.0
+    for n, log_row, _ in _iter_log_rows(abs(a), abs(b), n_max, k_max):
+        if n in wanted:
+            max_log = max(max_log, float(np.max(log_row)))
+    bits = int(max_log / math.log(2)) + 3  # |x| < M/4 plus rounding slack
+    primes = _word_primes(bits // 30 + 1)  # each prime carries just over 30 bits
+    
+    # Split the primes into one batch per worker
+    workers = processes or os.cpu_count() or 1
+    batches = [primes[i::workers] for i in range(min(workers, len(primes)))]
+    tasks = [(a, b, n_max, k_max, batch, wanted) for batch in batches]
+    if workers == 1:
+        results = [_rows_mod_worker(task) for task in tasks]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_rows_mod_worker, tasks))
+    
+    batch_primes = [p for batch in batches for p in batch]
+    residues = [residue for result in results for residue in result]
+    by_row = dict(zip(sorted(wanted), _crt_combine(residues, batch_primes)))
+    table = np.array([by_row[n] for n in rows], dtype=object).reshape(len(rows), k_max + 1)
+    if d != 1:
+        for i, n in enumerate(rows):
+            for k in range(min(n, k_max) + 1):
+                table[i, k] = _exact_value(table[i, k], d, n - k)
+    return table
 
 
 def memory_efficient_iterator(n_max: int, alpha: float = 1.0, beta: float = 1.0, 
-                             method: str = 'auto') -> Iterator[Tuple[int, int, float]]:
+                             method: str = 'auto', k_max: Optional[int] = None, rows: bool = False,
+                             sink: Optional[Any] = None, sink_format: str = 'binary',
+                             chunk_rows: int = 256) -> Iterator[Union[Tuple[int, int, float], Tuple[int, np.ndarray]]]:
     """
     Memory-efficient iterator for generalized Stirling numbers.
     
     Instead of generating the entire triangle at once, this iterator
-    yields values one at a time to conserve memory.
+    yields values one at a time to conserve memory. With method='auto' the
+    rows are streamed from the vectorized recurrence holding only the current
+    and previous row, so memory stays O(k_max) however many values are
+    produced, and no GeneralizedStirling cache is touched; 'triangular' is
+    the same recurrence and streams the same way. Other methods compute each
+    cell on a private instance whose caches are dropped after every row
+    (values beyond the float64 range become ±inf). If the caller stops
+    early, the rows already yielded are still written to the sink.
     
     Args:
         n_max: Maximum row number
         alpha: Weight parameter for non-head elements
         beta: Weight parameter for head elements
         method: Method to use for computation
+        k_max: Maximum column number (defaults to n_max)
+        rows: If True, yield (n, values) per row instead of one tuple per value,
+              where values[k-1] = L{n,k} for 1 <= k <= min(n, k_max)
+        sink: Optional path or open file; every chunk of rows is also written
+              there as it is produced
+        sink_format: 'binary' writes the values as packed float64 in iteration
+                     order (read back with np.fromfile); 'csv' writes "n,k,value"
+                     lines (file objects must be opened in the matching mode)
+        chunk_rows: Number of rows buffered per write to the sink
         
     Yields:
-        Tuples of (n, k, value) for each generalized Stirling number
+        Tuples of (n, k, value) for each generalized Stirling number, or
+        (n, values) tuples of float arrays if rows is True
         
     Raises:
-        ValueError: If n_max is negative
+        ValueError: If n_max, k_max or chunk_rows is out of range, or
+                    sink_format is unknown
         
     Examples:
         >>> for n, k, value in memory_efficient_iterator(3, alpha=1.0, beta=1.0):
         ...     if n == 3 and k == 2:
         ...         print(f"L{{3,2}}^{{1,1}} = {value}")
         L{3,2}^{1,1} = 6.0
+        
+        >>> for n, values in memory_efficient_iterator(10**4, k_max=3, rows=True, sink='lah.bin'):
+        ...     pass  # Streams 3 columns of 10^4 rows to lah.bin
     """
     if n_max < 0:
         raise ValueError(f"n_max must be non-negative, got {n_max}")
-        
-    gs = GeneralizedStirling(alpha=alpha, beta=beta)
+    if k_max is None:
+        k_max = n_max
+    if k_max < 0 or chunk_rows < 1:
+        raise ValueError(f"k_max must be non-negative and chunk_rows positive, got k_max={k_max}, chunk_rows={chunk_rows}")
+    if sink_format not in ('binary', 'csv'):
+        raise ValueError(f"Unknown sink format: {sink_format}. Valid formats are: ('binary', 'csv')")
     
+    stream = _stream_rows(n_max, alpha, beta, method, k_max)
+    if sink is not None:
+        stream = _tee_rows(stream, sink, sink_format, chunk_rows)
+    
+    try:
+        for n, values in stream:
+            if rows:
+                yield n, values
+            else:
+                for k, value in enumerate(values.tolist(), start=1):
+                    yield (n, k, value)
+    finally:
+        # Close the stream now rather than at garbage collection, so the sink
+        # receives the rows already yielded when the caller stops early
+        stream.close()
+
+
+def _stream_rows(n_max: int, alpha: float, beta: float, method: str,
+                 k_max: int) -> Iterator[Tuple[int, np.ndarray]]:
+    """Yield (n, [L{n,1}, ..., L{n,min(n,k_max)}]) for n = 1..n_max as fresh arrays."""
+    if method in ('auto', 'triangular'):
+        # The triangular recurrence is the row engine itself
+        with np.errstate(over='ignore', invalid='ignore'):
+            for n, row in _iter_rows(alpha, beta, n_max, k_max):
+                if n > 0:
+                    yield n, row[1:min(n, k_max) + 1].copy()
+        return
+    
+    def as_float(value: Union[float, int, Fraction]) -> float:
+        # Some methods return exact ints beyond the float64 range
+        try:
+            return float(value)
+        except OverflowError:
+            return math.inf if value > 0 else -math.inf
+    
+    gs = GeneralizedStirling(alpha=alpha, beta=beta)
     for n in range(1, n_max + 1):
-        for k in range(1, n + 1):
-            yield (n, k, gs.compute(n, k, method=method))
+        values = np.array([as_float(gs.compute(n, k, method=method)) for k in range(1, min(n, k_max) + 1)])
+        # Drop the memory cache and the LazyTriangle rows, keeping memory O(n) per row
+        gs.clear_cache()
+        yield n, values
+
+
+def _tee_rows(stream: Iterator[Tuple[int, np.ndarray]], sink: Any, sink_format: str,
+              chunk_rows: int) -> Iterator[Tuple[int, np.ndarray]]:
+    """Pass rows through while writing them to a sink chunk by chunk."""
+    owns_file = isinstance(sink, (str, os.PathLike))
+    f = open(sink, 'wb' if sink_format == 'binary' else 'w') if owns_file else sink
+    
+    def flush(chunk: List[Tuple[int, np.ndarray]]) -> None:
+        if sink_format == 'binary':
+            f.write(np.concatenate([values for _, values in chunk]).tobytes())
+        else:
+            f.write(''.join(f"{n},{k},{value!r}\n" for n, values in chunk
+                            for k, value in enumerate(values.tolist(), start=1)))
+    
+    chunk = []
+    try:
+        for n, values in stream:
+            chunk.append((n, values))
+            if len(chunk) >= chunk_rows:
+                flush(chunk)
+                chunk = []
+            yield n, values
+    finally:
+        # Also reached on close() when the consumer stops early: rows it has
+        # already received still belong in the sink
+        try:
+            if chunk:
+                flush(chunk)
+        finally:
+            stream.close()
+            if owns_file:
+                f.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,12 +10,17 @@ as a special case.
 """
 
 import math
-from functools import lru_cache
 import numpy as np
 import warnings
 from collections import defaultdict
+from fractions import Fraction
 import time
 
+try:
+    from .generalized_stirling import _as_fraction, _classical_family, _family_exact, _family_log, _family_value
+except ImportError:  # imported as a top-level module
+    from generalized_stirling import _as_fraction, _classical_family, _family_exact, _family_log, _family_value
+
 class HsuShiueStirling:
     """
     Implementation of Hsu-Shiue generalized Stirling numbers S(n,k;α,β,r).
@@ -44,6 +49,13 @@ class HsuShiueStirling:
         # In-memory cache for quick lookups
         self._memory_cache = {}
         
+        # r-Stirling, Whitney and Lah parameters are computed by closed-form kernels
+        # (the generalized_stirling weight is -α(n-1) + βk + r)
+        self._family = _classical_family(-alpha, beta, r)
+        
+        # Rows S(m,0..w-1) filled by the triangular recurrence, reused across queries
+        self._triangular_rows = []
+        
         # Performance metrics
         self.compute_time = defaultdict(float)
         self.cache_hits = defaultdict(int)
@@ -94,13 +106,17 @@ class HsuShiueStirling:
             warnings.warn(f"Numerical overflow in falling factorial with x={x}, n={n}, increment={increment}")
             return float('inf')
     
-    @lru_cache(maxsize=10000)
     def triangular_recurrence(self, n, k):
         """
         Compute S(n,k;α,β,r) using the triangular recurrence relation.
         
         S(n,k;α,β,r) = S(n-1,k-1;α,β,r) + (βk - α(n-1) + r)S(n-1,k;α,β,r)
         
+        The recurrence is filled iteratively into a table of rows kept by the
+        instance, so large n cannot hit the recursion limit. A larger n only
+        adds the missing rows; a k beyond the stored width rebuilds the table
+        at twice the width.
+        
         Args:
             n (int): First parameter
             k (int): Second parameter
@@ -117,19 +133,19 @@ class HsuShiueStirling:
         self.cache_misses['triangular'] += 1
         start_time = time.time()
         
-        # Base cases
-        if k == 0:
-            if n == 0:
-                result = 1.0
-            else:
-                result = self.r ** n
-        elif n == 0 or k > n:
+        if k > n:
             result = 0.0
         else:
-            # Apply recurrence relation
-            term1 = self.triangular_recurrence(n-1, k-1)
-            term2 = (self.beta * k - self.alpha * (n-1) + self.r) * self.triangular_recurrence(n-1, k)
-            result = term1 + term2
+            rows = self._triangular_rows
+            width = len(rows[0]) if rows else 0
+            if k >= width:
+                rows = self._triangular_rows = []
+                width = max(k + 1, 2 * width)
+            if not rows:
+                rows.append([1.0] + [0.0] * (width - 1))
+            for i in range(len(rows), n + 1):
+                rows.append(self._next_row(rows[-1], i))
+            result = rows[n][k]
         
         # Update cache and timing
         self._memory_cache[cache_key] = result
@@ -137,6 +153,14 @@ class HsuShiueStirling:
         
         return result
     
+    def _next_row(self, prev, i):
+        """Build row i of the triangle from row i-1 with the triangular recurrence."""
+        # Column 0 follows the recurrence with k=0: ∏_{m<i} (r - αm)
+        row = [(self.r - self.alpha * (i-1)) * prev[0]] + [0.0] * (len(prev) - 1)
+        for j in range(1, min(i, len(prev) - 1) + 1):
+            row[j] = prev[j-1] + (self.beta * j - self.alpha * (i-1) + self.r) * prev[j]
+        return row
+    
     def bottom_up_computation(self, n, k):
         """
         Compute S(n,k;α,β,r) using bottom-up dynamic programming.
@@ -172,8 +196,8 @@ class HsuShiueStirling:
         
         # Fill the table row by row
         for i in range(1, n+1):
-            # Base case for k=0: r^i
-            next_row[0] = self.r ** i
+            # Column 0 follows the recurrence with k=0: ∏_{m<i} (r - αm)
+            next_row[0] = (self.r - self.alpha * (i-1)) * current_row[0]
             
             for j in range(1, min(i, k)+1):
                 # Recurrence relation
@@ -194,6 +218,10 @@ class HsuShiueStirling:
         """
         Compute S(n,k;α,β,r) using the specified method.
         
+        With method='auto', the r-Stirling, Whitney and Lah families (up to
+        scaling) are computed from their closed forms, unless the recurrence
+        is estimated to be cheaper.
+        
         Args:
             n (int): First parameter
             k (int): Second parameter
@@ -202,6 +230,11 @@ class HsuShiueStirling:
         Returns:
             float: Value of the generalized Stirling number
         """
+        if method == 'auto' and self._family is not None:
+            value = _family_value(self._family, n, k, max_cost=(n + 1) * (1000 + k))
+            if value is not None:
+                return value
+        
         # Auto-select the best method based on input size
         if method == 'auto':
             if n > 50 or k > 25:
@@ -217,6 +250,66 @@ class HsuShiueStirling:
         else:  # Default to triangular
             return self.triangular_recurrence(n, k)
     
+    def compute_exact(self, n, k):
+        """
+        Compute S(n,k;α,β,r) exactly.
+        
+        α, β and r are read as rationals (floats through their shortest repr).
+        The classical families use their closed forms; other parameters run
+        the triangular recurrence in Fractions.
+        
+        Args:
+            n (int): First parameter
+            k (int): Second parameter
+            
+        Returns:
+            int or Fraction: Exact value of the generalized Stirling number
+        """
+        cache_key = ('exact', n, k)
+        if cache_key in self._memory_cache:
+            self.cache_hits['exact'] += 1
+            return self._memory_cache[cache_key]
+        
+        self.cache_misses['exact'] += 1
+        start_time = time.time()
+        
+        alpha, beta, r = (_as_fraction(x) for x in (self.alpha, self.beta, self.r))
+        family = _classical_family(-alpha, beta, r)
+        result = _family_exact(family, n, k) if family is not None else None
+        if result is None:
+            row = [Fraction(1)] + [Fraction(0)] * k
+            for i in range(1, n + 1):
+                row = [(r - alpha * (i-1)) * row[0]] + [row[j-1] + (beta * j - alpha * (i-1) + r) * row[j]
+                                                        for j in range(1, k + 1)]
+            result = row[k].numerator if row[k].denominator == 1 else row[k]
+        
+        self._memory_cache[cache_key] = result
+        self.compute_time['exact'] += time.time() - start_time
+        return result
+    
+    def compute_log(self, n, k):
+        """
+        Compute S(n,k;α,β,r) in the log domain as (log|S|, sign).
+        
+        The classical families take the log of their exact closed forms, so
+        values far beyond the float64 range are represented without overflow;
+        other parameters take the log of compute_exact.
+        
+        Args:
+            n (int): First parameter
+            k (int): Second parameter
+            
+        Returns:
+            tuple: (log|S|, sign) with sign 1.0, -1.0 or 0.0; zero is (-inf, 0.0)
+        """
+        result = _family_log(self._family, n, k) if self._family is not None else None
+        if result is None:
+            value = Fraction(self.compute_exact(n, k))
+            if value == 0:
+                return float('-inf'), 0.0
+            result = (math.log(abs(value.numerator)) - math.log(value.denominator), 1.0 if value > 0 else -1.0)
+        return result
+    
     def generate_triangle(self, n_max, format_str="{:.0f}"):
         """
         Generate a triangle of generalized Stirling numbers.
@@ -239,7 +332,7 @@ class HsuShiueStirling:
     def clear_cache(self):
         """Clear all caches to free memory"""
         self._memory_cache.clear()
-        self.triangular_recurrence.cache_clear()
+        self._triangular_rows = []
         # Reset performance counters
         self.compute_time.clear()
         self.cache_hits.clear()
@@ -306,7 +399,19 @@ def compute_from_L_notation(n, k, alpha, beta):
 
 # Special cases of generalized Stirling numbers
 
-def r_stirling_first_kind(n, k, r):
+def _special_value(alpha, beta, r, n, k, exact, log):
+    """Compute S(n,k;α,β,r) as a float, an exact value or a (log|S|, sign) pair."""
+    if exact and log:
+        raise ValueError("exact and log cannot both be requested")
+    gs = HsuShiueStirling(alpha=alpha, beta=beta, r=r)
+    if exact:
+        return gs.compute_exact(n, k)
+    if log:
+        return gs.compute_log(n, k)
+    return gs.compute(n, k)
+
+
+def r_stirling_first_kind(n, k, r, exact=False, log=False):
     """
     Compute the r-Stirling number of the first kind.
     
@@ -317,15 +422,17 @@ def r_stirling_first_kind(n, k, r):
         n (int): Number of elements
         k (int): Number of cycles
         r (int): Parameter r
+        exact (bool): If True, return the exact value
+        log (bool): If True, return (log|value|, sign)
         
     Returns:
         float: Value of the r-Stirling number of the first kind
+        (an int if exact, a tuple if log)
     """
-    gs = HsuShiueStirling(alpha=-1.0, beta=0.0, r=r)
-    return gs.compute(n, k)
+    return _special_value(-1.0, 0.0, r, n, k, exact, log)
 
 
-def r_stirling_second_kind(n, k, r):
+def r_stirling_second_kind(n, k, r, exact=False, log=False):
     """
     Compute the r-Stirling number of the second kind.
     
@@ -336,15 +443,17 @@ def r_stirling_second_kind(n, k, r):
         n (int): Number of elements
         k (int): Number of subsets
         r (int): Parameter r
+        exact (bool): If True, return the exact value
+        log (bool): If True, return (log|value|, sign)
         
     Returns:
         float: Value of the r-Stirling number of the second kind
+        (an int if exact, a tuple if log)
     """
-    gs = HsuShiueStirling(alpha=0.0, beta=1.0, r=r)
-    return gs.compute(n, k)
+    return _special_value(0.0, 1.0, r, n, k, exact, log)
 
 
-def whitney_first_kind(n, k, m):
+def whitney_first_kind(n, k, m, exact=False, log=False):
     """
     Compute the Whitney number of the first kind.
     
@@ -352,15 +461,21 @@ def whitney_first_kind(n, k, m):
         n (int): First parameter
         k (int): Second parameter
         m (float): Parameter of the Dowling lattice
+        exact (bool): If True, return the exact value
+        log (bool): If True, return (log|value|, sign)
         
     Returns:
         float: Value of the Whitney number of the first kind
+        (exact if exact, a tuple if log)
     """
-    gs = HsuShiueStirling(alpha=-m, beta=0.0, r=0.0)
-    return (-1)**(n-k) * gs.compute(n, k)
+    value = _special_value(-m, 0.0, 0.0, n, k, exact, log)
+    sign = (-1)**(n-k)
+    if log:
+        return value[0], sign * value[1] if value[1] else 0.0
+    return sign * value
 
 
-def whitney_second_kind(n, k, m):
+def whitney_second_kind(n, k, m, exact=False, log=False):
     """
     Compute the Whitney number of the second kind.
     
@@ -368,9 +483,11 @@ def whitney_second_kind(n, k, m):
         n (int): First parameter
         k (int): Second parameter
         m (float): Parameter of the Dowling lattice
+        exact (bool): If True, return the exact value
+        log (bool): If True, return (log|value|, sign)
         
     Returns:
         float: Value of the Whitney number of the second kind
+        (exact if exact, a tuple if log)
     """
-    gs = HsuShiueStirling(alpha=0.0, beta=m, r=0.0)
-    return gs.compute(n, k)
+    return _special_value(0.0, m, 0.0, n, k, exact, log)
@@ -14,11 +14,30 @@ import sys
 import os
 from pathlib import Path
 import math
+import tempfile
+import warnings
+from unittest import mock
+import time
+import numpy as np
+from fractions import Fraction
 from functools import lru_cache
 
 # Add the src directory to the path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
-from generalized_stirling import GeneralizedStirling, stirling_first_kind, stirling_second_kind, lah_number
+from generalized_stirling import (GeneralizedStirling, stirling_first_kind, stirling_second_kind, lah_number,
+                                  multimodular_rows, StirlingPolynomials, sweep_triangles,
+                                  ScaledTriangleCache, BoundedCache, TriangleStore,
+                                  parallel_triangle_array, parallel_generate_triangle,
+                                  memory_efficient_iterator, LazyTriangle, shared_instance,
+                                  clear_shared_instances, HAS_MPMATH)
+from hsu_shiue_stirling import (HsuShiueStirling, r_stirling_first_kind, r_stirling_second_kind,
+                                 whitney_first_kind, whitney_second_kind)
+import generalized_stirling
+
+
+def setUpModule():
+    # Keep method='auto' independent of any calibration profile on this machine
+    generalized_stirling._active_profile = None
 
 
 class TestGeneralizedStirling(unittest.TestCase):
@@ -106,7 +125,7 @@ class TestGeneralizedStirling(unittest.TestCase):
             (2, 1): 2, (2, 2): 1,
             (3, 1): 6, (3, 2): 6, (3, 3): 1,
             (4, 1): 24, (4, 2): 36, (4, 3): 12, (4, 4): 1,
-            (5, 1): 120, (5, 2): 240, (5, 3): 120, (5, 4): 30, (5, 5): 1
+            (5, 1): 120, (5, 2): 240, (5, 3): 120, (5, 4): 20, (5, 5): 1
         }
         
         for (n, k), expected in known_values.items():
@@ -264,5 +283,1083 @@ class TestGeneralizedStirling(unittest.TestCase):
         self.assertEqual(self.gs_lah.symmetric_function(2, 2), 36.0)
 
 
+class TestTriangleArray(unittest.TestCase):
+    """Tests for the vectorized row-recurrence triangle engine."""
+    
+    def setUp(self):
+        """Set up instances for testing."""
+        self.gs_lah = GeneralizedStirling(alpha=1.0, beta=1.0)
+        self.gs_custom = GeneralizedStirling(alpha=2.0, beta=3.0)
+        self.tol = 1e-10
+    
+    def test_matches_compute(self):
+        """Test that every cell of the array matches compute()."""
+        for gs in [self.gs_lah, self.gs_custom]:
+            table = gs.triangle_array(12)
+            self.assertEqual(table.shape, (13, 13))
+            for n in range(13):
+                for k in range(13):
+                    expected = gs.compute(n, k, method='bottom_up') if k <= n else 0.0
+                    self.assertAlmostEqual(table[n, k], expected, delta=self.tol * max(1.0, abs(expected)),
+                                           msg=f"triangle_array[{n},{k}]^{{{gs.alpha},{gs.beta}}}")
+    
+    def test_column_truncation(self):
+        """Test that k_max truncates columns without changing values."""
+        full = self.gs_custom.triangle_array(15)
+        truncated = self.gs_custom.triangle_array(15, k_max=4)
+        self.assertEqual(truncated.shape, (16, 5))
+        self.assertTrue((full[:, :5] == truncated).all())
+    
+    def test_generate_triangle_uses_rows(self):
+        """Test that generate_triangle agrees across auto and per-cell methods."""
+        auto = self.gs_custom.generate_triangle(8)
+        per_cell = self.gs_custom.generate_triangle(8, method='bottom_up')
+        self.assertEqual(auto, per_cell)
+        
+        with self.assertRaises(ValueError):
+            self.gs_lah.triangle_array(-1)
+
+
+class TestLogDomain(unittest.TestCase):
+    """Tests for the log-magnitude/sign triangle engine."""
+    
+    def test_matches_float_triangle(self):
+        """Test that the log triangle reproduces the float triangle, including signs."""
+        for alpha, beta in [(1.0, 1.0), (2.0, 3.0), (1.0, 0.0), (-1.0, 2.0), (0.5, -1.5)]:
+            gs = GeneralizedStirling(alpha=alpha, beta=beta)
+            table = gs.triangle_array(20)
+            log_table, sign_table = gs.log_triangle(20)
+            for n in range(21):
+                for k in range(n + 1):
+                    value = sign_table[n, k] * math.exp(log_table[n, k])
+                    self.assertAlmostEqual(value, table[n, k], delta=1e-9 * max(1.0, abs(table[n, k])),
+                                           msg=f"log_triangle[{n},{k}]^{{{alpha},{beta}}}")
+    
+    def test_beyond_float_range(self):
+        """Test Lah values far past the float64 overflow point against the closed form."""
+        gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+        n, k = 3000, 40
+        log_value, sign = gs.compute_log(n, k)
+        expected = math.log(math.comb(n - 1, k - 1)) + math.lgamma(n + 1) - math.lgamma(k + 1)
+        self.assertEqual(sign, 1.0)
+        self.assertAlmostEqual(log_value, expected, delta=1e-9 * expected)
+        
+        # Second lookup is served from the cache
+        self.assertEqual(gs.compute_log(n, k), (log_value, sign))
+        self.assertGreater(gs.get_performance_stats()['cache_hits'].get('log', 0), 0)
+    
+    def test_zero_values(self):
+        """Test that zeros are reported as (-inf, 0)."""
+        gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+        self.assertEqual(gs.compute_log(3, 5), (float('-inf'), 0.0))
+        self.assertEqual(gs.compute_log(3, 0), (float('-inf'), 0.0))
+        self.assertEqual(gs.compute_log(0, 0), (0.0, 1.0))
+
+
+class TestExactBackend(unittest.TestCase):
+    """Tests for the exact integer/Fraction row recurrence."""
+    
+    def test_lah_closed_form(self):
+        """Test exact Lah numbers beyond 2^53 against C(n-1,k-1) n!/k!."""
+        gs = GeneralizedStirling(alpha=1, beta=1)
+        for n, k in [(30, 3), (60, 7), (100, 50)]:
+            expected = math.comb(n - 1, k - 1) * math.factorial(n) // math.factorial(k)
+            self.assertEqual(gs.compute_exact(n, k), expected)
+    
+    def test_rational_parameters(self):
+        """Test that rational parameters give exact Fractions."""
+        gs = GeneralizedStirling(alpha=Fraction(1, 2), beta=Fraction(1, 3))
+        # L{3,2} = L{2,1} + (2α + 2β) L{2,2} = (α + β) + 2α + 2β
+        self.assertEqual(gs.compute_exact(3, 2), 3 * (Fraction(1, 2) + Fraction(1, 3)))
+        
+        # Floats are read through their decimal representation
+        gs_float = GeneralizedStirling(alpha=0.1, beta=1)
+        self.assertEqual(gs_float.compute_exact(3, 1), (1 + Fraction(1, 10)) * (1 + Fraction(2, 10)))
+    
+    def test_exact_mode_and_triangle(self):
+        """Test exact=True routing in compute() and the exact triangle."""
+        gs = GeneralizedStirling(alpha=2, beta=3, exact=True)
+        table = gs.exact_triangle(10)
+        float_table = GeneralizedStirling(alpha=2.0, beta=3.0).triangle_array(10)
+        for n in range(11):
+            for k in range(n + 1):
+                self.assertEqual(gs.compute(n, k), table[n, k])
+                self.assertIsInstance(table[n, k], int)
+                self.assertEqual(float(table[n, k]), float_table[n, k])
+    
+    def test_write_bfile(self):
+        """Test b-file output for the first rows of the Lah triangle."""
+        gs = GeneralizedStirling(alpha=1, beta=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "b.txt")
+            self.assertEqual(gs.write_bfile(path, 4), 10)
+            with open(path) as f:
+                lines = f.read().split("\n")
+            
+            # Non-integral entries cannot go into a b-file
+            with self.assertRaises(ValueError):
+                GeneralizedStirling(alpha=Fraction(1, 2), beta=1).write_bfile(path, 3)
+            
+            # ... and the failed write leaves the previous file intact
+            with open(path) as f:
+                self.assertEqual(f.read().split("\n"), lines)
+            self.assertEqual(os.listdir(tmp), ["b.txt"])
+        
+        self.assertEqual(lines[:6], ["1 1", "2 2", "3 1", "4 6", "5 6", "6 1"])
+        self.assertEqual(lines[9], "10 1")
+
+
+class TestModularBackend(unittest.TestCase):
+    """Tests for modular arithmetic and multi-prime CRT reconstruction."""
+    
+    def test_compute_mod_matches_exact(self):
+        """Test residues against the exact backend, including rational parameters."""
+        p = 1000000007
+        for alpha, beta in [(1, 1), (2, -3), (Fraction(1, 2), Fraction(4, 3))]:
+            gs = GeneralizedStirling(alpha=alpha, beta=beta)
+            for n, k in [(40, 1), (40, 17), (75, 74)]:
+                exact = Fraction(gs.compute_exact(n, k))
+                expected = exact.numerator * pow(exact.denominator, -1, p) % p
+                self.assertEqual(gs.compute_mod(n, k, p), expected,
+                                 msg=f"L_{{{n},{k}}}^{{{alpha},{beta}}} mod {p}")
+    
+    def test_triangle_mod_errors(self):
+        """Test modulus validation."""
+        gs = GeneralizedStirling(alpha=Fraction(1, 3), beta=1)
+        with self.assertRaises(ValueError):
+            gs.triangle_mod(5, 3)  # denominator 3 is not invertible
+        with self.assertRaises(ValueError):
+            gs.compute_mod(5, 2, 2 ** 31)
+    
+    def test_multimodular_rows(self):
+        """Test CRT reconstruction against the exact triangle, including signs."""
+        for alpha, beta in [(1, 1), (-1, 2), (Fraction(1, 2), Fraction(-2, 3))]:
+            exact = GeneralizedStirling(alpha=alpha, beta=beta).exact_triangle(50)
+            rows = [50, 7, 23]
+            reconstructed = multimodular_rows(rows, alpha=alpha, beta=beta, processes=1)
+            self.assertTrue((reconstructed == exact[rows]).all(),
+                            msg=f"multimodular_rows^{{{alpha},{beta}}}")
+
+
+class TestStirlingPolynomials(unittest.TestCase):
+    """Tests for the (α, β) polynomial representation."""
+    
+    def setUp(self):
+        """Build a shared coefficient table."""
+        self.table = StirlingPolynomials(25)
+    
+    def test_coefficients(self):
+        """Test coefficient arrays against hand-derived polynomials."""
+        # L{3,2} = 3α + 3β, L{4,2} = 11α² + 18αβ + 7β²
+        self.assertEqual(self.table.coefficients(3, 2).tolist(), [3.0, 3.0])
+        self.assertEqual(self.table.coefficients(4, 2).tolist(), [7.0, 18.0, 11.0])
+        self.assertEqual(len(self.table.coefficients(2, 3)), 0)
+        
+        # Coefficients sum to the Lah number L^{1,1}
+        self.assertEqual(self.table.coefficients(5, 3).sum(), 120.0)
+        
+        with self.assertRaises(ValueError):
+            self.table.coefficients(26, 1)
+    
+    def test_evaluate_matches_recurrence(self):
+        """Test evaluation over a parameter grid against the row engine."""
+        alphas = np.array([1.0, 0.0, 2.0, -1.5])
+        betas = np.array([1.0, 1.0, 3.0, 0.5])
+        values = self.table.evaluate(alphas, betas, n_max=20)
+        self.assertEqual(values.shape, (4, 21, 21))
+        for i in range(len(alphas)):
+            expected = GeneralizedStirling(alpha=alphas[i], beta=betas[i]).triangle_array(20)
+            np.testing.assert_allclose(values[i], expected, rtol=1e-10, atol=1e-10)
+    
+    def test_compute_polynomial_method(self):
+        """Test the 'polynomial' method of compute()."""
+        gs = GeneralizedStirling(alpha=2.0, beta=3.0)
+        for n, k in [(6, 2), (12, 5), (9, 8)]:
+            self.assertAlmostEqual(gs.compute(n, k, method='polynomial'),
+                                   gs.compute(n, k, method='bottom_up'), delta=1e-6)
+    
+    def test_signed_parameters_fall_back(self):
+        """Test that cancelling or oversized polynomial evaluations fall back to the recurrence."""
+        gs = GeneralizedStirling(alpha=0.5, beta=-0.25)
+        exact = GeneralizedStirling(alpha=0.5, beta=-0.25, exact=True)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            for n, k in [(100, 50), (150, 75), (250, 125)]:
+                expected = float(exact.compute_exact(n, k))
+                self.assertAlmostEqual(gs.compute(n, k, method='polynomial') / expected, 1.0, delta=1e-12)
+        
+        # The error bounds flag the cancellation that the fallback avoids
+        _, error = generalized_stirling.polynomial_table(150).compute(150, 75, 0.5, -0.25, return_error=True)
+        self.assertGreater(error, 1.0)
+        values, errors = self.table.evaluate([1.0, 0.5], [1.0, -0.25], n_max=25, return_error=True)
+        self.assertTrue(np.all(errors[0] < 1e-12))
+        self.assertEqual(errors.shape, values.shape)
+        
+        with self.assertRaises(ValueError):
+            StirlingPolynomials(generalized_stirling._POLYNOMIAL_MAX_ROWS + 1)
+
+
+class TestParameterSweep(unittest.TestCase):
+    """Tests for batched triangles over an (α, β) grid."""
+    
+    def test_matches_per_pair_triangles(self):
+        """Test each slice against a separately built triangle."""
+        alphas, betas = np.meshgrid([-1.0, 0.0, 0.5, 2.0], [-0.5, 1.0, 3.0])
+        tables = sweep_triangles(alphas.ravel(), betas.ravel(), 15, k_max=6)
+        self.assertEqual(tables.shape, (12, 16, 7))
+        for i, (alpha, beta) in enumerate(zip(alphas.ravel(), betas.ravel())):
+            expected = GeneralizedStirling(alpha=alpha, beta=beta).triangle_array(15, k_max=6)
+            np.testing.assert_array_equal(tables[i], expected)
+    
+    def test_broadcasting(self):
+        """Test scalar/array broadcasting of the parameters."""
+        tables = sweep_triangles(1.0, [0.0, 1.0], 5)
+        self.assertEqual(tables.shape, (2, 6, 6))
+        self.assertEqual(tables[0, 5, 2], 50.0)  # Stirling 1st kind s(5,2)
+        self.assertEqual(tables[1, 5, 2], 240.0)  # Lah L(5,2)
+
+
+class TestScaledTriangleCache(unittest.TestCase):
+    """Tests for the scale-normalized triangle cache."""
+    
+    def test_canonicalize(self):
+        """Test that proportional pairs share a direction and signs are kept."""
+        self.assertEqual(ScaledTriangleCache.canonicalize(0.1, 0.2), ((0.5, 1.0), 0.2))
+        self.assertEqual(ScaledTriangleCache.canonicalize(-0.3, -0.6), ((0.5, 1.0), -0.6))
+        self.assertEqual(ScaledTriangleCache.canonicalize(0.0, 0.0), ((0.0, 0.0), 1.0))
+    
+    def test_rescaled_values(self):
+        """Test rescaled lookups against direct computation, sharing one triangle."""
+        cache = ScaledTriangleCache()
+        for scale in [1.0, 0.25, -3.0, 7.5]:
+            alpha, beta = 2.0 * scale, -1.0 * scale
+            expected = GeneralizedStirling(alpha=alpha, beta=beta).triangle_array(25)
+            np.testing.assert_allclose(cache.triangle(alpha, beta, 25), expected, rtol=1e-12)
+            self.assertAlmostEqual(cache.get(alpha, beta, 20, 6), expected[20, 6],
+                                   delta=1e-12 * abs(expected[20, 6]))
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(len(cache._entries), 1)
+    
+    def test_log_rescaling(self):
+        """Test that values overflowing in the direction triangle are rescaled in log space."""
+        cache = ScaledTriangleCache()
+        n, k = 400, 3
+        log_value, sign = cache.get_log(0.01, 0.01, n, k)
+        expected = GeneralizedStirling(alpha=0.01, beta=0.01).compute_log(n, k)
+        self.assertEqual(sign, expected[1])
+        self.assertAlmostEqual(log_value, expected[0], delta=1e-10 * abs(expected[0]))
+        self.assertAlmostEqual(cache.get(0.01, 0.01, n, k), math.exp(expected[0]),
+                               delta=1e-10 * math.exp(expected[0]))
+    
+    def test_instance_integration(self):
+        """Test GeneralizedStirling(use_scale_cache=True) lookups."""
+        gs = GeneralizedStirling(alpha=3.0, beta=3.0, use_scale_cache=True)
+        self.assertAlmostEqual(gs.compute(5, 3), 9.0 * 120.0, delta=1e-9)
+        self.assertEqual(gs.triangle_array(4)[4, 2], 9.0 * 36.0)
+        self.assertIn('scale_cache', gs.get_performance_stats())
+
+
+class TestBoundedCache(unittest.TestCase):
+    """Tests for the bounded per-instance memory cache."""
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = BoundedCache(max_entries=2, policy='lru')
+        cache['a'], cache['b'] = 1.0, 2.0
+        cache['a']
+        cache['c'] = 3.0
+        self.assertNotIn('b', cache)
+        self.assertIn('a', cache)
+        self.assertEqual(cache.evictions, 1)
+    
+    def test_lfu_eviction(self):
+        """Test that the least frequently used entry is evicted, never the new one."""
+        cache = BoundedCache(max_entries=2, policy='lfu')
+        cache['a'], cache['b'] = 1.0, 2.0
+        cache['a'], cache['a'], cache['b']
+        cache['c'] = 3.0
+        self.assertEqual(sorted(cache._data), ['a', 'c'])
+        cache['d'] = 4.0
+        self.assertEqual(sorted(cache._data), ['a', 'd'])
+        self.assertEqual(cache.evictions, 2)
+    
+    def test_byte_budget(self):
+        """Test that the byte budget bounds the held size."""
+        cache = BoundedCache(max_bytes=2000)
+        for i in range(200):
+            cache[('triangular_recurrence', i, 1)] = float(i)
+            self.assertLessEqual(cache.nbytes, 2000)
+        self.assertGreater(cache.evictions, 0)
+        self.assertIn(('triangular_recurrence', 199, 1), cache)
+    
+    def test_invalid_arguments(self):
+        """Test that unknown policies and negative limits are rejected."""
+        with self.assertRaises(ValueError):
+            BoundedCache(policy='fifo')
+        with self.assertRaises(ValueError):
+            BoundedCache(max_entries=-1)
+    
+    def test_instance_isolation(self):
+        """Test that instances keep separate caches and report evictions."""
+        gs1 = GeneralizedStirling(alpha=1.0, beta=1.0, cache_size=5, cache_policy='lfu')
+        gs2 = GeneralizedStirling(alpha=1.0, beta=1.0)
+        for n in range(1, 9):
+            gs1.triangular_recurrence(n, 2)
+        gs2.triangular_recurrence(8, 3)
+        self.assertEqual(gs1.triangular_recurrence(8, 3), 141120.0)
+        stats = gs1.get_performance_stats()
+        self.assertEqual(stats['memory_cache']['entries'], 5)
+        self.assertGreater(stats['evictions'], 0)
+        gs1.clear_cache()
+        self.assertEqual(len(gs1._memory_cache), 0)
+        self.assertGreater(len(gs2._memory_cache), 0)
+    
+    def test_tiny_cache_does_not_break_recurrence(self):
+        """Test that eviction cannot turn the triangular recurrence exponential."""
+        gs = GeneralizedStirling(alpha=0.5, beta=1.5, cache_size=1)
+        table = gs.triangle_array(150, 75)
+        start = time.perf_counter()
+        self.assertAlmostEqual(gs.triangular_recurrence(150, 75) / table[150, 75], 1.0, delta=1e-12)
+        self.assertLess(time.perf_counter() - start, 5.0)
+        self.assertEqual(len(gs._memory_cache), 1)
+    
+    def test_tables_stay_within_cache_bytes(self):
+        """Test that the LazyTriangle and scaled triangles count against cache_bytes."""
+        def held(gs):
+            rows = gs._lazy_triangle.nbytes if gs._lazy_triangle is not None else 0
+            return rows + gs._memory_cache.nbytes
+        
+        gs = GeneralizedStirling(alpha=1.0, beta=1.0, cache_bytes=10000)
+        expected = GeneralizedStirling(alpha=1.0, beta=1.0).triangle_array(150, 75)[150, 75]
+        self.assertAlmostEqual(gs.triangular_recurrence(150, 75) / expected, 1.0, delta=1e-12)
+        self.assertLessEqual(held(gs), 10000)
+        
+        # Small rows are tabulated, and the memory cache gets the rest of the budget
+        gs = GeneralizedStirling(alpha=0.5, beta=1.5, cache_bytes=100000)
+        for n in range(60):
+            for k in range(n + 1):
+                gs.compute(n, k, method='triangular')
+        self.assertIsNotNone(gs._lazy_triangle)
+        self.assertLessEqual(held(gs), 100000)
+        
+        generalized_stirling._scaled_triangle_cache.clear()
+        gs = GeneralizedStirling(alpha=2.0, beta=2.0, use_scale_cache=True, cache_bytes=10000)
+        self.assertEqual(gs.compute(200, 100), GeneralizedStirling(alpha=2.0, beta=2.0).compute(200, 100))
+        self.assertEqual(len(generalized_stirling._scaled_triangle_cache._entries), 0)
+
+
+class TestTriangleStore(unittest.TestCase):
+    """Tests for the memory-mapped triangle store behind the disk cache."""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+    
+    def test_growth_matches_row_engine(self):
+        """Test that extending the stored triangle continues the recurrence exactly."""
+        store = TriangleStore(self.tmpdir.name, alpha=1.5, beta=-0.5)
+        self.assertEqual(store.value(4, 2), GeneralizedStirling(1.5, -0.5).triangle_array(4)[4, 2])
+        store.value(30, 7)
+        self.assertEqual(store.n_max(), 30)
+        expected = GeneralizedStirling(1.5, -0.5).triangle_array(30)
+        np.testing.assert_array_equal(store.values(30), expected)
+        
+        log_table, sign_table = store.log_values(30)
+        np.testing.assert_allclose(sign_table * np.exp(log_table), expected, rtol=1e-12)
+    
+    def test_file_shared_between_instances(self):
+        """Test that a second instance reads the triangle written by the first."""
+        gs1 = GeneralizedStirling(alpha=1.0, beta=1.0, use_disk_cache=True, cache_dir=self.tmpdir.name)
+        self.assertEqual(gs1.compute(10, 4), 12700800.0)
+        self.assertEqual(len(os.listdir(self.tmpdir.name)), 1)
+        
+        gs2 = GeneralizedStirling(alpha=1.0, beta=1.0, use_disk_cache=True, cache_dir=self.tmpdir.name)
+        self.assertEqual(gs2.compute(8, 3), 141120.0)
+        stats = gs2.get_performance_stats()
+        self.assertEqual(stats['cache_hits']['triangular_recurrence'], 1)
+        self.assertNotIn('triangular_recurrence', stats['cache_misses'])
+        self.assertGreater(stats['disk_cache_size'], 0)
+        
+        # Other methods compute what they name instead of reading the stored recurrence
+        self.assertEqual(gs2.compute(8, 3, method='explicit'), 141120.0)
+        self.assertEqual(gs2.get_performance_stats()['cache_misses']['explicit_formula'], 1)
+        
+        gs2.clear_cache()
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+    
+    def test_packed_file_grows_by_appending(self):
+        """Test that the file holds the packed triangle and grows only by the new rows."""
+        store = TriangleStore(self.tmpdir.name, alpha=1.0, beta=1.0)
+        header = generalized_stirling._STORE_HEADER.itemsize
+        self.assertEqual(store.value(20, 3), GeneralizedStirling(1.0, 1.0).triangle_array(20)[20, 3])
+        self.assertEqual(os.path.getsize(store.path()), header + 8 * 21 * 22 // 2)
+        self.assertEqual(store.value(23, 23), 1.0)
+        self.assertEqual(os.path.getsize(store.path()), header + 8 * 24 * 25 // 2)
+        np.testing.assert_array_equal(store.row(23), GeneralizedStirling(1.0, 1.0).triangle_array(23)[23])
+        
+        store.log_value(23, 5)
+        self.assertEqual(os.path.getsize(store.path('log')), header + 9 * 24 * 25 // 2)
+    
+    def test_invalid_file_is_rebuilt(self):
+        """Test that a file with a foreign header is ignored and overwritten."""
+        store = TriangleStore(self.tmpdir.name, alpha=0.0, beta=1.0)
+        with open(store.path(), 'wb') as f:
+            f.write(b'not a triangle')
+        self.assertEqual(store.n_max(), -1)
+        self.assertEqual(store.value(5, 2), 15.0)
+
+
+class TestParallelTriangle(unittest.TestCase):
+    """Tests for the process-parallel triangle builders."""
+    
+    def test_bands_match_serial(self):
+        """Test that column bands reproduce the serial triangle exactly."""
+        gs = GeneralizedStirling(alpha=1.5, beta=-0.5)
+        for processes in [1, 2, 3]:
+            for n_max, k_max in [(40, 40), (40, 6), (5, 12)]:
+                table = parallel_triangle_array(n_max, alpha=1.5, beta=-0.5, k_max=k_max,
+                                                processes=processes, block_rows=4)
+                np.testing.assert_array_equal(table, gs.triangle_array(n_max, k_max))
+    
+    def test_stats(self):
+        """Test that the reported bands cover all columns and stats are consistent."""
+        _, stats = parallel_triangle_array(60, processes=3, return_stats=True)
+        self.assertEqual(stats['processes'], 3)
+        self.assertEqual(stats['bands'][0][0], 0)
+        self.assertEqual(stats['bands'][-1][1], 61)
+        self.assertAlmostEqual(stats['efficiency'], stats['parallelism'] / stats['processes'])
+        
+        # A small triangle does not start one worker per core
+        _, stats = parallel_triangle_array(60, return_stats=True)
+        self.assertEqual(stats['processes'], 1)
+    
+    def test_generate_triangle(self):
+        """Test parallel_generate_triangle for the band builder and per-cell methods."""
+        self.assertEqual(parallel_generate_triangle(5, processes=2)[2], [6.0, 6.0, 1.0])
+        triangle = parallel_generate_triangle(6, method='bottom_up', processes=2)
+        self.assertEqual([len(row) for row in triangle], list(range(1, 7)))
+        self.assertEqual(triangle[3][1], 36.0)
+
+
+class TestStreamingIterator(unittest.TestCase):
+    """Tests for the row-streaming memory_efficient_iterator."""
+    
+    def test_rows_and_values(self):
+        """Test that value tuples and row arrays agree with the triangle."""
+        expected = GeneralizedStirling(alpha=1.5, beta=-0.5).triangle_array(20, 4)
+        for n, k, value in memory_efficient_iterator(20, alpha=1.5, beta=-0.5, k_max=4):
+            self.assertEqual(value, expected[n, k])
+        for n, values in memory_efficient_iterator(20, alpha=1.5, beta=-0.5, k_max=4, rows=True):
+            np.testing.assert_array_equal(values, expected[n, 1:min(n, 4) + 1])
+    
+    def test_binary_sink(self):
+        """Test that the binary sink holds the streamed values in order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'triangle.bin')
+            streamed = [value for _, _, value in memory_efficient_iterator(30, sink=path, chunk_rows=7)]
+            np.testing.assert_array_equal(np.fromfile(path), streamed)
+    
+    def test_csv_sink(self):
+        """Test that the CSV sink writes one n,k,value line per value."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'triangle.csv')
+            list(memory_efficient_iterator(3, sink=path, sink_format='csv'))
+            with open(path) as f:
+                self.assertEqual(f.read().splitlines()[-2:], ['3,2,6.0', '3,3,1.0'])
+    
+    def test_early_break_flushes_sink(self):
+        """Test that rows yielded before the consumer stops still reach the sink."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'triangle.bin')
+            streamed = []
+            for n, values in memory_efficient_iterator(1000, k_max=2, rows=True, sink=path):
+                streamed.extend(values)
+                if n == 10:
+                    break
+            np.testing.assert_array_equal(np.fromfile(path), streamed)
+    
+    def test_named_methods(self):
+        """Test methods other than 'auto', including values beyond the float64 range."""
+        expected = GeneralizedStirling(alpha=1.0, beta=1.0).triangle_array(12, 3)
+        for method in ['triangular', 'bottom_up']:
+            for n, values in memory_efficient_iterator(12, k_max=3, method=method, rows=True):
+                np.testing.assert_array_equal(values, expected[n, 1:min(n, 3) + 1])
+        
+        rows = list(memory_efficient_iterator(300, k_max=1, method='bottom_up', rows=True))
+        self.assertEqual(rows[-1][1][0], math.inf)
+
+
+class TestLazyTriangle(unittest.TestCase):
+    """Tests for the on-demand LazyTriangle view."""
+    
+    def setUp(self):
+        self.gs = GeneralizedStirling(alpha=1.5, beta=-0.5)
+        self.expected = self.gs.triangle_array(30)
+    
+    def test_indexing_matches_triangle(self):
+        """Test element, row, column and block indexing against the dense triangle."""
+        tri = LazyTriangle(self.gs)
+        self.assertEqual(tri[7, 3], self.expected[7, 3])
+        self.assertEqual(tri[3, 7], 0.0)
+        np.testing.assert_array_equal(tri[6], self.expected[6, :7])
+        np.testing.assert_array_equal(tri[0:31], self.expected)
+        np.testing.assert_array_equal(tri[2:20:3, 1:7], self.expected[2:20:3, 1:7])
+        np.testing.assert_array_equal(tri[3:9, 4], self.expected[3:9, 4])
+        np.testing.assert_array_equal(tri[3, 1:6], self.expected[3, 1:6])
+    
+    def test_incremental_growth(self):
+        """Test that existing rows are kept when the view grows."""
+        tri = LazyTriangle(self.gs)
+        tri[10, 2]
+        self.assertEqual(tri.n_max, 10)
+        row_10 = tri[10]
+        tri[30, 2]
+        self.assertEqual(tri.n_max, 30)
+        self.assertIs(tri[10], row_10)
+        self.assertFalse(row_10.flags.writeable)
+    
+    def test_invalid_indices(self):
+        """Test that negative indices and open-ended row slices are rejected."""
+        tri = LazyTriangle(self.gs)
+        for index in [-1, slice(1, None), (2, -1), (1, 2, 3)]:
+            with self.assertRaises(IndexError):
+                tri[index]
+    
+    def test_instance_view_shared_with_generate_triangle(self):
+        """Test that generate_triangle grows the instance view instead of rebuilding."""
+        gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+        self.assertEqual(gs.generate_triangle(4)[3], ['24', '36', '12', '1'])
+        tri = gs.lazy_triangle()
+        self.assertEqual(tri.n_max, 4)
+        gs.generate_triangle(6)
+        self.assertIs(gs.lazy_triangle(), tri)
+        self.assertEqual(tri.n_max, 6)
+    
+    def test_overflow_is_silent(self):
+        """Test that rows beyond the float64 range hold inf without RuntimeWarnings."""
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.assertEqual(LazyTriangle(GeneralizedStirling(alpha=1.0, beta=1.0))[400, 5], math.inf)
+            self.assertEqual(lah_number(400, 5), math.inf)
+
+
+class TestComputeMany(unittest.TestCase):
+    """Tests for batched (n, k) queries."""
+    
+    def setUp(self):
+        self.gs = GeneralizedStirling(alpha=1.5, beta=-0.5)
+        rng = np.random.default_rng(0)
+        self.ns = rng.integers(0, 60, 300)
+        self.ks = rng.integers(0, 70, 300)
+        self.expected = self.gs.triangle_array(60, 70)[self.ns, self.ks]
+    
+    def test_values(self):
+        """Test scattered queries, including k > n, against the dense triangle."""
+        np.testing.assert_array_equal(self.gs.compute_many(self.ns, self.ks), self.expected)
+        self.assertEqual(self.gs.compute_many([[4], [5]], [1, 2]).shape, (2, 2))
+        self.assertEqual(self.gs.compute_many([], []).shape, (0,))
+    
+    def test_log(self):
+        """Test that the log variant matches the float values."""
+        log_values, signs = self.gs.compute_many_log(self.ns, self.ks)
+        np.testing.assert_allclose(signs * np.exp(log_values), self.expected, rtol=1e-10)
+    
+    def test_exact(self):
+        """Test that the exact variant matches compute_exact."""
+        gs = GeneralizedStirling(alpha=Fraction(1, 2), beta=1)
+        result = gs.compute_many_exact([4, 5, 3, 12], [2, 3, 5, 4])
+        self.assertEqual(list(result), [gs.compute_exact(4, 2), gs.compute_exact(5, 3), 0,
+                                        gs.compute_exact(12, 4)])
+    
+    def test_negative_rejected(self):
+        """Test that negative indices raise ValueError."""
+        with self.assertRaises(ValueError):
+            self.gs.compute_many([3, -1], [1, 1])
+
+
+class TestRisingFactorialKernel(unittest.TestCase):
+    """Tests for the log-gamma rising factorial kernel."""
+    
+    @staticmethod
+    def product(x, n, increment):
+        result = Fraction(1)
+        for i in range(n):
+            result *= Fraction(x) + i * Fraction(increment)
+        return result
+    
+    def test_matches_products(self):
+        """Test negative, zero-crossing and integer bases against exact products."""
+        gs = GeneralizedStirling()
+        for x, increment in [(2.0, 0.5), (-2.5, 1.0), (-7.0, 1.0), (3.0, -0.75), (-1.3, 0.4), (1.5, 0.0)]:
+            for n in [0, 1, 3, 8, 25]:
+                expected = self.product(x, n, increment)
+                value = gs.rising_factorial(x, n, increment)
+                if expected == 0:
+                    self.assertEqual(value, 0.0)
+                else:
+                    self.assertAlmostEqual(value / float(expected), 1.0, delta=1e-12)
+    
+    def test_arrays(self):
+        """Test broadcasting over arrays of bases and term counts."""
+        gs = GeneralizedStirling()
+        values = gs.rising_factorial(np.array([1.0, 2.0, -3.0]), np.array([[2], [4]]))
+        np.testing.assert_array_equal(values, [[2.0, 6.0, 6.0], [24.0, 120.0, 0.0]])
+    
+    def test_log_kernel_large_n(self):
+        """Test the log kernel far beyond the float64 range."""
+        from generalized_stirling import _log_rising_factorial
+        log_value, sign = _log_rising_factorial(0.5, 10**6, 2.0)
+        expected = 10**6 * math.log(2.0) + math.lgamma(0.25 + 10**6) - math.lgamma(0.25)
+        self.assertAlmostEqual(float(log_value), expected, delta=1e-9 * expected)
+        self.assertEqual(float(sign), 1.0)
+        self.assertEqual(float(_log_rising_factorial(-3.0, 3, -1.0)[1]), -1.0)  # (-3)(-4)(-5)
+
+
+class TestFFTRow(unittest.TestCase):
+    """Tests for FFT row computation from the explicit formula."""
+    
+    def test_matches_recurrence(self):
+        """Test that FFT rows with fallback match the row recurrence."""
+        for alpha, beta in [(1.0, 1.0), (0.5, 2.0), (1.0, -1.0), (-1.0, 0.0)]:
+            gs = GeneralizedStirling(alpha, beta)
+            for n in [0, 1, 7, 40, 120]:
+                expected = gs.row(n)
+                values = gs.row(n, method='fft')
+                np.testing.assert_allclose(values, expected, rtol=1e-9)
+    
+    def test_exact_fallback(self):
+        """Test that the exact fallback reproduces compute_exact."""
+        gs = GeneralizedStirling(1.0, 2.0)
+        values, errors = gs.row(30, method='fft', fallback='exact', return_error=True)
+        for k in range(31):
+            expected = float(gs.compute_exact(30, k))
+            self.assertAlmostEqual(values[k] / expected if expected else values[k], 1.0 if expected else 0.0, delta=1e-10)
+        self.assertTrue(np.all(errors <= 1e-10))
+    
+    def test_error_estimate_bounds(self):
+        """Test that accepted FFT entries are within their error estimates."""
+        for alpha, beta in [(1.0, 1.0), (0.5, 2.0), (2.0, -0.5)]:
+            gs = GeneralizedStirling(alpha, beta)
+            for n in [20, 60]:
+                expected = gs.row(n)
+                values, errors = gs.row(n, method='fft', fallback=None, return_error=True)
+                accepted = (errors < 1e-6) & (expected != 0)
+                self.assertGreaterEqual(accepted.sum(), 5)
+                actual = np.abs(values[accepted] / expected[accepted] - 1.0)
+                self.assertTrue(np.all(actual <= errors[accepted] + 1e-15))
+    
+    def test_invalid_method(self):
+        """Test that unknown methods and fallbacks raise ValueError."""
+        gs = GeneralizedStirling(1.0, 1.0)
+        with self.assertRaises(ValueError):
+            gs.row(5, method='dft')
+        with self.assertRaises(ValueError):
+            gs.row(5, method='fft', fallback='mpmath')
+        with self.assertRaises(ValueError):
+            gs.row(-1)
+
+
+class TestColumn(unittest.TestCase):
+    """Tests for single-column computation from the exponential generating function."""
+    
+    def test_matches_triangle(self):
+        """Test both methods against triangle columns, including the α=0 and β=0 limits."""
+        for alpha, beta in [(1.0, 1.0), (1.0, 0.0), (0.0, 1.0), (0.5, 2.0), (2.0, -0.5), (-1.0, 1.0)]:
+            gs = GeneralizedStirling(alpha, beta)
+            table = gs.triangle_array(50)
+            for k in [0, 1, 2, 7, 49, 50]:
+                for method in ['series', 'recurrence', 'auto']:
+                    np.testing.assert_allclose(gs.column(k, 50, method=method), table[k:, k], rtol=1e-9)
+    
+    def test_log_large_n(self):
+        """Test log values beyond the float64 range against closed forms."""
+        gs = GeneralizedStirling(alpha=1.0, beta=1.0)
+        log_values, signs = gs.column(1, 400, method='series', log=True)
+        # Lah numbers L(n,1) = n!
+        np.testing.assert_allclose(log_values, [math.lgamma(n + 1) for n in range(1, 401)], rtol=1e-12)
+        self.assertTrue(np.all(signs == 1))
+        log_series, _ = gs.column(3, 400, method='series', log=True)
+        log_recurrence, _ = gs.column(3, 400, method='recurrence', log=True)
+        np.testing.assert_allclose(log_series, log_recurrence, rtol=1e-12)
+    
+    def test_empty_and_invalid(self):
+        """Test empty columns and invalid arguments."""
+        gs = GeneralizedStirling()
+        self.assertEqual(gs.column(5, 3).shape, (0,))
+        with self.assertRaises(ValueError):
+            gs.column(-1, 3)
+        with self.assertRaises(ValueError):
+            gs.column(1, 3, method='egf')
+
+
+class TestIterativeTriangular(unittest.TestCase):
+    """Tests for the recursion-free triangular method."""
+    
+    def test_large_n(self):
+        """Test n far beyond the recursion limit against the bottom-up method."""
+        n = 3 * sys.getrecursionlimit()
+        for beta, k in [(0.5, 2), (0.25, 4)]:
+            # β = 1/k keeps L{n,k} ≈ (βk)^n / k! within the float64 range
+            gs = GeneralizedStirling(alpha=0.0, beta=beta)
+            self.assertAlmostEqual(gs.compute(n, k, method='triangular') / gs.bottom_up_computation(n, k), 1.0,
+                                   delta=1e-10)
+    
+    def test_reuses_rows(self):
+        """Test that rows are shared with the lazy triangle and cleared with the cache."""
+        gs = GeneralizedStirling(alpha=0.5, beta=1.5)
+        table = gs.triangle_array(60)
+        gs.triangular_recurrence(40, 3)
+        self.assertEqual(gs.lazy_triangle().n_max, 40)
+        gs.triangular_recurrence(60, 2)
+        self.assertEqual(gs.lazy_triangle().n_max, 60)
+        for n, k in [(60, 30), (20, 3), (59, 58)]:
+            self.assertAlmostEqual(gs.triangular_recurrence(n, k) / table[n, k], 1.0, delta=1e-12)
+        self.assertEqual(gs.cache_misses['triangular_recurrence'], 5)
+        gs.triangular_recurrence(60, 30)
+        self.assertEqual(gs.cache_hits['triangular_recurrence'], 1)
+        gs.clear_cache()
+        self.assertIsNone(gs._lazy_triangle)
+    
+    def test_hsu_shiue(self):
+        """Test the Hsu-Shiue triangular method against bottom-up for large n."""
+        hs = HsuShiueStirling(alpha=-1.0, beta=0.0, r=2.0)
+        for n, k in [(8, 0), (8, 3), (12, 12), (5, 7)]:
+            self.assertEqual(hs.triangular_recurrence(n, k), hs.bottom_up_computation(n, k))
+        hs = HsuShiueStirling(alpha=0.0, beta=1 / 3)
+        n = 2 * sys.getrecursionlimit()
+        self.assertAlmostEqual(hs.triangular_recurrence(n, 3) / hs.bottom_up_computation(n, 3), 1.0, delta=1e-10)
+        hs.clear_cache()
+
+
+class TestSharedInstances(unittest.TestCase):
+    """Tests for the shared instance registry behind the convenience functions."""
+    
+    def setUp(self):
+        clear_shared_instances()
+    
+    def tearDown(self):
+        clear_shared_instances()
+    
+    def test_reused(self):
+        """Test that repeated calls reuse one warm instance per (α, β, backend)."""
+        lah_number(10, 4)
+        gs = shared_instance(1.0, 1.0)
+        self.assertIs(shared_instance(1, 1), gs)
+        self.assertIsNot(shared_instance(1.0, 1.0, 'exact'), gs)
+        for n in range(30):
+            lah_number(n, 3)
+        self.assertIs(shared_instance(1.0, 1.0), gs)
+        self.assertGreaterEqual(gs.lazy_triangle().n_max, 64)
+        with self.assertRaises(ValueError):
+            shared_instance(1.0, 1.0, 'mpmath')
+    
+    def test_values(self):
+        """Test table, large-n and exact lookups against the engines."""
+        self.assertEqual(stirling_first_kind(10, 3), 1172700.0)
+        self.assertEqual(stirling_second_kind(10, 3), 9330.0)
+        self.assertEqual(lah_number(10, 4), 12700800.0)
+        self.assertEqual(stirling_second_kind(30, 4, exact=True), 48004081105038305)
+        self.assertEqual(lah_number(20, 21), 0.0)
+        self.assertEqual(stirling_second_kind(2500, 1), 1.0)
+        with self.assertRaises(ValueError):
+            stirling_first_kind(-1, 2)
+
+
+class TestMethodCalibration(unittest.TestCase):
+    """Tests for the benchmark-calibrated method selection."""
+    
+    def setUp(self):
+        self.saved_profile = generalized_stirling._active_profile
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'profile.json')
+    
+    def tearDown(self):
+        generalized_stirling._active_profile = self.saved_profile
+        self.tmpdir.cleanup()
+    
+    def test_calibrate_and_load(self):
+        """Test that a calibrated profile is saved, reloaded and only picks accurate methods."""
+        profile = generalized_stirling.calibrate_methods(n_points=(8, 40), d_points=(1, 6, 30), repeat=1,
+                                                         path=self.path)
+        loaded = generalized_stirling.load_method_profile(self.path)
+        self.assertEqual(loaded['table'], profile['table'])
+        for family, rows in profile['table'].items():
+            self.assertEqual(len(rows), 2)
+            self.assertIsNone(rows[0][2])  # k = 8 - 30 is off the triangle
+            for row in rows:
+                for choice in row:
+                    self.assertIn(choice, (None,) + generalized_stirling._TUNABLE_METHODS)
+        gs = GeneralizedStirling(0.5, 2.0)
+        table = gs.triangle_array(40)
+        for n, k in [(40, 39), (40, 34), (40, 10), (9, 8)]:
+            self.assertAlmostEqual(gs.compute(n, k) / table[n, k], 1.0, delta=1e-9)
+    
+    def test_table_drives_selection(self):
+        """Test that the decision table overrides the built-in thresholds."""
+        profile = {'version': 1, 'n_points': [2, 50], 'd_points': [1, 10],
+                   'table': {'general': [['symmetric', 'triangular'], ['explicit', 'bottom_up']]}}
+        generalized_stirling.save_method_profile(profile, self.path)
+        gs = GeneralizedStirling(1.0, 1.0)
+        self.assertEqual(gs._select_best_method(5, 4), 'symmetric')
+        self.assertEqual(gs._select_best_method(30, 5), 'triangular')
+        self.assertEqual(gs._select_best_method(60, 59), 'explicit')
+        self.assertEqual(gs._select_best_method(600, 100), 'bottom_up')
+        # No table for the classical family: fall back to the thresholds
+        self.assertEqual(GeneralizedStirling(0.0, 1.0)._select_best_method(30, 5), 'triangular')
+        # Negative weights were never calibrated: fall back to the thresholds
+        self.assertEqual(GeneralizedStirling(-0.5, 2.0)._select_best_method(60, 59), 'bottom_up')
+    
+    def test_invalid_profile(self):
+        """Test that missing or malformed profiles fall back to the heuristics."""
+        self.assertIsNone(generalized_stirling.load_method_profile(self.path))
+        with open(self.path, 'w') as f:
+            f.write('{"version": 1, "n_points": [8], "d_points": [1], "table": {"general": [[]]}}')
+        self.assertIsNone(generalized_stirling.load_method_profile(self.path))
+        self.assertEqual(GeneralizedStirling(1.0, 1.0)._select_best_method(200, 10), 'bottom_up')
+        with self.assertRaises(ValueError):
+            generalized_stirling.calibrate_methods(methods=('horizontal',))
+    
+    def test_cli(self):
+        """Test the calibrate and show commands."""
+        import contextlib
+        import io
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            status = generalized_stirling.main(['calibrate', '--output', self.path, '--n-points', '12',
+                                                '--d-points', '2', '--repeat', '1'])
+        self.assertEqual(status, 0)
+        self.assertTrue(os.path.exists(self.path))
+        self.assertIn('12', out.getvalue())
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(generalized_stirling.main(['show', '--profile', self.path]), 0)
+
+
+class TestSymmetricFunctionValues(unittest.TestCase):
+    """Tests for the prefix-sum symmetric function DP."""
+    
+    def test_matches_triangle(self):
+        """Test all L{n+j,n} from one pass against the triangle."""
+        for alpha, beta in [(1.0, 1.0), (0.0, 1.0), (1.0, 0.0), (2.0, -0.5)]:
+            gs = GeneralizedStirling(alpha, beta)
+            table = gs.triangle_array(60)
+            for n in [0, 1, 5, 30]:
+                values = gs.symmetric_function_values(n, 30)
+                np.testing.assert_allclose(values, [table[n + j, n] for j in range(31)], rtol=1e-10)
+                self.assertAlmostEqual(gs.symmetric_function(n, 7), table[n + 7, n], delta=1e-10 * table[n + 7, n])
+    
+    def test_large_k(self):
+        """Test depths far beyond the recursion limit."""
+        # β = 1/3 keeps L{3+k,3} = β^k S(3+k,3) ≈ 3^3/6 within the float64 range
+        gs = GeneralizedStirling(alpha=0.0, beta=1 / 3)
+        k = 2 * sys.getrecursionlimit()
+        values = gs.symmetric_function_values(3, k)
+        log_value, sign = gs.compute_log(3 + k, 3)
+        self.assertAlmostEqual(math.log(values[k]), log_value, delta=1e-9 * abs(log_value))
+        with self.assertRaises(ValueError):
+            gs.symmetric_function_values(-1, 2)
+
+
+class TestRowRecurrences(unittest.TestCase):
+    """Tests for the dot-product horizontal and vertical recurrences."""
+    
+    def test_horizontal(self):
+        """Test the horizontal recurrence near the diagonal, including negative β."""
+        for alpha, beta in [(1.0, 1.0), (2.0, 3.0), (0.0, 1.0), (0.5, -0.25)]:
+            gs = GeneralizedStirling(alpha, beta)
+            table = gs.triangle_array(40)
+            for n in [1, 5, 12, 39]:
+                for k in range(max(1, n - 8), n + 1):
+                    self.assertAlmostEqual(gs.horizontal_recurrence(n, k) / table[n, k], 1.0, delta=1e-9)
+            self.assertEqual(gs.horizontal_recurrence(3, 5), 0.0)
+    
+    def test_vertical(self):
+        """Test the vertical recurrence over whole rows, including large n."""
+        for alpha, beta in [(1.0, 1.0), (2.0, 3.0), (0.0, 1.0), (1.0, 0.0), (0.5, -0.25)]:
+            gs = GeneralizedStirling(alpha, beta)
+            table = gs.triangle_array(81)
+            for n in [1, 10, 80]:
+                for k in range(n + 1):
+                    expected = table[n + 1, k + 1]
+                    self.assertAlmostEqual(gs.vertical_recurrence(n, k), expected, delta=1e-12 * abs(expected))
+        self.assertEqual(GeneralizedStirling(1.0, 1.0).vertical_recurrence(3, 2), 12.0)
+
+
+class TestDiagonals(unittest.TestCase):
+    """Tests for diagonal and anti-diagonal extraction."""
+    
+    def test_diagonal(self):
+        """Test subdiagonals against the triangle."""
+        for alpha, beta in [(1.0, 1.0), (0.0, 1.0), (1.0, 0.0), (2.0, -0.5)]:
+            gs = GeneralizedStirling(alpha, beta)
+            table = gs.triangle_array(80)
+            for d in [0, 1, 2, 7, 40]:
+                np.testing.assert_allclose(gs.diagonal(d, 40), [table[k + d, k] for k in range(41)], rtol=1e-10)
+    
+    def test_anti_diagonal(self):
+        """Test anti-diagonals of both parities against the triangle."""
+        for alpha, beta in [(1.0, 1.0), (0.0, 1.0), (2.0, -0.5)]:
+            gs = GeneralizedStirling(alpha, beta)
+            table = gs.triangle_array(80)
+            for s in [0, 1, 2, 3, 33, 80]:
+                np.testing.assert_allclose(gs.anti_diagonal(s), [table[s - k, k] for k in range(s // 2 + 1)],
+                                           rtol=1e-10)
+    
+    def test_invalid(self):
+        """Test that negative arguments raise ValueError."""
+        gs = GeneralizedStirling()
+        with self.assertRaises(ValueError):
+            gs.diagonal(-1, 5)
+        with self.assertRaises(ValueError):
+            gs.anti_diagonal(-2)
+
+
+class TestAdaptivePrecision(unittest.TestCase):
+    """Tests for adaptive-precision computation."""
+    
+    def test_float_path(self):
+        """Test that a loose tolerance stays in float64."""
+        gs = GeneralizedStirling(1.0, 1.0)
+        value, bound, digits = gs.compute_adaptive(10, 5, rtol=1e-10)
+        self.assertEqual(digits, 15)
+        self.assertLessEqual(bound, 1e-10)
+        self.assertAlmostEqual(value, gs.compute(10, 5), delta=1e-10 * abs(value))
+    
+    @unittest.skipUnless(HAS_MPMATH, "mpmath not installed")
+    def test_escalation_matches_exact(self):
+        """Test escalation to mpmath against the exact backend."""
+        gs = GeneralizedStirling(-0.75, 2.0)
+        exact = GeneralizedStirling(-0.75, 2.0, exact=True).compute_exact(60, 20)
+        value, bound, digits = gs.compute_adaptive(60, 20, rtol=1e-15)
+        self.assertGreater(digits, 15)
+        self.assertLessEqual(bound, 1e-15)
+        self.assertLessEqual(abs(value / float(exact) - 1), 1e-15)
+        self.assertEqual(gs.compute(60, 20, rtol=1e-15), value)
+    
+    def test_cache_and_overflow(self):
+        """Test cached lookups and values beyond the float64 range."""
+        gs = GeneralizedStirling(1.0, 1.0)
+        first = gs.compute_adaptive(30, 10, rtol=1e-12)
+        self.assertEqual(gs.compute_adaptive(30, 10, rtol=1e-12), first)
+        self.assertEqual(gs.get_performance_stats()['cache_hits']['adaptive'], 1)
+        value, bound, digits = gs.compute_adaptive(1000, 500, rtol=1e-12)
+        self.assertEqual(value, math.inf)
+    
+    def test_exact_zero(self):
+        """Test that a zero weight wiping out the band is certified without escalating."""
+        gs = GeneralizedStirling(1.0, -1.0)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.assertEqual(gs.compute_adaptive(5, 1, rtol=1e-12), (0.0, 0.0, 15))
+            self.assertEqual(gs.compute(190, 22, rtol=1e-12), 0.0)
+    
+    @unittest.skipUnless(HAS_MPMATH, "mpmath not installed")
+    def test_non_finite_float_escalates(self):
+        """Test that a non-finite float64 result within the float range is not certified."""
+        gs = GeneralizedStirling(0.5, 1.5)
+        expected = gs.triangle_array(30)[30, 10]
+        for broken in [(math.nan, math.inf), (math.inf, math.inf), (math.inf, 0.0)]:
+            gs.clear_cache()
+            with mock.patch.object(generalized_stirling, '_float_value_with_bound', return_value=broken):
+                value, bound, digits = gs.compute_adaptive(30, 10, rtol=1e-12)
+            self.assertGreater(digits, 15)
+            self.assertLessEqual(bound, 1e-12)
+            self.assertAlmostEqual(value / expected, 1.0, delta=1e-12)
+    
+    def test_invalid(self):
+        """Test argument validation."""
+        gs = GeneralizedStirling()
+        with self.assertRaises(ValueError):
+            gs.compute_adaptive(5, 3, rtol=0.0)
+        with self.assertRaises(ValueError):
+            gs.compute(5, 3, method='recurrence', rtol=1e-12)
+
+
+class TestClassicalFamilies(unittest.TestCase):
+    """Tests for the closed-form Lah, first- and second-kind kernels."""
+    
+    def test_kernels_match_recurrence(self):
+        """Test float, log and exact kernels against the row recurrence."""
+        for alpha, beta in [(1.0, 0.0), (0.0, 1.0), (1.0, 1.0), (0.0, -0.5), (2.0, 0.0), (0.25, 0.25)]:
+            gs = GeneralizedStirling(alpha, beta)
+            self.assertIsNotNone(gs._family)
+            table = gs.triangle_array(40)
+            log_table, sign_table = gs.log_triangle(40)
+            exact = GeneralizedStirling(alpha, beta, exact=True)
+            exact_table = exact.exact_triangle(40)
+            for n in range(41):
+                for k in range(0, n + 1, 3):
+                    self.assertAlmostEqual(gs.compute(n, k), table[n, k], delta=1e-12 * abs(table[n, k]))
+                    log_value, sign = gs.compute_log(n, k)
+                    self.assertAlmostEqual(log_value, log_table[n, k], delta=1e-10)
+                    self.assertEqual(sign, sign_table[n, k])
+                    self.assertEqual(exact.compute_exact(n, k), exact_table[n, k])
+    
+    def test_large_values(self):
+        """Test values beyond the float64 range and beyond the shared table."""
+        gs = GeneralizedStirling(1.0, 1.0)
+        log_value, sign = gs.compute_log(10000, 5000)
+        expected = math.lgamma(10000) - math.lgamma(5000) - 2 * math.lgamma(5001) + math.lgamma(10001)
+        self.assertAlmostEqual(log_value / expected, 1.0, delta=1e-13)
+        self.assertEqual(gs.compute(10000, 9999), 10000 * 9999)
+        self.assertEqual(GeneralizedStirling(0.0, 1.0).compute(1000, 999), 999 * 1000 / 2)
+        first = GeneralizedStirling(1.0, 0.0)
+        self.assertAlmostEqual(first.compute(300, 299) / (300 * 299 / 2), 1.0, delta=1e-12)
+    
+    def test_closed_form_column(self):
+        """Test closed-form columns against the recurrence."""
+        for alpha, beta in [(0.0, 1.0), (1.0, 1.0), (1.0, 0.0), (0.0, 2.5)]:
+            gs = GeneralizedStirling(alpha, beta)
+            for k in [0, 3, 20]:
+                np.testing.assert_allclose(gs.column(k, 100, method='closed_form'),
+                                           gs.column(k, 100, method='recurrence'), rtol=1e-11)
+                log_values, signs = gs.column(k, 100, method='closed_form', log=True)
+                log_ref, sign_ref = gs.column(k, 100, method='recurrence', log=True)
+                np.testing.assert_allclose(log_values, log_ref, rtol=1e-12)
+                np.testing.assert_array_equal(signs, sign_ref)
+        with self.assertRaises(ValueError):
+            GeneralizedStirling(1.0, 2.0).column(3, 10, method='closed_form')
+    
+    def test_hsu_shiue_families(self):
+        """Test r-Stirling and Whitney numbers in float, log and exact flavours."""
+        self.assertEqual(r_stirling_first_kind(5, 3, 2, exact=True), 155)
+        self.assertEqual(r_stirling_first_kind(3, 0, 1, exact=True), 6)  # 1·2·3
+        self.assertEqual(whitney_first_kind(5, 3, 2, exact=True), 140)
+        self.assertEqual(whitney_first_kind(6, 3, 2, log=True)[1], -1.0)
+        for alpha, beta, r in [(-1.0, 0.0, 2.0), (0.0, 1.0, 3.0), (-2.0, 0.0, 0.0), (0.0, 0.5, 1.5), (0.3, 0.7, 1.0)]:
+            hs = HsuShiueStirling(alpha, beta, r)
+            for n, k in [(12, 0), (12, 5), (20, 19)]:
+                reference = hs.bottom_up_computation(n, k)
+                delta = 1e-12 * abs(reference)
+                self.assertAlmostEqual(hs.compute(n, k), reference, delta=delta)
+                self.assertAlmostEqual(float(hs.compute_exact(n, k)), reference, delta=delta)
+                log_value, sign = hs.compute_log(n, k)
+                self.assertAlmostEqual(sign * math.exp(log_value), reference, delta=delta)
+        self.assertEqual(r_stirling_second_kind(5, 3, 2), HsuShiueStirling(0.0, 1.0, 2.0).bottom_up_computation(5, 3))
+        self.assertEqual(whitney_second_kind(5, 3, 2.0, exact=True), 100)
+        with self.assertRaises(ValueError):
+            r_stirling_second_kind(5, 3, 2, exact=True, log=True)
+    
+    def test_second_kind_cost_guard(self):
+        """Test that costly power sums fall back to the recurrence or overflow early."""
+        gs = GeneralizedStirling(0.0, 1.0)
+        with mock.patch.object(generalized_stirling, '_family_unit',
+                               side_effect=AssertionError("power sum evaluated")):
+            # The power sum for (3000, 2900) costs more than the row recurrence
+            log_value, sign = gs.compute_log(3000, 2900)
+            self.assertEqual(sign, 1.0)
+            # S(20000, 10000) >= 10000^10000 overflows whatever the method
+            self.assertEqual(gs.compute(20000, 10000), math.inf)
+            self.assertEqual(GeneralizedStirling(0.0, -2.0).compute(1001, 10), -math.inf)
+        self.assertAlmostEqual(log_value, generalized_stirling._family_log(gs._family, 3000, 2900)[0],
+                               delta=1e-9 * log_value)
+    
+    def test_first_kind_table_bounded(self):
+        """Test that only small shifts are kept in the shared first-kind table."""
+        hs = HsuShiueStirling(-1.0, 0.0, 1000.0)
+        self.assertEqual(hs.compute_exact(3, 1), 1000 * 1001 + 1000 * 1002 + 1001 * 1002)
+        self.assertNotIn(1000, generalized_stirling._FIRST_KIND_ROWS)
+        self.assertEqual(r_stirling_first_kind(5, 3, 2, exact=True), 155)
+        self.assertIn(2, generalized_stirling._FIRST_KIND_ROWS)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -8,12 +8,21 @@ import unittest
 import sys
 import os
 import time
+import json
+import subprocess
 from pathlib import Path
 import numpy as np
 
 # Add the src directory to the path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 from generalized_stirling import GeneralizedStirling, parallel_generate_triangle, memory_efficient_iterator
+import generalized_stirling
+
+
+def setUpModule():
+    # Keep method='auto' independent of any calibration profile on this machine
+    generalized_stirling._active_profile = None
+
 
 class TestPerformance(unittest.TestCase):
     """Test performance characteristics of generalized Stirling numbers."""
@@ -30,14 +39,16 @@ class TestPerformance(unittest.TestCase):
     
     def test_caching_performance(self):
         """Test that caching improves performance for repeated calculations."""
+        # 'auto' reads Lah numbers from their closed form without the memory
+        # cache, so time the cached triangular recurrence explicitly
         # First calculation (cold cache)
         start_time = time.time()
-        result1 = self.gs.compute(20, 10)
+        result1 = self.gs.compute(20, 10, method='triangular')
         cold_time = time.time() - start_time
         
         # Second calculation (warm cache)
         start_time = time.time()
-        result2 = self.gs.compute(20, 10)
+        result2 = self.gs.compute(20, 10, method='triangular')
         warm_time = time.time() - start_time
         
         # Verify correctness
@@ -49,7 +60,7 @@ class TestPerformance(unittest.TestCase):
         
         # Check cache stats
         stats = self.gs.get_performance_stats()
-        self.assertGreater(stats['cache_hits'].get('triangular', 0), 0,
+        self.assertGreater(stats['cache_hits'].get('triangular_recurrence', 0), 0,
                          msg="No cache hits recorded")
     
     def test_bottom_up_vs_recursive(self):
@@ -81,21 +92,26 @@ class TestPerformance(unittest.TestCase):
         print(f"\nBottomUp: {bottom_up_time:.6f}s, Recursive: {recursive_time:.6f}s")
     
     def test_special_case_performance(self):
-        """Test that special case for k=1 is faster than general methods."""
+        """Test that special case for k=1 is faster than the row recurrence."""
         n = 100
         
-        # Measure time for special case
-        start_time = time.time()
-        special_result = self.gs.special_case(n)
-        special_time = time.time() - start_time
-        
-        # Measure time for triangular recurrence
-        start_time = time.time()
-        triangular_result = self.gs.triangular_recurrence(n, 1)
-        triangular_time = time.time() - start_time
+        # triangular_recurrence itself returns the special case for k=1, so
+        # time the generic row recurrence for columns 0..1 instead; the best
+        # of a few runs keeps first-call overhead out of the comparison
+        special_time = triangular_time = float('inf')
+        for _ in range(5):
+            start_time = time.perf_counter()
+            special_result = self.gs.special_case(n)
+            special_time = min(special_time, time.perf_counter() - start_time)
+            
+            start_time = time.perf_counter()
+            for _, row in generalized_stirling._iter_rows(self.gs.alpha, self.gs.beta, n, 1):
+                pass
+            triangular_result = float(row[1])
+            triangular_time = min(triangular_time, time.perf_counter() - start_time)
         
-        # Verify correctness
-        self.assertAlmostEqual(special_result, triangular_result, delta=self.tol)
+        # Verify correctness (L{100,1} = 99!, so compare relative to it)
+        self.assertAlmostEqual(special_result / triangular_result, 1.0, delta=self.tol)
         
         # Special case should be faster
         self.assertLess(special_time, triangular_time,
@@ -212,6 +228,31 @@ class TestPerformance(unittest.TestCase):
         
         # Note: Parallel might not always be faster for small triangles due to overhead
         print(f"\nSequential: {sequential_time:.6f}s, Parallel: {parallel_time:.6f}s")
+    
+    def test_import_time(self):
+        """Test that importing the package only loads NumPy and configures no logging."""
+        script = (
+            "import json, logging, sys, time\n"
+            "start = time.perf_counter()\n"
+            "import numpy\n"
+            "numpy_time = time.perf_counter() - start\n"
+            "from src import GeneralizedStirling\n"
+            "package_time = time.perf_counter() - start - numpy_time\n"
+            "heavy = [m for m in ('scipy', 'matplotlib', 'sklearn') if m in sys.modules]\n"
+            "print(json.dumps({'numpy': numpy_time, 'package': package_time, 'heavy': heavy,\n"
+            "                  'handlers': len(logging.getLogger().handlers)}))\n"
+        )
+        # Run twice so the second run reads cached bytecode
+        for _ in range(2):
+            output = subprocess.run([sys.executable, "-c", script], cwd=str(Path(__file__).parent.parent),
+                                    capture_output=True, text=True, check=True).stdout
+        timings = json.loads(output)
+        
+        self.assertEqual(timings['heavy'], [], msg="Importing the package pulled in heavy dependencies")
+        self.assertEqual(timings['handlers'], 0, msg="Importing the package configured logging")
+        self.assertLess(timings['package'], 0.5,
+                        msg=f"Package import too slow: {timings['package']:.3f}s on top of NumPy's {timings['numpy']:.3f}s")
+        print(f"\nImport time: NumPy {timings['numpy']:.3f}s, package {timings['package']:.3f}s")
 
 if __name__ == "__main__":
     unittest.main()